@@ -1,17 +1,20 @@
+import os
 import chess
-import random
+from engine import SearchEngine
+from evaluators import AdvancedEvaluator
+from move_ordering import gives_check, mvv_lva
+from opening_book import OpeningBook
 
-class AdvancedChessAI:
-    PIECE_VALUES = {
-        chess.PAWN: 100,
-        chess.KNIGHT: 320,
-        chess.BISHOP: 330,
-        chess.ROOK: 500,
-        chess.QUEEN: 900,
-        chess.KING: 20000
-    }
+class AdvancedChessAI(SearchEngine):
+    """Açılış kitaplı, gelişmiş değerlendiricili motor"""
+
+    # Bitboard maskeleri
+    CENTER_MASK = AdvancedEvaluator.CENTER_MASK
 
-    # Açılış veritabanı
+    # Varsayılan kitap dosyası (opening_book.py ile PGN arşivinden üretilir)
+    BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "book.bin")
+
+    # Kitap dosyası yoksa bu satırlardan bellekte kitap kurulur
     OPENINGS = {
         # Sicilya Savunması
         "Sicilian Defense": ["e2e4", "c7c5"],
@@ -29,293 +32,83 @@ class AdvancedChessAI:
         "Reti Opening": ["g1f3", "d7d5", "c2c4"]
     }
 
-    def __init__(self):
-        self.max_depth = 5  # Daha derin arama
-        self.opening_book = self.OPENINGS
-        self.current_opening = None
-        self.opening_moves = []
-        
-    def get_best_move(self, board):
-        """En iyi hamleyi bul"""
+    def __init__(self, workers=1, deterministic=False, book_path=None, tablebase_path=None,
+                 null_move=True, lmr=True):
+        # Seçici arama (null hamle, LMR) varsayılan olarak açıktır; karşılaştırma
+        # için kapatılabilir (engines.py'deki hard-* motorları). Kalitesi
+        # tests/test_selective_search.py konum takımında tam genişlikli aramayla sınanır
+        self.null_move = null_move
+        self.lmr = lmr
+        super().__init__(AdvancedEvaluator(), 5, workers, deterministic,
+                         tablebase_path)  # Daha derin arama
+        self.opening_book = self._load_opening_book(book_path or self.BOOK_PATH)
+        self.in_book = False
+
+    def _worker_kwargs(self):
+        return dict(super()._worker_kwargs(), null_move=self.null_move, lmr=self.lmr)
+
+    def _load_opening_book(self, path):
+        """Kitap dosyasını aç; yoksa veya açılamazsa yerleşik açılışları kullan"""
+        if os.path.exists(path):
+            try:
+                return OpeningBook.open(path)
+            except (OSError, ValueError):
+                pass
+        return OpeningBook.from_lines(self.OPENINGS.values())
+
+    def get_best_move(self, board, time_limit=None, max_depth=None, clock=None):
+        """En iyi hamleyi bul
+
+        time_limit (saniye) verilirse arama derinleştirilirken süre dolunca
+        tamamlanan en derin iterasyonun hamlesi döner.
+        """
         # Açılış kitaplığından hamle kontrolü
         opening_move = self._get_opening_move(board)
         if opening_move:
             return opening_move
             
-        return self._get_calculated_move(board)
+        return self._get_calculated_move(board, time_limit, max_depth, clock)
+
+    def ponder_move(self, board):
+        """Açılış kitaplığı sürerken önceden düşünmeye gerek yok"""
+        if self.in_book:
+            return None
+        return super().ponder_move(board)
 
     def _get_opening_move(self, board):
-        """Açılış kitaplığından hamle seç"""
-        board_moves = [move.uci() for move in board.move_stack]
-        
-        # Eğer henüz bir açılış seçilmediyse ve oyun başındaysa
-        if not self.current_opening and len(board_moves) < 2:
-            self.current_opening = random.choice(list(self.OPENINGS.keys()))
-            self.opening_moves = self.OPENINGS[self.current_opening].copy()
-        
-        # Eğer açılış devam ediyorsa
-        if self.current_opening and self.opening_moves:
-            next_move = self.opening_moves[0]
-            # Hamlenin legal olduğundan emin ol
-            try:
-                move = chess.Move.from_uci(next_move)
-                if move in board.legal_moves:
-                    self.opening_moves.pop(0)
-                    return move
-            except:
-                pass
-            
-        # Açılış bitmiş veya uygulanamamış
-        self.current_opening = None
-        self.opening_moves = []
-        return None
+        """Açılış kitabından ağırlıklı rastgele hamle seç (pozisyon anahtarıyla)"""
+        move = self.opening_book.choose(board)
+        self.in_book = move is not None
+        return move
 
-    def _get_calculated_move(self, board):
-        """Minimax algoritması ile en iyi hamleyi hesapla"""
-        best_move = None
-        best_value = float('-inf')
-        alpha = float('-inf')
-        beta = float('inf')
-        
-        legal_moves = list(board.legal_moves)
-        # Hamleleri merkez kontrolü ve materyal değerine göre sırala
-        legal_moves.sort(key=lambda move: self._move_sorting_value(board, move), reverse=True)
-        
-        for move in legal_moves:
-            board.push(move)
-            value = -self._minimax(board, self.max_depth - 1, -beta, -alpha, False)
-            board.pop()
-            
-            if value > best_value:
-                best_value = value
-                best_move = move
-            alpha = max(alpha, value)
-            
-        return best_move
+    def close(self):
+        """Paralel işçileri ve kitap dosyasını kapat"""
+        super().close()
+        self.opening_book.close()
+
+    def _order_root_moves(self, board, first_move=None):
+        """Hamleleri almalar, şah çeken hamleler ve merkez kontrolüne göre sırala"""
+        legal_moves = sorted(self.move_orderer.order(board),
+                             key=lambda move: self._move_sorting_value(board, move), reverse=True)
+        # Önceki iterasyonun en iyi hamlesi ilk denenir
+        if first_move in legal_moves:
+            legal_moves = [first_move] + [m for m in legal_moves if m != first_move]
+        return legal_moves
 
     def _move_sorting_value(self, board, move):
-        """Hamleleri sıralamak için değer hesapla"""
+        """Kök hamleleri sıralamak için değer hesapla"""
         value = 0
         
-        # Taş değeri
+        # Taş değeri (MVV-LVA ile)
         if board.is_capture(move):
-            value += 10000
+            value += 10000 + mvv_lva(board, move)
             
         # Merkez kontrolü
-        to_square = move.to_square
-        if to_square in [27, 28, 35, 36]:  # e4, d4, e5, d5
+        if chess.BB_SQUARES[move.to_square] & self.CENTER_MASK:
             value += 1000
             
-        # Şah çekme
-        board.push(move)
-        if board.is_check():
+        # Şah çekme (hamle yapılmadan kontrol edilir)
+        if gives_check(board, move):
             value += 5000
-        board.pop()
-        
-        return value
-
-    def _minimax(self, board, depth, alpha, beta, maximizing_player):
-        """Gelişmiş minimax algoritması"""
-        # Geçmiş beta kesme sayısı
-        if depth == 0 or board.is_game_over():
-            return self._evaluate_position(board)
-            
-        if maximizing_player:
-            value = float('-inf')
-            for move in board.legal_moves:
-                board.push(move)
-                value = max(value, self._minimax(board, depth - 1, alpha, beta, False))
-                board.pop()
-                alpha = max(alpha, value)
-                if alpha >= beta:
-                    break  # Beta kesme
-            return value
-        else:
-            value = float('inf')
-            for move in board.legal_moves:
-                board.push(move)
-                value = min(value, self._minimax(board, depth - 1, alpha, beta, True))
-                board.pop()
-                beta = min(beta, value)
-                if alpha >= beta:
-                    break  # Alpha kesme
-            return value
-
-    def _evaluate_position(self, board):
-        """Gelişmiş pozisyon değerlendirmesi"""
-        if board.is_checkmate():
-            return -20000 if board.turn else 20000
-        if board.is_stalemate() or board.is_insufficient_material():
-            return 0
-            
-        value = 0
-        
-        # Materyal değerlendirmesi
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece is not None:
-                piece_value = self.PIECE_VALUES[piece.piece_type]
-                if piece.color:
-                    value += piece_value
-                else:
-                    value -= piece_value
-        
-        # Merkez kontrolü (daha yüksek ağırlık)
-        central_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-        for square in central_squares:
-            if board.piece_at(square) is not None:
-                if board.piece_at(square).color:
-                    value += 30
-                else:
-                    value -= 30
-        
-        # Piyon yapısı değerlendirmesi
-        value += self._evaluate_pawn_structure(board)
-        
-        # Hareket özgürlüğü
-        mobility = len(list(board.legal_moves))
-        value += mobility * 0.1
-        
-        # Kale açık hatta mı?
-        value += self._evaluate_rook_position(board)
-        
-        # Şah güvenliği
-        value += self._evaluate_king_safety(board)
-        
-        return value if board.turn else -value
-
-    def _evaluate_pawn_structure(self, board):
-        """Piyon yapısını değerlendir"""
-        value = 0
-        
-        # İzole piyonları cezalandır
-        for file in range(8):
-            white_pawns = 0
-            black_pawns = 0
-            for rank in range(8):
-                square = rank * 8 + file
-                piece = board.piece_at(square)
-                if piece and piece.piece_type == chess.PAWN:
-                    if piece.color:
-                        white_pawns += 1
-                    else:
-                        black_pawns += 1
-            
-            # İzole piyonları kontrol et
-            if file > 0 and file < 7:
-                if white_pawns > 0 and not any(board.piece_at(square) and 
-                    board.piece_at(square).piece_type == chess.PAWN and 
-                    board.piece_at(square).color 
-                    for square in [(rank * 8 + file - 1) for rank in range(8)] + 
-                    [(rank * 8 + file + 1) for rank in range(8)]):
-                    value -= 20  # İzole piyon cezası
-                    
-                if black_pawns > 0 and not any(board.piece_at(square) and 
-                    board.piece_at(square).piece_type == chess.PAWN and 
-                    not board.piece_at(square).color 
-                    for square in [(rank * 8 + file - 1) for rank in range(8)] + 
-                    [(rank * 8 + file + 1) for rank in range(8)]):
-                    value += 20  # İzole piyon cezası
-        
-        return value
-
-    def _evaluate_rook_position(self, board):
-        """Kalelerin pozisyonunu değerlendir"""
-        value = 0
-        
-        # Açık hatları kontrol et
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.ROOK:
-                file = square % 8
-                # Dosyada piyon var mı kontrol et
-                pawns_in_file = 0
-                for rank in range(8):
-                    check_square = rank * 8 + file
-                    check_piece = board.piece_at(check_square)
-                    if check_piece and check_piece.piece_type == chess.PAWN:
-                        pawns_in_file += 1
-                
-                if pawns_in_file == 0:  # Açık hat
-                    if piece.color:
-                        value += 30
-                    else:
-                        value -= 30
-                    
-        return value
-
-    def _evaluate_king_safety(self, board):
-        """Şah güvenliğini değerlendir"""
-        value = 0
-        
-        # Her iki taraf için şah konumunu bul
-        white_king_square = board.king(chess.WHITE)
-        black_king_square = board.king(chess.BLACK)
-        
-        if white_king_square is not None:
-            # Beyaz şah için güvenlik değerlendirmesi
-            if self._is_endgame(board):
-                value += self._king_endgame_position_value(white_king_square, True)
-            else:
-                value += self._king_safety_value(board, white_king_square, True)
-        
-        if black_king_square is not None:
-            # Siyah şah için güvenlik değerlendirmesi
-            if self._is_endgame(board):
-                value -= self._king_endgame_position_value(black_king_square, False)
-            else:
-                value -= self._king_safety_value(board, black_king_square, False)
         
         return value
-
-    def _is_endgame(self, board):
-        """Oyunun son aşamada olup olmadığını kontrol et"""
-        # Vezirler yoksa veya her iki tarafın toplam materyal değeri düşükse son aşama
-        white_material = sum(len(board.pieces(piece_type, chess.WHITE)) * value 
-                           for piece_type, value in self.PIECE_VALUES.items() 
-                           if piece_type != chess.KING)
-        black_material = sum(len(board.pieces(piece_type, chess.BLACK)) * value 
-                           for piece_type, value in self.PIECE_VALUES.items() 
-                           if piece_type != chess.KING)
-        
-        return white_material < 1500 and black_material < 1500
-
-    def _king_safety_value(self, board, king_square, is_white):
-        """Şah güvenlik değeri hesapla"""
-        value = 0
-        file = king_square % 8
-        rank = king_square // 8
-        
-        # Rok yapılmış mı kontrol et
-        if is_white and rank == 0 and (file == 6 or file == 2):
-            value += 100  # Rok bonusu
-        elif not is_white and rank == 7 and (file == 6 or file == 2):
-            value += 100  # Rok bonusu
-            
-        # Şahın etrafındaki kareleri kontrol et
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                    
-                new_file = file + dx
-                new_rank = rank + dy
-                
-                if 0 <= new_file < 8 and 0 <= new_rank < 8:
-                    square = new_rank * 8 + new_file
-                    piece = board.piece_at(square)
-                    if piece and piece.color == is_white:
-                        value += 10  # Koruyucu taş bonusu
-                        
-        return value
-
-    def _king_endgame_position_value(self, king_square, is_white):
-        """Son aşamada şah pozisyon değeri"""
-        file = king_square % 8
-        rank = king_square // 8
-        
-        # Son aşamada şah merkeze yakın olmalı
-        file_distance_from_center = abs(3.5 - file)
-        rank_distance_from_center = abs(3.5 - rank)
-        
-        return -(file_distance_from_center + rank_distance_from_center) * 10
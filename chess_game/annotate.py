@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import chess
+import chess.pgn
+
+from engines import create_engine
+from game_archive import read_games
+from move_ordering import MoveOrderer
+
+# Arayüz (tkinter/PIL) yüklenmez; ekransız sunucularda çalışır
+
+# Aramalı motorlar (kolay seviye rastgele oynar)
+ANNOTATION_ENGINES = ("medium", "hard", "threat")
+
+# İşçi süreçte bir kez oluşturulan motor
+_engine = None
+
+
+def _init_worker(engine_name):
+    global _engine
+    _engine = create_engine(engine_name)
+
+
+def analyse_position(fen, depth=None, time_limit=None):
+    """Pozisyonu ara; (beyaz açısından skor metni, en iyi hamle UCI) döndür
+
+    Skor %eval biçimindedir: piyon cinsinden ("0.35") veya bulunan mat ("#3").
+    Oyun bitmişse en iyi hamle, mat pozisyonunda skor da None'dır.
+    """
+    board = chess.Board(fen)
+    if board.is_checkmate():
+        return None, None
+    if board.is_game_over():
+        return "0.00", None
+    # Her pozisyon temiz tablolarla aranır; sonuç, pozisyonun hangi işçiye
+    # düştüğünden bağımsızdır ve devam eden çalıştırmalar aynı çıktıyı verir
+    _engine.transposition_table.clear()
+    _engine.move_orderer = MoveOrderer()
+    # Açılış kitabı atlanır, doğrudan arama yapılır
+    move = _engine._get_calculated_move(board, time_limit=time_limit, max_depth=depth)
+    iterations = _engine.stats.iterations
+    if not iterations:
+        # Tablodan seçilen hamlelerde arama yapılmaz
+        return None, move.uci() if move else None
+    score = iterations[-1]["score"]
+    pv = iterations[-1]["pv"]
+    if board.turn == chess.BLACK:
+        score = -score
+    if abs(score) >= _engine.evaluator.MATE_SCORE:
+        moves = (len(pv) + 1) // 2
+        return (f"#{moves}" if score > 0 else f"#-{moves}"), move.uci()
+    return f"{score / 100:.2f}", move.uci() if move else None
+
+
+def iter_games(paths, skip=0):
+    """PGN veya oyun arşivi (.cga) dosyalarındaki oyunları sırayla üret; ilk skip oyunu atla"""
+    for path in paths:
+        if path.endswith(".cga"):
+            for archived in read_games(path):
+                if skip:
+                    skip -= 1
+                    continue
+                yield archived.to_pgn()
+            continue
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            while skip:
+                if not chess.pgn.skip_game(handle):
+                    break
+                skip -= 1
+            while True:
+                game = chess.pgn.read_game(handle)
+                if game is None:
+                    break
+                yield game
+
+
+def apply_annotations(game, results, annotator):
+    """Her hamleye sonraki pozisyonun skorunu ve oynanandan farklıysa en iyi hamleyi ekle"""
+    board = game.board()
+    for ply, node in enumerate(game.mainline()):
+        best_uci = results[ply][1]
+        score = results[ply + 1][0]
+        notes = []
+        if score is not None:
+            notes.append(f"[%eval {score}]")
+        if best_uci is not None and best_uci != node.move.uci():
+            notes.append(f"en iyi: {board.san(chess.Move.from_uci(best_uci))}")
+        board.push(node.move)
+        if notes:
+            node.comment = " ".join(([node.comment] if node.comment else []) + notes)
+    game.headers["Annotator"] = annotator
+
+
+class Progress:
+    """Çıktı dosyasının yanında tutulan ilerleme kaydı (kaldığı yerden devam için)"""
+
+    def __init__(self, output_path):
+        self.path = output_path + ".progress"
+
+    def load(self):
+        """(yazılmış oyun sayısı, çıktıdaki geçerli bayt sayısı)"""
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                state = json.load(handle)
+            return state["games"], state["offset"]
+        except (OSError, ValueError, KeyError):
+            return 0, 0
+
+    def save(self, games, offset):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump({"games": games, "offset": offset}, handle)
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def annotate(input_paths, output_path, engine="hard", depth=None, time_limit=None,
+             workers=None, window=None, resume=True, report_every=10):
+    """Oyunları süreç havuzunda analiz edip açıklamalı PGN'i sırasıyla yaz
+
+    Aynı anda en fazla window oyun bellekte tutulur. Her oyundan sonra
+    ilerleme kaydedilir; kesilen çalıştırma aynı komutla kaldığı yerden
+    sürer. (oyun sayısı, pozisyon sayısı) döndürür.
+    """
+    if depth is None and time_limit is None:
+        depth = 3
+    workers = workers or os.cpu_count()
+    window = window or 2 * workers
+    annotator = f"{engine} " + (f"depth {depth}" if depth else f"{time_limit}s")
+
+    progress = Progress(output_path)
+    done, offset = progress.load() if resume else (0, 0)
+    if done and os.path.exists(output_path):
+        # Son kayıttan sonra yarıda kalan yazımı at
+        with open(output_path, "r+b") as handle:
+            handle.truncate(offset)
+        print(f"{done} oyun zaten yazılmış, kaldığı yerden devam ediliyor")
+    else:
+        done = 0
+        open(output_path, "w").close()
+
+    games = positions = 0
+    start = time.perf_counter()
+    pending = deque()
+    game_iter = iter_games(input_paths, skip=done)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(engine,)) as pool, \
+            open(output_path, "ab") as handle:
+        exhausted = False
+        while pending or not exhausted:
+            # Pencere dolana kadar yeni oyunların pozisyonlarını gönder
+            while not exhausted and len(pending) < window:
+                game = next(game_iter, None)
+                if game is None:
+                    exhausted = True
+                    break
+                board = game.board()
+                fens = [board.fen()]
+                for move in game.mainline_moves():
+                    board.push(move)
+                    fens.append(board.fen())
+                futures = [pool.submit(analyse_position, fen, depth, time_limit) for fen in fens]
+                pending.append((game, futures))
+            if not pending:
+                break
+
+            # En eski oyun bitince sırasıyla yaz
+            game, futures = pending.popleft()
+            wait(futures)
+            apply_annotations(game, [future.result() for future in futures], annotator)
+            handle.write((str(game) + "\n\n").encode("utf-8"))
+            handle.flush()
+            games += 1
+            positions += len(futures)
+            progress.save(done + games, handle.tell())
+
+            if games % report_every == 0:
+                elapsed = time.perf_counter() - start
+                print(f"{done + games} oyun, {positions / elapsed:,.1f} pozisyon/sn, "
+                      f"{games / elapsed * 3600:,.0f} oyun/saat")
+
+    elapsed = time.perf_counter() - start
+    progress.clear()
+    print(f"Bitti: {done + games} oyun ({games} bu çalıştırmada), {positions} pozisyon, "
+          f"{elapsed:.1f} sn ({positions / max(elapsed, 1e-9):,.1f} pozisyon/sn)")
+    return games, positions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PGN oyunlarına motor değerlendirmesi ekle")
+    parser.add_argument("inputs", nargs="+", help="PGN veya .cga dosyaları")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("-e", "--engine", default="hard", choices=ANNOTATION_ENGINES)
+    parser.add_argument("-d", "--depth", type=int, default=None)
+    parser.add_argument("-t", "--time", type=float, default=None,
+                        help="pozisyon başına süre (saniye)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--window", type=int, default=None,
+                        help="aynı anda işlenen en fazla oyun")
+    parser.add_argument("--restart", action="store_true",
+                        help="ilerleme kaydını yok say, baştan başla")
+    args = parser.parse_args()
+    annotate(args.inputs, args.output, args.engine, args.depth, args.time, args.workers,
+             args.window, resume=not args.restart)
@@ -0,0 +1,356 @@
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import chess
+
+from advanced_ai import AdvancedChessAI
+from chess_ai import ChessAI
+from engines import create_engine, AI_TIME_LIMIT, DIFFICULTIES
+from search import SearchClock
+from threat_ai import ThreatChessAI
+
+# Ölçümlerde kullanılan sabit pozisyonlar
+BENCH_POSITIONS = {
+    "opening": chess.STARTING_FEN,
+    "italian": "r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+    "middlegame": "r2q1rk1/pp2bppp/2n1pn2/2pp4/3P1B2/2PBPN2/PP1N1PPP/R2QK2R w KQ - 0 9",
+    "tactical": "r1b1k2r/ppppnppp/2n2q2/2b5/3NP3/2P1B3/PP3PPP/RN1QKB1R w KQkq - 1 7",
+    "endgame": "8/5pk1/6p1/3R4/5P2/1r4P1/6K1/8 w - - 0 40",
+}
+
+
+def _rate(func, boards, min_time):
+    """Fonksiyonu tahtalar üzerinde çalıştırıp saniyedeki çağrı sayısını ölç"""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        for board in boards:
+            func(board)
+        calls += len(boards)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+
+
+def bench_eval(min_time=1.0):
+    """Değerlendirme fonksiyonlarının saniyedeki çağrı sayısını raporla"""
+    boards = [chess.Board(fen) for fen in BENCH_POSITIONS.values()]
+    advanced = AdvancedChessAI()
+    basic = ChessAI("medium")
+    threat = ThreatChessAI()
+
+    def positional_terms(board):
+        advanced.evaluator._evaluate_pawn_structure(board)
+        advanced.evaluator._evaluate_rook_position(board)
+        advanced.evaluator._evaluate_king_safety(board)
+
+    try:
+        results = {
+            "ChessAI._evaluate_position": _rate(basic._evaluate_position, boards, min_time),
+            "AdvancedChessAI._evaluate_position": _rate(advanced._evaluate_position, boards,
+                                                        min_time),
+            "AdvancedChessAI positional terms": _rate(positional_terms, boards, min_time),
+            "ThreatChessAI._evaluate_position": _rate(threat._evaluate_position, boards, min_time),
+        }
+    finally:
+        for engine in (advanced, basic, threat):
+            engine.close()
+    for name, rate in results.items():
+        print(f"{name:<40} {rate:>12,.0f} eval/s")
+    return results
+
+
+# Arama karşılaştırmasındaki motorlar: (ad, oluşturucu, derinlik farkı).
+# ChessAI zor seviyesi ortadan bir kat daha derin arar; "AdvancedChessAI full"
+# null hamle ve LMR kapalı haliyle düğüm karşılaştırması içindir; ThreatChessAI
+# arayüzün eski yerleşik minimax'ıdır.
+SEARCH_ENGINES = [
+    ("ChessAI medium", lambda: ChessAI("medium"), 0),
+    ("ChessAI hard", lambda: ChessAI("hard"), 1),
+    ("AdvancedChessAI", AdvancedChessAI, 0),
+    ("AdvancedChessAI full",
+     lambda: AdvancedChessAI(null_move=False, lmr=False), 0),
+    ("ThreatChessAI", ThreatChessAI, 0),
+]
+
+
+def bench_search(depth=3, repeat=1):
+    """Motorları sabit derinlikte çalıştırıp düğüm, hız ve derinliğe ulaşma süresini raporla
+
+    Açılış kitabı atlanır (doğrudan arama çağrılır). Her arama repeat kez boş
+    motorla tekrarlanır ve en kısa süre alınır. Sonuçlar "motor/pozisyon"
+    anahtarlı sözlüktür.
+    """
+    results = {}
+    for engine_name, factory, depth_offset in SEARCH_ENGINES:
+        for position_name, fen in BENCH_POSITIONS.items():
+            elapsed = None
+            for _ in range(repeat):
+                engine = factory()
+                board = chess.Board(fen)
+                try:
+                    start = time.perf_counter()
+                    move = engine._get_calculated_move(board, max_depth=depth + depth_offset)
+                    run_time = time.perf_counter() - start
+                finally:
+                    # Havuz ve tablo dosyaları açık kalmasın; sayaçlar okunabilir kalır
+                    engine.close()
+                elapsed = run_time if elapsed is None else min(elapsed, run_time)
+            clock = engine.clock
+            nodes = clock.nodes + clock.qnodes
+            entry = {
+                "move": move.uci() if move else None,
+                "depth": engine.completed_depth,
+                "nodes": nodes,
+                "search_nodes": clock.nodes,
+                "qnodes": clock.qnodes,
+                "time_to_depth": elapsed,
+                "nps": nodes / elapsed if elapsed else 0.0,
+                "evals": engine.stats.evals,
+                "first_move_cutoff_rate": engine.stats.first_move_cutoff_rate(),
+                "branching_factors": engine.stats.branching_factors(),
+            }
+            results[f"{engine_name}/{position_name}"] = entry
+            print(f"{engine_name:<16} {position_name:<11} {move} depth={entry['depth']} "
+                  f"nodes={nodes:<8} nps={entry['nps']:>8,.0f} {elapsed:6.2f}s")
+    return results
+
+
+def run_suite(depth=3, min_time=1.0, path=None, repeat=3):
+    """Değerlendirme ve arama ölçümlerini çalıştır, istenirse JSON'a yaz"""
+    results = {
+        "meta": {
+            "depth": depth,
+            "repeat": repeat,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "chess": chess.__version__,
+            "machine": platform.machine(),
+        },
+        "eval": bench_eval(min_time),
+        "search": bench_search(depth, repeat),
+    }
+    if path:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"Sonuçlar yazıldı: {path}")
+    return results
+
+
+# Bundan kısa aramaların süresi karşılaştırmada kullanılmaz (ölçüm gürültüsü)
+MIN_COMPARE_TIME = 0.05
+
+
+def compare(old_path, new_path, threshold=0.10):
+    """İki JSON sonucunu karşılaştır; eşikten fazla kötüleşmeleri listele
+
+    Değerlendirme hızı ve nps düşüşü, derinliğe ulaşma süresi ve düğüm
+    sayısı artışı gerileme sayılır; çok kısa aramaların süreleri atlanır.
+    En iyi hamle değişiklikleri ayrıca bildirilir.
+    """
+    with open(old_path, encoding="utf-8") as handle:
+        old = json.load(handle)
+    with open(new_path, encoding="utf-8") as handle:
+        new = json.load(handle)
+
+    regressions = []
+
+    def check(name, metric, before, after, higher_is_better):
+        if not before:
+            return
+        change = (after - before) / before
+        worse = -change if higher_is_better else change
+        flag = "GERİLEME" if worse > threshold else ""
+        print(f"{name:<40} {metric:<14} {before:>12,.2f} -> {after:>12,.2f} {change:+7.1%} {flag}")
+        if flag:
+            regressions.append((name, metric, change))
+
+    for name, before in old.get("eval", {}).items():
+        if name in new.get("eval", {}):
+            check(name, "eval/s", before, new["eval"][name], True)
+    for name, before in old.get("search", {}).items():
+        after = new.get("search", {}).get(name)
+        if after is None:
+            continue
+        if min(before["time_to_depth"], after["time_to_depth"]) >= MIN_COMPARE_TIME:
+            check(name, "nps", before["nps"], after["nps"], True)
+            check(name, "time_to_depth", before["time_to_depth"], after["time_to_depth"], False)
+        check(name, "nodes", before["nodes"], after["nodes"], False)
+        if before["move"] != after["move"]:
+            print(f"{name:<40} en iyi hamle değişti: {before['move']} -> {after['move']}")
+
+    print(f"{len(regressions)} gerileme (eşik %{threshold * 100:.0f})")
+    return regressions
+
+
+def bench_parallel(depth=4, worker_counts=(1, 2, 4, 8, 16)):
+    """AdvancedChessAI paralel aramasının ölçeklenme raporu"""
+    serial_moves = {}
+    results = {}
+    for workers in worker_counts:
+        total_nodes = 0
+        total_time = 0.0
+        same_move = True
+        for position_name, fen in BENCH_POSITIONS.items():
+            engine = AdvancedChessAI(workers=workers, deterministic=True)
+            board = chess.Board(fen)
+            try:
+                start = time.perf_counter()
+                move = engine._get_calculated_move(board, max_depth=depth)
+                total_time += time.perf_counter() - start
+            finally:
+                engine.close()
+            total_nodes += engine.clock.nodes + engine.clock.qnodes
+            if workers == worker_counts[0]:
+                serial_moves[position_name] = move
+            elif serial_moves.get(position_name) != move:
+                same_move = False
+        results[workers] = {
+            "nodes": total_nodes,
+            "nps": total_nodes / total_time,
+            "time_to_depth": total_time,
+            "same_move": same_move,
+        }
+        print(f"workers={workers:<3} depth={depth} nodes={total_nodes:<8} "
+              f"nps={total_nodes / total_time:>9,.0f} time={total_time:7.2f}s "
+              f"same_move={same_move}")
+    return results
+
+
+def bench_profile(depth=4):
+    """Profil açıkken her iterasyonu ve aramanın süre dağılımını raporla"""
+    def report(info):
+        pv = " ".join(move.uci() for move in info["pv"])
+        print(f"  depth={info['depth']} score={info['score']:.0f} nodes={info['nodes']:<8} "
+              f"time={info['time']:6.2f}s pv={pv}")
+
+    results = {}
+    for engine_name, factory, depth_offset in SEARCH_ENGINES:
+        for position_name, fen in BENCH_POSITIONS.items():
+            engine = factory()
+            engine.profile = True
+            engine.on_iteration = report
+            print(f"{engine_name} / {position_name}")
+            try:
+                engine._get_calculated_move(chess.Board(fen), max_depth=depth + depth_offset)
+            finally:
+                engine.close()
+            stats = engine.stats
+            elapsed = engine.clock.elapsed()
+            print(f"  evals={stats.evals} cutoffs={stats.cutoffs} "
+                  f"first_move={stats.first_move_cutoff_rate():.0%} "
+                  f"null={stats.null_cutoffs}/{stats.null_moves} "
+                  f"lmr_researches={stats.researches}/{stats.reductions} "
+                  f"branching={' '.join(f'{factor:.1f}' for factor in stats.branching_factors())}")
+            print(f"  eval={stats.eval_time:.2f}s ({stats.eval_time / elapsed:.0%}) "
+                  f"movegen={stats.movegen_time:.2f}s ({stats.movegen_time / elapsed:.0%})")
+            results[f"{engine_name}/{position_name}"] = stats.as_dict()
+    return results
+
+
+def bench_gui(time_limit=AI_TIME_LIMIT):
+    """Her zorluk seviyesinde arayüzün yaptığı çağrıyla hamle gecikmesini ölç
+
+    Arayüz arka plan iş parçacığında get_best_move'u kendi saatiyle çağırır;
+    burada aynı çağrı aynı süre sınırıyla yapılır.
+    """
+    results = {}
+    for difficulty in DIFFICULTIES:
+        latencies = []
+        for position_name, fen in BENCH_POSITIONS.items():
+            engine = create_engine(difficulty)
+            board = chess.Board(fen)
+            clock = SearchClock(time_limit)
+            try:
+                start = time.perf_counter()
+                move = engine.get_best_move(board, time_limit=time_limit, clock=clock)
+                elapsed = time.perf_counter() - start
+            finally:
+                engine.close()
+            latencies.append(elapsed)
+            results[(difficulty, position_name)] = {
+                "move": move.uci() if move else None,
+                "depth": engine.completed_depth,
+                "nodes": clock.nodes,
+                "time": elapsed,
+            }
+            print(f"{difficulty:<7} {position_name:<11} {move} depth={engine.completed_depth} "
+                  f"nodes={clock.nodes:<7} {elapsed:6.2f}s")
+        print(f"{difficulty:<7} mean={sum(latencies) / len(latencies):6.2f}s "
+              f"max={max(latencies):6.2f}s")
+    return results
+
+
+def bench_sprites(size=50, resized=80):
+    """Taş görüntülerinin soğuk (önbelleksiz) ve sıcak (atlas diskte) yüklenme süresi
+
+    Tk penceresi gerektirmemesi için PIL görüntüleri ölçülür; karşılaştırma
+    için eski yöntem (her başlangıçta 12 PNG'yi açıp yeniden boyutlandırma)
+    de ölçülür.
+    """
+    # Arayüz modülleri yalnızca bu ölçümde gerekir
+    from PIL import Image
+    from piece_loader import PieceLoader, PIECE_CODES
+
+    def load_all(loader, piece_size):
+        for code in PIECE_CODES:
+            loader.get_sprite(code, piece_size)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        loader = PieceLoader(size, cache_dir=cache_dir)
+        load_all(loader, size)
+        results["cold"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        load_all(PieceLoader(size, cache_dir=cache_dir), size)
+        results["warm"] = time.perf_counter() - start
+
+        # Aynı yükleyiciyle yeni boyut: kaynaklar yeniden çözülmez
+        start = time.perf_counter()
+        load_all(loader, resized)
+        results["resize"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for code, image_path in PieceLoader(size, cache_dir=cache_dir).paths.items():
+            with Image.open(image_path) as img:
+                img.resize((size, size), Image.Resampling.LANCZOS)
+        results["uncached"] = time.perf_counter() - start
+        results["cache_files"] = sorted(os.listdir(cache_dir))
+
+    for name in ("uncached", "cold", "warm", "resize"):
+        print(f"{name:<9} {results[name] * 1000:7.2f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    # Kullanım:
+    #   python bench.py [saniye]                       değerlendirme hızı
+    #   python bench.py search [derinlik]              arama
+    #   python bench.py suite [derinlik] [sonuç.json]  hepsi, JSON çıktısıyla
+    #   python bench.py compare eski.json yeni.json [eşik]
+    #   python bench.py parallel [derinlik] | gui [saniye] | profile [derinlik] | sprites
+    if len(sys.argv) > 1 and sys.argv[1] == "suite":
+        run_suite(int(sys.argv[2]) if len(sys.argv) > 2 else 3,
+                  path=sys.argv[3] if len(sys.argv) > 3 else None)
+    elif len(sys.argv) > 1 and sys.argv[1] == "compare":
+        found = compare(sys.argv[2], sys.argv[3],
+                        float(sys.argv[4]) if len(sys.argv) > 4 else 0.10)
+        sys.exit(1 if found else 0)
+    elif len(sys.argv) > 1 and sys.argv[1] == "search":
+        bench_search(int(sys.argv[2]) if len(sys.argv) > 2 else 3)
+    elif len(sys.argv) > 1 and sys.argv[1] == "parallel":
+        bench_parallel(int(sys.argv[2]) if len(sys.argv) > 2 else 4)
+    elif len(sys.argv) > 1 and sys.argv[1] == "profile":
+        bench_profile(int(sys.argv[2]) if len(sys.argv) > 2 else 4)
+    elif len(sys.argv) > 1 and sys.argv[1] == "sprites":
+        bench_sprites()
+    elif len(sys.argv) > 1 and sys.argv[1] == "gui":
+        bench_gui(float(sys.argv[2]) if len(sys.argv) > 2 else AI_TIME_LIMIT)
+    else:
+        bench_eval(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0)
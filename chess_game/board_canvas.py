@@ -0,0 +1,148 @@
+import tkinter as tk
+
+import chess
+
+# Tahta renkleri
+LIGHT_COLOR = "#ecf0f1"
+DARK_COLOR = "#34495e"
+SELECTED_COLOR = "#27ae60"
+CAPTURE_COLOR = "#e74c3c"
+HINT_COLOR = "#3498db"
+
+# Olası hamle göstergesinin çapı (piksel)
+HINT_SIZE = 12
+
+# Karenin olası hamle durumu
+NO_HINT = 0
+MOVE_HINT = 1
+CAPTURE_HINT = 2
+
+
+class BoardCanvas:
+    """Tahtayı tek bir tk.Canvas üzerinde çizen görünüm
+
+    Her kare için arka plan, seçim çerçevesi, hamle göstergesi ve taş
+    görüntüsü öğeleri bir kez oluşturulur. render() her karenin çizilen
+    durumunu saklar ve yalnızca değişen karelerin öğelerini günceller;
+    widget oluşturulmaz ve yok edilmez.
+    """
+
+    def __init__(self, master, pieces, square_size=60, on_press=None, on_motion=None,
+                 on_release=None):
+        self.pieces = pieces
+        self.square_size = square_size
+        self.canvas = tk.Canvas(master, width=8 * square_size, height=8 * square_size,
+                                highlightthickness=0, bd=0)
+        self.backgrounds = [None] * 64
+        self.frames = [None] * 64
+        self.hints = [None] * 64
+        self.images = [None] * 64
+        # Karelerin son çizilen durumu: (taş kodu, seçili mi, gösterge)
+        self.drawn = [None] * 64
+        self.drag_item = None
+        self._create_items()
+        self._bind(on_press, on_motion, on_release)
+
+    def _create_items(self):
+        """Karelerin kalıcı öğelerini oluştur"""
+        size = self.square_size
+        offset = (size - HINT_SIZE) // 2
+        for square in chess.SQUARES:
+            row, col = self.square_to_cell(square)
+            x, y = col * size, row * size
+            self.backgrounds[square] = self.canvas.create_rectangle(
+                x, y, x + size, y + size, fill=self.base_color(square), width=0)
+            self.hints[square] = self.canvas.create_oval(
+                x + offset, y + offset, x + offset + HINT_SIZE, y + offset + HINT_SIZE,
+                fill=HINT_COLOR, outline=LIGHT_COLOR, width=1, state="hidden")
+            self.images[square] = self.canvas.create_image(
+                x + size // 2, y + size // 2, anchor="center", state="hidden")
+            self.frames[square] = self.canvas.create_rectangle(
+                x + 1, y + 1, x + size - 1, y + size - 1, outline=SELECTED_COLOR, width=2,
+                state="hidden")
+        self.drag_item = self.canvas.create_image(0, 0, anchor="center", state="hidden")
+
+    def _bind(self, on_press, on_motion, on_release):
+        """Fare olaylarını (olay, satır, sütun) imzasıyla ilet"""
+        for sequence, handler in (("<Button-1>", on_press), ("<B1-Motion>", on_motion),
+                                  ("<ButtonRelease-1>", on_release)):
+            if handler is not None:
+                self.canvas.bind(sequence, lambda event, handler=handler:
+                                 handler(event, *self.event_cell(event)))
+
+    def event_cell(self, event):
+        """Olayın koordinatlarını tahta içinde kalan (satır, sütun) olarak döndür"""
+        row = min(7, max(0, event.y // self.square_size))
+        col = min(7, max(0, event.x // self.square_size))
+        return row, col
+
+    @staticmethod
+    def square_to_cell(square):
+        """Kareyi ekrandaki (satır, sütun) konumuna çevir; beyaz altta"""
+        return 7 - chess.square_rank(square), chess.square_file(square)
+
+    @staticmethod
+    def base_color(square):
+        """Karenin açık/koyu rengi"""
+        row, col = BoardCanvas.square_to_cell(square)
+        return LIGHT_COLOR if (row + col) % 2 == 0 else DARK_COLOR
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    def render(self, board, selected_square=None, possible_moves=()):
+        """Tahtayı çiz; yalnızca durumu değişen kareler güncellenir
+
+        Güncellenen kare sayısını döndürür.
+        """
+        piece_map = board.piece_map()
+        targets = {move.to_square for move in possible_moves}
+        changed = 0
+        for square in chess.SQUARES:
+            piece = piece_map.get(square)
+            code = piece_code(piece) if piece is not None else None
+            if square in targets:
+                hint = CAPTURE_HINT if piece is not None else MOVE_HINT
+            else:
+                hint = NO_HINT
+            state = (code, square == selected_square, hint)
+            if state != self.drawn[square]:
+                self._draw_square(square, state)
+                changed += 1
+        return changed
+
+    def _draw_square(self, square, state):
+        """Karenin öğelerini yeni duruma göre güncelle"""
+        previous = self.drawn[square] or (None, False, NO_HINT)
+        code, selected, hint = state
+        canvas = self.canvas
+        if code != previous[0]:
+            image = self.pieces.get_piece_image(code) if code is not None else None
+            if image is not None:
+                canvas.itemconfigure(self.images[square], image=image, state="normal")
+            else:
+                canvas.itemconfigure(self.images[square], state="hidden")
+        if selected != previous[1]:
+            canvas.itemconfigure(self.frames[square], state="normal" if selected else "hidden")
+        if hint != previous[2]:
+            # Alınabilecek taşın karesi kırmızı, boş hedef karede nokta gösterilir
+            fill = CAPTURE_COLOR if hint == CAPTURE_HINT else self.base_color(square)
+            canvas.itemconfigure(self.backgrounds[square], fill=fill)
+            canvas.itemconfigure(self.hints[square],
+                                 state="normal" if hint == MOVE_HINT else "hidden")
+        self.drawn[square] = state
+
+    def show_drag(self, image, x, y):
+        """Sürüklenen taşı verilen tuval koordinatlarında göster"""
+        self.canvas.itemconfigure(self.drag_item, image=image, state="normal")
+        self.canvas.coords(self.drag_item, x, y)
+        self.canvas.tag_raise(self.drag_item)
+
+    def hide_drag(self):
+        """Sürüklenen taş görüntüsünü gizle"""
+        self.canvas.itemconfigure(self.drag_item, state="hidden")
+
+
+def piece_code(piece):
+    """Taşı PieceLoader kodu olarak döndür (örn. 'wn')"""
+    return ("w" if piece.color == chess.WHITE else "b") + piece.symbol().lower()
@@ -1,24 +1,31 @@
 import chess
 import tkinter as tk
 from tkinter import messagebox
-import random
-from piece_loader import PieceLoader
+from piece_loader import PieceLoader, PIECE_SIZE
+from board_canvas import BoardCanvas
+from move_index import MoveIndexCache
+from game_archive import append_game, ARCHIVE_PATH
 import time
-from chess_ai import ChessAI
-from advanced_ai import AdvancedChessAI
+import threading
+import queue
+from engines import create_engine, AI_TIME_LIMIT
+from ponder import Ponderer
+from search import SearchClock
 
 class ChessGame:
     def __init__(self):
         self.window = tk.Tk()
         self.window.title("Satranç Oyunu")
         self.board = chess.Board()
-        self.pieces = PieceLoader(size=50)
+        self.pieces = PieceLoader(size=PIECE_SIZE)
         self.move_history = []
         self.selected_square = None
         self.dragging = False
-        self.drag_image_label = None
         self._current_drag_image = None
         self.possible_moves = []
+        self.board_canvas = None
+        # Yasal hamleler pozisyon başına bir kez üretilir
+        self.move_index = MoveIndexCache()
         self.game_stats = {
             'white_captures': [],
             'black_captures': [],
@@ -29,6 +36,16 @@ class ChessGame:
         }
         self.difficulty = "easy"
         self.ai = None
+        self.ai_time_limit = AI_TIME_LIMIT  # AI'nın hamle başına düşünme süresi (saniye)
+        self.search_clock = SearchClock()
+        # Arka plan AI araması
+        self.ai_thread = None
+        self.ai_results = queue.Queue()
+        self.ai_generation = 0
+        self.ai_thinking = False
+        # İnsanın sırasında AI'nın beklenen cevaba karşı düşünmesi
+        self.ponder_enabled = True
+        self.ponderer = None
         self.show_main_menu()
 
     def get_piece_symbol(self, piece):
@@ -40,74 +57,25 @@ class ChessGame:
         return f"{color}{piece_type}"
         
     def update_board(self):
-        """Tahtayı güncelle"""
-        if not hasattr(self, 'buttons') or not self.buttons:
+        """Tahtayı güncelle (yalnızca değişen kareler yeniden çizilir)"""
+        if self.board_canvas is None:
             return
-            
-        for row in range(8):
-            for col in range(8):
-                square = (7-row) * 8 + col
-                piece = self.board.piece_at(square)
-                button = self.buttons[row][col]
-                
-                if button is None:
-                    continue
-                    
-                frame = button.master
-                if frame is None:
-                    continue
-                
-                # Temel arka plan rengini ayarla
-                base_color = "#ecf0f1" if (row + col) % 2 == 0 else "#34495e"
-                button.configure(bg=base_color)
-                frame.configure(bg=base_color)
-                
-                # Seçili kare için ince kenarlık
-                if square == self.selected_square:
-                    frame.configure(highlightbackground="#27ae60", highlightthickness=2)
-                # Olası hamleler için gösterge
-                elif square in [move.to_square for move in self.possible_moves]:
-                    if self.board.piece_at(square):
-                        button.configure(bg="#e74c3c")
-                    else:
-                        for widget in button.winfo_children():
-                            if isinstance(widget, tk.Canvas):
-                                widget.destroy()
-                        
-                        # Daha büyük ve belirgin gösterge
-                        indicator = tk.Canvas(button, width=16, height=16,
-                                           bg=base_color, highlightthickness=0)
-                        indicator.create_oval(2, 2, 14, 14,
-                                           fill="#3498db",
-                                           outline="#ecf0f1",
-                                           width=1)
-                        indicator.place(relx=0.5, rely=0.5, anchor="center")
-                else:
-                    frame.configure(highlightthickness=0)
-                    # Eski göstergeleri temizle
-                    for widget in button.winfo_children():
-                        if isinstance(widget, tk.Canvas):
-                            widget.destroy()
-                
-                # Taş görüntüsünü ayarla
-                piece_symbol = self.get_piece_symbol(piece)
-                if piece_symbol:
-                    piece_image = self.pieces.get_piece_image(piece_symbol)
-                    if piece_image:
-                        button.configure(image=piece_image, width=50, height=50)
-                        button.image = piece_image  # Referansı sakla
-                else:
-                    button.configure(image="", width=50, height=50)
-                    
+        self.board_canvas.render(self.board, self.selected_square, self.possible_moves)
+
     def is_valid_move(self, move):
         """Hamlenin geçerli olup olmadığını kontrol et"""
         if move is None:
             return False
-        return any(m.from_square == move.from_square and 
-                  m.to_square == move.to_square for m in self.board.legal_moves)
+        return self.legal_moves().is_legal(move)
+
+    def legal_moves(self):
+        """Güncel pozisyonun yasal hamle dizini"""
+        return self.move_index.get(self.board)
 
     def on_square_click(self, event, row, col):
         """Kareye tıklandığında"""
+        if self.ai_thinking:
+            return
         square = (7-row) * 8 + col
         piece = self.board.piece_at(square)
         
@@ -135,32 +103,23 @@ class ChessGame:
         # Eğer tıklanan karede bir taş varsa ve sırası gelen oyuncunun taşıysa
         if piece and piece.color == self.board.turn:
             self.selected_square = square
-            self._current_drag_image = self.pieces.get_piece_image(piece)
+            self._current_drag_image = self.pieces.get_piece_image(self.get_piece_symbol(piece))
             self.show_possible_moves(square)
             self.dragging = False  # Sadece tıklama ile seçim yapıldığında sürükleme modunu kapatıyoruz
 
     def on_square_drag(self, event, row, col):
         """Kare üzerinde sürükleme"""
         if self.dragging and self.selected_square is not None and self._current_drag_image:
-            # Sürükleme görüntüsünü güncelle
-            if not self.drag_image_label:
-                self.drag_image_label = tk.Label(self.window, image=self._current_drag_image)
-                self.drag_image_label.lift()
-            
-            # Fare pozisyonuna göre görüntüyü güncelle
-            x = event.x_root - self.window.winfo_rootx() - 25
-            y = event.y_root - self.window.winfo_rooty() - 25
-            self.drag_image_label.place(x=x, y=y)
+            # Sürüklenen taşı fare konumunda göster
+            self.board_canvas.show_drag(self._current_drag_image, event.x, event.y)
 
     def on_square_release(self, event, row, col):
         """Kare üzerinde bırakma"""
-        if not self.dragging or self.selected_square is None:
+        if not self.dragging or self.selected_square is None or self.ai_thinking:
             return
 
         # Sürükleme görüntüsünü temizle
-        if self.drag_image_label:
-            self.drag_image_label.destroy()
-            self.drag_image_label = None
+        self.board_canvas.hide_drag()
 
         target_square = (7-row) * 8 + col
         
@@ -200,7 +159,7 @@ class ChessGame:
         captured_piece = self.board.piece_at(move.to_square)
         
         # Hamleyi yap
-        san_move = self.board.san(move)
+        san_move = self.legal_moves().san(move)
         
         # Eğer bir taş alındıysa istatistiklere ekle
         if captured_piece:
@@ -215,7 +174,7 @@ class ChessGame:
         
         # İstatistikleri güncelle
         self.game_stats['move_count'] += 1
-        if self.board.is_check():
+        if self.legal_moves().is_check:
             self.game_stats['check_count'] += 1
             self.check_label.config(text="ŞAH!")
         else:
@@ -237,8 +196,8 @@ class ChessGame:
         self.update_game_status()
         
         # Eğer oyun bitmemişse ve sıra siyahtaysa AI hamle yapsın
-        if not self.board.is_game_over() and self.board.turn == chess.BLACK:
-            self.window.after(500, self.make_ai_move)  # 500ms sonra AI hamle yapsın
+        if not self.legal_moves().is_game_over and self.board.turn == chess.BLACK:
+            self.start_ai_search()
 
     def reset_selection(self):
         """Seçim ve sürükleme durumunu sıfırla"""
@@ -249,7 +208,7 @@ class ChessGame:
     
     def show_possible_moves(self, square):
         """Seçili taşın olası hamlelerini göster"""
-        self.possible_moves = [move for move in self.board.legal_moves if move.from_square == square]
+        self.possible_moves = self.legal_moves().from_square(square)
         self.update_board()
     
     def clear_possible_moves(self):
@@ -263,188 +222,112 @@ class ChessGame:
         rank_number = 8 - (square // 8)  # 8'den başlayıp aşağı doğru giden koordinat
         return f"{file_letter}{rank_number}"
 
-    def evaluate_position(self, board):
-        """Pozisyonu değerlendir"""
-        if board.is_checkmate():
-            return -10000 if board.turn else 10000
-        if board.is_stalemate() or board.is_insufficient_material():
-            return 0
-            
-        # Oyun fazını belirle
-        total_pieces = len(board.piece_map())
-        is_endgame = total_pieces <= 10
-        
-        # Taş değerleri
-        piece_values = {
-            chess.PAWN: 100,
-            chess.KNIGHT: 320,
-            chess.BISHOP: 330,
-            chess.ROOK: 500,
-            chess.QUEEN: 900,
-            chess.KING: 20000
-        }
-        
-        score = 0
-        pieces = board.piece_map()
-        
-        # Tehdit altındaki taşları ve karşı hamle fırsatlarını değerlendir
-        for square, piece in pieces.items():
-            if piece.color != board.turn:  # Rakip taşları değerlendir
-                continue
-                
-            value = piece_values[piece.piece_type]
-            attackers = board.attackers(not piece.color, square)
-            defenders = board.attackers(piece.color, square)
-            
-            # Taş tehdit altında mı kontrol et
-            if attackers:
-                min_attacker_value = min(piece_values[board.piece_at(attacker).piece_type] 
-                                      for attacker in attackers)
-                max_defender_value = max([piece_values[board.piece_at(defender).piece_type] 
-                                      for defender in defenders] or [0])
-                
-                # Karşı atak fırsatlarını ara
-                counter_attacks = []
-                for move in board.legal_moves:
-                    if move.from_square == square:
-                        # Hamle bir taş yiyor mu?
-                        if board.piece_at(move.to_square):
-                            target_value = piece_values[board.piece_at(move.to_square).piece_type]
-                            
-                            # Hamleden sonraki durumu simüle et
-                            board.push(move)
-                            future_attackers = board.attackers(not piece.color, move.to_square)
-                            future_defenders = board.attackers(piece.color, move.to_square)
-                            is_safe_after_move = not future_attackers or (future_defenders and 
-                                               len(future_defenders) >= len(future_attackers))
-                            board.pop()
-                            
-                            counter_attacks.append((target_value, is_safe_after_move))
-                
-                # Karşı atak stratejisi
-                if counter_attacks:
-                    best_target_value = max(ca[0] for ca in counter_attacks)
-                    is_any_safe_attack = any(ca[1] for ca in counter_attacks)
-                    
-                    # Eğer değerli bir karşı atak yapılabiliyorsa
-                    if best_target_value >= min_attacker_value:
-                        if is_any_safe_attack:
-                            score += best_target_value * 2  # Güvenli karşı atağa yüksek bonus
-                        else:
-                            score += best_target_value  # Riskli ama değerli karşı atak
-                            
-                    # Değerli taşı koruma stratejisi
-                    elif value > min_attacker_value:
-                        if defenders:
-                            if max_defender_value >= min_attacker_value:
-                                score += value  # Savunulabilir değerli taş
-                            else:
-                                score -= value // 2  # Zayıf savunulan değerli taş
-                        else:
-                            score -= value  # Savunmasız değerli taş
-                            
-                    # Değersiz taşla saldırı stratejisi
-                    else:
-                        if best_target_value > value:
-                            score += best_target_value - value  # Karlı değişim
-                            
-            # Normal hamle değerlendirmesi
-            for move in board.legal_moves:
-                if move.from_square == square:
-                    # Taş yeme hamlesi
-                    if board.piece_at(move.to_square):
-                        target_value = piece_values[board.piece_at(move.to_square).piece_type]
-                        
-                        # Hamleden sonraki güvenliği kontrol et
-                        board.push(move)
-                        is_safe = not board.attackers(not piece.color, move.to_square) or \
-                                bool(board.attackers(piece.color, move.to_square))
-                        board.pop()
-                        
-                        if is_safe:
-                            if target_value > value:
-                                score += (target_value - value) * 2  # Karlı ve güvenli değişim
-                            else:
-                                score += target_value  # Normal taş yeme
-                        else:
-                            if target_value > value:
-                                score += target_value - value  # Riskli ama karlı değişim
-                                
-                    # Pozisyon iyileştirme
-                    else:
-                        # Merkez kontrolü
-                        to_file = chess.square_file(move.to_square)
-                        to_rank = chess.square_rank(move.to_square)
-                        center_distance = abs(3.5 - to_file) + abs(3.5 - to_rank)
-                        
-                        if center_distance <= 2:  # Merkeze yakın hamle
-                            score += (4 - center_distance) * 5
-                            
-                        # Açık hat kontrolü (kaleler için)
-                        if piece.piece_type == chess.ROOK:
-                            file_pawns = sum(1 for r in range(8)
-                                          if board.piece_at(chess.square(to_file, r)) and
-                                          board.piece_at(chess.square(to_file, r)).piece_type == chess.PAWN)
-                            if file_pawns == 0:
-                                score += 20
-        
-        return score
-
-    def minimax(self, board, depth, alpha, beta, maximizing_player):
-        """Minimax algoritması ile en iyi hamleyi bul"""
-        if depth == 0 or board.is_game_over():
-            return self.evaluate_position(board), None
-            
-        best_move = None
-        if maximizing_player:
-            max_eval = float('-inf')
-            for move in board.legal_moves:
-                board.push(move)
-                eval, _ = self.minimax(board, depth - 1, alpha, beta, False)
-                board.pop()
-                
-                if eval > max_eval:
-                    max_eval = eval
-                    best_move = move
-                    
-                alpha = max(alpha, eval)
-                if beta <= alpha:
-                    break
-            return max_eval, best_move
+    def get_ai_move(self, board=None, clock=None):
+        """AI'nın hamlesini al (seçilen zorluk seviyesinin motoruyla)"""
+        if board is None:
+            board = self.board
+        return self.ai.get_best_move(board, time_limit=self.ai_time_limit, clock=clock)
+
+    def start_ai_search(self):
+        """AI aramasını tahtanın kopyası üzerinde arka planda başlat"""
+        # Tahmin tuttuysa ponder araması devralınır, tutmadıysa durdurulur
+        ponder_clock = None
+        if self.ponderer is not None:
+            ponder_clock = self.ponderer.hit(self.board, self.ai_time_limit)
+        self.cancel_ai_search()
+        if self.legal_moves().is_game_over:
+            return
+        generation = self.ai_generation
+        self.ai_thinking = True
+        self.status_label.config(text="Yapay zeka düşünüyor…")
+        if ponder_clock is not None:
+            self.search_clock = ponder_clock
+            target, args = self._run_ponder_search, (generation,)
         else:
-            min_eval = float('inf')
-            for move in board.legal_moves:
-                board.push(move)
-                eval, _ = self.minimax(board, depth - 1, alpha, beta, True)
-                board.pop()
-                
-                if eval < min_eval:
-                    min_eval = eval
-                    best_move = move
-                    
-                beta = min(beta, eval)
-                if beta <= alpha:
-                    break
-            return min_eval, best_move
-
-    def get_ai_move(self):
-        """AI'nın hamlesini al"""
-        # Oyun fazına göre derinliği ayarla
-        total_pieces = len(self.board.piece_map())
-        if total_pieces <= 10:  # Son oyun
-            depth = 5
-        elif total_pieces <= 20:  # Orta oyun
-            depth = 4
-        else:  # Açılış
-            depth = 3
-            
-        _, best_move = self.minimax(self.board, depth, float('-inf'), float('inf'), True)
-        return best_move
+            # Saat ana iş parçacığında oluşturulur ki iptal her zaman ona ulaşsın
+            self.search_clock = SearchClock(self.ai_time_limit)
+            target, args = self._run_ai_search, (self.board.copy(), self.search_clock, generation)
+        self.ai_thread = threading.Thread(target=target, args=args, daemon=True)
+        self.ai_thread.start()
+        self.window.after(50, self.poll_ai_move)
+
+    def _run_ai_search(self, board, clock, generation):
+        """Arka plan iş parçacığında aramayı çalıştır, sonucu kuyruğa koy"""
+        try:
+            best_move = self.get_ai_move(board, clock)
+        except Exception:
+            best_move = None
+        self.ai_results.put((generation, best_move))
+
+    def _run_ponder_search(self, generation):
+        """Tahmin tuttuğunda devralınan ponder aramasının sonucunu kuyruğa koy"""
+        best_move = self.ponderer.finish()
+        self.ai_results.put((generation, best_move))
+
+    def start_pondering(self):
+        """AI hamlesinden sonra insanın beklenen cevabına karşı düşünmeye başla"""
+        if (not self.ponder_enabled or self.ponderer is None or
+                self.legal_moves().is_game_over):
+            return
+        self.ponderer.start(self.board.copy())
 
-    def make_ai_move(self):
+    def update_ponder_label(self):
+        """Tahmin isabet oranını ve kazanılan süreyi göster"""
+        if self.ponderer is None:
+            return
+        stats = self.ponderer.stats()
+        self.ponder_label.config(
+            text=f"Tahmin: {stats['hits']}/{stats['hits'] + stats['misses']} "
+                 f"(%{stats['hit_rate'] * 100:.0f}), kazanılan süre: "
+                 f"{stats['saved_per_move']:.1f} sn/hamle"
+        )
+
+    def poll_ai_move(self):
+        """Arama sonucunu ana iş parçacığında kontrol et"""
+        if not self.ai_thinking:
+            return
+        try:
+            generation, best_move = self.ai_results.get_nowait()
+        except queue.Empty:
+            self.window.after(50, self.poll_ai_move)
+            return
+        if generation != self.ai_generation:
+            # İptal edilmiş aramanın sonucu
+            self.window.after(50, self.poll_ai_move)
+            return
+        self.ai_thinking = False
+        self.ai_thread = None
+        self.update_status()
+        self.update_ponder_label()
+        self.make_ai_move(best_move)
+        self.start_pondering()
+
+    def cancel_ai_search(self):
+        """Süren aramayı durdur ve sonucunu geçersiz say"""
+        self.ai_generation += 1
+        self.ai_thinking = False
+        if self.ponderer is not None:
+            self.ponderer.stop()
+        if self.ai_thread is not None:
+            self.search_clock.stop()
+            self.ai_thread.join()
+            self.ai_thread = None
+        # Eski aramalardan kalan sonuçları at
+        while not self.ai_results.empty():
+            self.ai_results.get_nowait()
+
+    def replace_engine(self, difficulty):
+        """Eski motoru kapatıp (kitap, tablolar, işçi havuzu) yenisini kur"""
+        self.cancel_ai_search()
+        self.ponderer = None
+        if self.ai is not None:
+            self.ai.close()
+        self.ai = create_engine(difficulty)
+        self.ponderer = Ponderer(self.ai)
+
+    def make_ai_move(self, best_move):
         """AI'nın hamle yapması"""
-        if not self.board.is_game_over():
-            best_move = self.get_ai_move()
+        if not self.legal_moves().is_game_over:
             if best_move:
                 # Piyon terfisi kontrolü
                 if self.is_pawn_promotion(best_move):
@@ -459,7 +342,7 @@ class ChessGame:
                 captured_piece = self.board.piece_at(best_move.to_square)
                 
                 # Hamleyi yap
-                san_move = self.board.san(best_move)
+                san_move = self.legal_moves().san(best_move)
                 
                 # Eğer bir taş alındıysa istatistiklere ekle
                 if captured_piece:
@@ -474,7 +357,7 @@ class ChessGame:
                 
                 # İstatistikleri güncelle
                 self.game_stats['move_count'] += 1
-                if self.board.is_check():
+                if self.legal_moves().is_check:
                     self.game_stats['check_count'] += 1
                     self.check_label.config(text="ŞAH!")
                 else:
@@ -580,13 +463,14 @@ class ChessGame:
     
     def update_game_status(self):
         """Oyun durumunu güncelle"""
-        if self.board.is_game_over():
-            self.handle_game_over(self.board.result())
+        index = self.legal_moves()
+        if index.is_game_over:
+            self.handle_game_over(index.result())
         else:
             current_turn = "Beyaz" if self.board.turn else "Siyah"
             self.status_label.config(text=f"{current_turn}'ın hamlesi")
             
-            if self.board.is_check():
+            if index.is_check:
                 self.check_label.config(text="ŞAH!")
                 self.game_stats['check_count'] += 1
             else:
@@ -602,12 +486,17 @@ class ChessGame:
         else:
             message = "Berabere!"
 
+        self.archive_game(result)
+
         # Oyun sonu istatistiklerini ekle
         total_time = int(time.time() - self.game_stats['start_time'])
         stats = f"\n\nOyun İstatistikleri:\n"
         stats += f"Toplam Hamle: {self.game_stats['move_count']}\n"
         stats += f"Şah Durumu: {self.game_stats['check_count']} kez\n"
         stats += f"Oyun Süresi: {total_time} saniye"
+        if self.ponderer is not None and self.ponderer.hits + self.ponderer.misses:
+            ponder_stats = self.ponderer.stats()
+            stats += f"\nTahmin İsabeti: %{ponder_stats['hit_rate'] * 100:.0f}"
 
         # Kullanıcıya sor
         answer = messagebox.askyesno(
@@ -618,6 +507,23 @@ class ChessGame:
         # Her iki durumda da ana menüye dön
         self.show_main_menu()
 
+    def archive_game(self, result):
+        """Biten oyunu arşiv dosyasına ekle"""
+        try:
+            append_game(
+                ARCHIVE_PATH,
+                self.board.move_stack,
+                result=result,
+                white="human",
+                black=self.difficulty,
+                difficulty=self.difficulty,
+                start_time=self.game_stats['start_time'],
+                duration=time.time() - self.game_stats['start_time'],
+                time_limit=self.ai_time_limit
+            )
+        except OSError as e:
+            messagebox.showwarning("Oyun Arşivi", f"Oyun arşive yazılamadı: {e}")
+
     def update_capture_labels(self):
         """Alınan taşları gösteren etiketleri güncelle"""
         white_text = "Beyaz'ın aldığı taşlar: "
@@ -707,6 +613,16 @@ class ChessGame:
         )
         self.black_captures_label.pack(anchor="w")
 
+        # Ponder istatistikleri
+        self.ponder_label = tk.Label(
+            self.stats_frame,
+            text="Tahmin: -",
+            font=("Helvetica", 12),
+            bg="#2c3e50",
+            fg="#ecf0f1"
+        )
+        self.ponder_label.pack(anchor="w")
+
         # Hamle geçmişi başlığı
         self.history_title = tk.Label(
             self.right_frame,
@@ -763,16 +679,9 @@ class ChessGame:
         board_section = tk.Frame(middle_section, bg="#2c3e50")
         board_section.pack(side=tk.LEFT)
         
-        # Satranç tahtası frame'i
-        self.frame = tk.Frame(board_section, bg="#2c3e50")
-        self.frame.pack()
-        
         # Alt koordinatlar için frame
         bottom_coords = tk.Frame(board_section, bg="#2c3e50")
-        bottom_coords.pack(fill=tk.X)
         
-        # Satranç tahtası düğmeleri
-        self.buttons = []
         square_size = 60
         
         # Sol koordinatları yerleştir (8'den 1'e)
@@ -783,37 +692,17 @@ class ChessGame:
             tk.Label(coord_frame, text=str(8-i), font=("Helvetica", 12), 
                     fg="#ecf0f1", bg="#2c3e50").place(relx=0.5, rely=0.5, anchor="center")
         
-        # Satranç kareleri
-        for row in range(8):
-            button_row = []
-            for col in range(8):
-                # Her kare için bir frame
-                square_frame = tk.Frame(
-                    self.frame,
-                    width=square_size,
-                    height=square_size,
-                    highlightthickness=0,
-                    bg="#ecf0f1" if (row + col) % 2 == 0 else "#34495e"
-                )
-                square_frame.grid(row=row, column=col)
-                square_frame.grid_propagate(False)
-                
-                # Her kare için bir label
-                square_label = tk.Label(
-                    square_frame,
-                    width=square_size,
-                    height=square_size,
-                    bg="#ecf0f1" if (row + col) % 2 == 0 else "#34495e"
-                )
-                square_label.place(relx=0.5, rely=0.5, anchor="center")
-                
-                # Mouse olaylarını bağla
-                square_label.bind("<Button-1>", lambda e, r=row, c=col: self.on_square_click(e, r, c))
-                square_label.bind("<B1-Motion>", lambda e, r=row, c=col: self.on_square_drag(e, r, c))
-                square_label.bind("<ButtonRelease-1>", lambda e, r=row, c=col: self.on_square_release(e, r, c))
-                
-                button_row.append(square_label)
-            self.buttons.append(button_row)
+        # Satranç kareleri tek bir tuval üzerinde çizilir
+        self.board_canvas = BoardCanvas(
+            board_section,
+            self.pieces,
+            square_size=square_size,
+            on_press=self.on_square_click,
+            on_motion=self.on_square_drag,
+            on_release=self.on_square_release
+        )
+        self.board_canvas.pack()
+        bottom_coords.pack(fill=tk.X)
         
         # Alt koordinatları yerleştir (A'dan H'ye)
         for i in range(8):
@@ -828,6 +717,9 @@ class ChessGame:
     
     def show_main_menu(self):
         """Modern ana menüyü göster"""
+        # Süren AI aramasını bırak
+        self.cancel_ai_search()
+
         # Ana pencereyi yapılandır
         self.window.geometry("800x600")
         self.window.configure(bg="#2c3e50")
@@ -835,6 +727,7 @@ class ChessGame:
         # Ana penceredeki mevcut widget'ları temizle
         for widget in self.window.winfo_children():
             widget.destroy()
+        self.board_canvas = None
 
         # Ana menü frame'i
         menu_frame = tk.Frame(self.window, bg="#2c3e50")
@@ -899,23 +792,21 @@ class ChessGame:
 
     def start_game(self, difficulty):
         """Yeni oyun başlat"""
+        self.cancel_ai_search()
         self.difficulty = difficulty
         # Zorluk seviyesine göre AI'ı ayarla
         if difficulty == "easy":
-            self.ai = ChessAI(difficulty="easy")
             difficulty_text = "Kolay Seviye"
         elif difficulty == "medium":
-            self.ai = ChessAI(difficulty="medium")
             difficulty_text = "Orta Seviye"
         else:  # hard
-            self.ai = AdvancedChessAI()
             difficulty_text = "Zor Seviye"
+        self.replace_engine(difficulty)
 
         # Oyunu sıfırla
         self.board = chess.Board()
         self.selected_square = None
         self.dragging = False
-        self.drag_image_label = None
         self._current_drag_image = None
         self.possible_moves = []
         self.move_history = []
@@ -950,8 +841,11 @@ class ChessGame:
 
     def reset_game(self):
         """Oyunu sıfırla ve yeni oyun başlat"""
-        # Tahtayı sıfırla
+        self.cancel_ai_search()
+
+        # Tahtayı ve motoru sıfırla (açılış kitaplığı yeniden başlar)
         self.board = chess.Board()
+        self.replace_engine(self.difficulty)
         
         # İstatistikleri sıfırla
         self.game_stats = {
@@ -974,7 +868,6 @@ class ChessGame:
         # Seçimleri sıfırla
         self.selected_square = None
         self.dragging = False
-        self.drag_image_label = None
         self._current_drag_image = None
         self.possible_moves = []
         
@@ -1,49 +1,185 @@
+import argparse
+import hashlib
+import json
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
 import requests
 from PIL import Image
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def download_pieces():
-    # Create pieces directory if it doesn't exist
-    pieces_dir = os.path.join(os.path.dirname(__file__), "pieces")
-    os.makedirs(pieces_dir, exist_ok=True)
-    
-    # Chess piece URLs (PNG files)
-    piece_urls = {
-        'white_king': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/wk.png',
-        'white_queen': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/wq.png',
-        'white_bishop': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/wb.png',
-        'white_knight': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/wn.png',
-        'white_rook': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/wr.png',
-        'white_pawn': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/wp.png',
-        'black_king': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/bk.png',
-        'black_queen': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/bq.png',
-        'black_bishop': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/bb.png',
-        'black_knight': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/bn.png',
-        'black_rook': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/br.png',
-        'black_pawn': 'https://images.chesscomfiles.com/chess-themes/pieces/neo/150/bp.png'
+# Source images (150 px); pieces are stored at full size and the GUI sizes
+# are derived from them once by PieceLoader
+PIECE_BASE_URL = "https://images.chesscomfiles.com/chess-themes/pieces/neo/150/"
+PIECE_FILES = {
+    'white_king': 'wk.png',
+    'white_queen': 'wq.png',
+    'white_bishop': 'wb.png',
+    'white_knight': 'wn.png',
+    'white_rook': 'wr.png',
+    'white_pawn': 'wp.png',
+    'black_king': 'bk.png',
+    'black_queen': 'bq.png',
+    'black_bishop': 'bb.png',
+    'black_knight': 'bn.png',
+    'black_rook': 'br.png',
+    'black_pawn': 'bp.png'
+}
+
+PIECES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pieces")
+MANIFEST_NAME = "manifest.json"
+
+# (connect, read) timeouts in seconds and retry policy for transient errors
+REQUEST_TIMEOUT = (5, 15)
+RETRIES = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",))
+
+
+def create_session(workers):
+    """Session whose connection pool fits the thread pool"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=RETRIES)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def file_sha256(path):
+    with open(path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+def write_atomic(path, data):
+    """Write to a temporary file in the same directory, then rename over the target"""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_manifest(pieces_dir):
+    try:
+        with open(os.path.join(pieces_dir, MANIFEST_NAME), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(pieces_dir, manifest):
+    data = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+    write_atomic(os.path.join(pieces_dir, MANIFEST_NAME), data)
+
+
+def fetch_piece(session, url, path, entry, force=False):
+    """Download one piece unless the local copy is still current
+
+    The manifest entry's ETag / Last-Modified are sent as conditional headers
+    only if the file on disk still matches its recorded checksum. Returns
+    (status, manifest entry) where status is "downloaded", "unchanged" or
+    "failed: ...".
+    """
+    headers = {}
+    valid = (not force and entry and os.path.exists(path) and
+             file_sha256(path) == entry.get("sha256"))
+    if valid:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        return f"failed: {e}", entry
+    if response.status_code == 304 and valid:
+        return "unchanged", entry
+    if response.status_code != 200:
+        return f"failed: HTTP {response.status_code}", entry
+
+    # Reject anything that is not a decodable image, store as RGBA PNG
+    try:
+        img = Image.open(BytesIO(response.content))
+        img = img.convert('RGBA')
+    except (OSError, ValueError) as e:
+        return f"failed: {e}", entry
+    buffer = BytesIO()
+    img.save(buffer, 'PNG')
+    data = buffer.getvalue()
+    write_atomic(path, data)
+    return "downloaded", {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "width": img.size[0],
     }
 
+
+def download_pieces(pieces_dir=None, base_url=PIECE_BASE_URL, workers=4, sizes=None,
+                    force=False, session=None):
+    """Fetch all pieces concurrently, update the manifest and prepare GUI sprites
+
+    Returns {piece name: status}.
+    """
+    pieces_dir = pieces_dir or PIECES_DIR
+    os.makedirs(pieces_dir, exist_ok=True)
+    manifest = load_manifest(pieces_dir)
+    own_session = session is None
+    if own_session:
+        session = create_session(workers)
+
+    results = {}
     try:
-        # Download each piece
-        for piece_name, url in piece_urls.items():
-            print(f"Downloading {piece_name}...")
-            response = requests.get(url)
-            if response.status_code == 200:
-                # Convert to PNG and save
-                img = Image.open(BytesIO(response.content))
-                img = img.convert('RGBA')
-                img = img.resize((64, 64), Image.Resampling.LANCZOS)
-                img.save(os.path.join(pieces_dir, f"{piece_name}.png"), 'PNG')
-                print(f"Downloaded and saved {piece_name}")
-            else:
-                print(f"Failed to download {piece_name}")
-
-        print("\nAll pieces downloaded successfully!")
-        print("You can now run the chess game.")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                name: pool.submit(fetch_piece, session, base_url + file_name,
+                                  os.path.join(pieces_dir, f"{name}.png"),
+                                  manifest.get(name), force)
+                for name, file_name in PIECE_FILES.items()
+            }
+            for name, future in futures.items():
+                status, entry = future.result()
+                results[name] = status
+                if entry:
+                    manifest[name] = entry
+                print(f"{name}: {status}")
+    finally:
+        if own_session:
+            session.close()
+    save_manifest(pieces_dir, manifest)
+
+    if sizes:
+        # Build the resized sprite atlases the GUI will load at startup
+        from piece_loader import PieceLoader
+        loader = PieceLoader(piece_path=pieces_dir)
+        for size in sizes:
+            loader.prepare(size)
+    return results
 
-    except Exception as e:
-        print(f"An error occurred: {str(e)}")
 
 if __name__ == "__main__":
-    download_pieces()
+    from piece_loader import PIECE_SIZE
+
+    parser = argparse.ArgumentParser(description="Download chess piece images")
+    parser.add_argument("--dir", default=PIECES_DIR)
+    parser.add_argument("--base-url", default=PIECE_BASE_URL)
+    parser.add_argument("-w", "--workers", type=int, default=4)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[PIECE_SIZE],
+                        help="sprite sizes to prepare for the GUI")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the manifest and download everything")
+    args = parser.parse_args()
+    results = download_pieces(args.dir, args.base_url, args.workers, args.sizes, args.force)
+    failed = [name for name, status in results.items() if status.startswith("failed")]
+    if failed:
+        print(f"\n{len(failed)} pieces failed: {', '.join(failed)}")
+    else:
+        print("\nAll pieces are up to date.")
+        print("You can now run the chess game.")
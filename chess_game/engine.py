@@ -0,0 +1,413 @@
+import time
+import chess
+from incremental_eval import IncrementalEvaluator
+from move_ordering import MoveOrderer
+from parallel_search import RootSplitSearch
+from search import (SearchClock, SearchStats, SearchTimeout, unwind,
+                    QUIESCENCE_MAX_PLY, DELTA_MARGIN, NULL_MOVE_REDUCTION, NULL_MOVE_MIN_DEPTH,
+                    LMR_FULL_MOVES, LMR_MIN_DEPTH, LMR_REDUCTION)
+from tablebase import Tablebase
+from transposition import TranspositionTable, bound_flag, EXACT, LOWER_BOUND
+
+
+class SearchEngine:
+    """Tüm yapay zeka motorlarının ortak arama çekirdeği
+
+    İteratif derinleştirme, transpozisyon tablosu, hamle sıralama, sakin arama
+    ve paralel kök araması burada bir kez uygulanır. Pozisyon değerlendirmesi
+    takılabilir bir değerlendiriciye bırakılır: değerlendiricinin piece_values,
+    tables, MATE_SCORE özellikleri ve evaluate(board, material) metodu olmalıdır.
+    """
+
+    # Bu derinliğe kadar iterasyonlar paralel modda da sıralı aranır
+    PARALLEL_MIN_DEPTH = 3
+
+    # Seçici arama: null hamle budaması ve geç hamle azaltması (LMR). Varsayılan
+    # olarak kapalıdır; motorlar örnek düzeyinde ayrı ayrı açabilir
+    null_move = False
+    lmr = False
+
+    def __init__(self, evaluator, max_depth=3, workers=1, deterministic=False,
+                 tablebase_path=None):
+        self.evaluator = evaluator
+        self.max_depth = max_depth
+        # Oyun boyunca hamleler arasında korunan transpozisyon tablosu
+        self.transposition_table = TranspositionTable()
+        self.clock = SearchClock()
+        self.completed_depth = 0
+        self.move_orderer = MoveOrderer()
+        # Son aramanın istatistikleri; on_iteration(info) verilirse tamamlanan her
+        # iterasyonda çağrılır. profile açıkken değerlendirme ve hamle üretimi
+        # süreleri de ölçülür (kapalıyken ek maliyet yoktur)
+        self.stats = SearchStats()
+        self.on_iteration = None
+        self.profile = False
+        # Materyal (ve varsa konum) skoru arama sırasında artımlı tutulur
+        self.material = IncrementalEvaluator(evaluator.piece_values, evaluator.tables)
+        # Az taşlı pozisyonlarda Syzygy tabloları (varsa) kullanılır
+        self.tablebase = Tablebase(tablebase_path)
+        # workers > 1 ise kök hamleleri süreç havuzunda aranır; deterministic
+        # modda her işçi görevi boş tabloyla başlar
+        self.workers = workers
+        self.deterministic = deterministic
+        self.parallel = None
+        if workers > 1:
+            self.parallel = RootSplitSearch(type(self), workers, self._worker_kwargs())
+
+    def _worker_kwargs(self):
+        """İşçi süreçlerde aynı motoru kurmak için gereken argümanlar"""
+        return {"tablebase_path": self.tablebase.path}
+
+    def get_best_move(self, board, time_limit=None, max_depth=None, clock=None):
+        """Verilen tahta durumu için en iyi hamleyi bul
+
+        time_limit (saniye) verilirse arama derinleştirilirken süre dolunca
+        tamamlanan en derin iterasyonun hamlesi döner. Dışarıdan durdurulabilmesi
+        için hazır bir SearchClock da verilebilir.
+        """
+        return self._get_calculated_move(board, time_limit, max_depth, clock)
+
+    def ponder_move(self, board):
+        """Son aramanın tabloda bıraktığı, rakibin beklenen cevabı (yoksa None)"""
+        tt = self.transposition_table
+        move = tt.best_move(tt.key(board))
+        if move is None or not board.is_legal(move):
+            return None
+        return move
+
+    def ponder(self, board, clock):
+        """Rakibin sırasında tahmin edilen pozisyonu ara; clock durdurulana veya
+        sınırı konana kadar derinleştirir"""
+        return self._get_calculated_move(board, clock=clock)
+
+    def search_depth(self, board):
+        """Pozisyon için en fazla arama derinliği"""
+        return self.max_depth
+
+    def _get_calculated_move(self, board, time_limit=None, max_depth=None, clock=None):
+        """Minimax algoritması ile en iyi hamleyi hesapla (iteratif derinleştirme)"""
+        max_depth = max_depth or self.search_depth(board)
+        self.transposition_table.new_search()
+        self.clock = clock if clock is not None else SearchClock(time_limit)
+        self.completed_depth = 0
+        self.stats = SearchStats()
+
+        # Oyun bittiyse aranacak hamle yok
+        if not any(board.generate_legal_moves()):
+            return None
+
+        # Tablodaki pozisyonlarda arama yapılmaz
+        tablebase_move = self.tablebase.root_move(board)
+        if tablebase_move is not None:
+            return tablebase_move
+
+        self.material.reset(board)
+        self.move_orderer.new_search(board)
+        ply = len(board.move_stack)
+        if self.profile:
+            self._instrument()
+
+        best_move = None
+        searched = 0
+        for depth in range(1, max_depth + 1):
+            try:
+                if self.parallel is not None and depth >= self.PARALLEL_MIN_DEPTH:
+                    best_move, value = self._search_root_parallel(board, depth, best_move)
+                else:
+                    best_move, value = self._search_root(board, depth, best_move)
+            except SearchTimeout:
+                unwind(board, ply)
+                break
+            self.completed_depth = depth
+            nodes = self.clock.nodes + self.clock.qnodes
+            info = self.stats.add_iteration(depth, value, self.principal_variation(board, depth),
+                                            nodes - searched, self.clock.elapsed())
+            searched = nodes
+            if self.on_iteration is not None:
+                self.on_iteration(info)
+            # İlk iterasyondan sonra süre kontrolü devreye girer
+            self.clock.armed = True
+            if self.clock.expired():
+                break
+        if self.profile:
+            self._uninstrument()
+        self.material.release()
+        return best_move
+
+    def principal_variation(self, board, depth):
+        """Transpozisyon tablosundaki en iyi hamleleri izleyerek ana varyantı çıkar"""
+        tt = self.transposition_table
+        pv = []
+        seen = set()
+        while len(pv) < depth:
+            key = tt.key(board)
+            move = tt.best_move(key)
+            # Tekrarlanan pozisyonda döngüye girmemek için anahtarlar tutulur
+            if move is None or key in seen or not board.is_legal(move):
+                break
+            seen.add(key)
+            pv.append(move)
+            board.push(move)
+        for _ in pv:
+            board.pop()
+        return pv
+
+    def _instrument(self):
+        """Değerlendirme ve hamle üretimini süre ölçen sarmalayıcılarla değiştir
+
+        Sarmalayıcılar örnek özniteliği olarak konur; profile kapalıyken arama
+        döngüsünde hiçbir ek kontrol yapılmaz.
+        """
+        self._evaluate_position = self._timed(self._evaluate_position, 'eval_time')
+        self.move_orderer.order = self._timed(self.move_orderer.order, 'movegen_time')
+        self.move_orderer.order_captures = self._timed(self.move_orderer.order_captures,
+                                                       'movegen_time')
+
+    def _timed(self, function, counter):
+        """Fonksiyonun süresini istatistikteki sayaca ekleyen sarmalayıcı"""
+        stats = self.stats
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                setattr(stats, counter, getattr(stats, counter) + perf_counter() - start)
+        return timed
+
+    def _uninstrument(self):
+        """Süre ölçen sarmalayıcıları kaldır"""
+        del self._evaluate_position
+        del self.move_orderer.order
+        del self.move_orderer.order_captures
+
+    def _order_root_moves(self, board, first_move=None):
+        """Kök hamlelerini sırala; önceki iterasyonun en iyi hamlesi ilk denenir"""
+        return self.move_orderer.order(board, tt_move=first_move)
+
+    def _search_root(self, board, depth, first_move=None):
+        """Kökte tek bir derinlik için arama yap, (hamle, skor) döndür"""
+        tt = self.transposition_table
+        key = tt.key(board)
+        _, tt_move = tt.probe(key, depth, float('-inf'), float('inf'))
+
+        best_move = None
+        best_value = float('-inf')
+        alpha = float('-inf')
+        beta = float('inf')
+
+        for move in self._order_root_moves(board, first_move or tt_move):
+            self._push(board, move)
+            value = -self._minimax(board, depth - 1, -beta, -alpha)
+            self._pop(board)
+
+            if value > best_value:
+                best_value = value
+                best_move = move
+            alpha = max(alpha, value)
+
+        if best_move is not None:
+            tt.store(key, depth, EXACT, best_value, best_move)
+        return best_move, best_value
+
+    def _search_root_parallel(self, board, depth, first_move=None):
+        """Kök hamlelerini işçi süreçlere dağıtarak ara, (hamle, skor) döndür"""
+        tt = self.transposition_table
+        key = tt.key(board)
+        _, tt_move = tt.probe(key, depth, float('-inf'), float('inf'))
+        legal_moves = self._order_root_moves(board, first_move or tt_move)
+        if not legal_moves:
+            return None, float('-inf')
+
+        # İlk hamle burada aranır, skoru diğerlerine alfa olur
+        best_move = legal_moves[0]
+        self._push(board, best_move)
+        best_value = -self._minimax(board, depth - 1, float('-inf'), float('inf'))
+        self._pop(board)
+
+        remaining = legal_moves[1:]
+        results, completed = self.parallel.search(board, depth, remaining, best_value,
+                                                  self.clock, self.deterministic)
+        for move, (value, nodes, qnodes) in zip(remaining, results):
+            self.clock.nodes += nodes
+            self.clock.qnodes += qnodes
+            # Eşit skorda sıralı aramadaki gibi önceki hamle kalır
+            if value > best_value:
+                best_value = value
+                best_move = move
+        if not completed:
+            raise SearchTimeout()
+
+        tt.store(key, depth, EXACT, best_value, best_move)
+        return best_move, best_value
+
+    def _search_root_move(self, board, move, depth, alpha, deadline=None, fresh=False,
+                          stop_event=None):
+        """Tek bir kök hamlesini (alfa, +sonsuz) penceresinde ara (paralel işçiler için)
+
+        deadline ana aramanın mutlak bitiş zamanıdır; stop_event kurulunca
+        arama yarıda kesilir ve skor None döner.
+        """
+        if fresh:
+            self.transposition_table.clear()
+            self.move_orderer = MoveOrderer()
+        self.clock = SearchClock(deadline=deadline, stop_event=stop_event)
+        self.clock.armed = True
+        self.material.reset(board)
+        self.move_orderer.new_search(board)
+        ply = len(board.move_stack)
+        try:
+            self._push(board, move)
+            value = -self._minimax(board, depth - 1, float('-inf'), -alpha)
+            self._pop(board)
+        except SearchTimeout:
+            unwind(board, ply)
+            value = None
+        self.material.release()
+        return value, self.clock.nodes, self.clock.qnodes
+
+    def close(self):
+        """Paralel arama işçilerini kapat"""
+        if self.parallel is not None:
+            self.parallel.close()
+        self.tablebase.close()
+
+    def _push(self, board, move):
+        """Hamleyi yap ve artımlı skoru güncelle"""
+        self.material.push(board, move)
+        board.push(move)
+
+    def _pop(self, board):
+        """Hamleyi geri al ve artımlı skoru geri sar"""
+        board.pop()
+        self.material.pop()
+
+    def _minimax(self, board, depth, alpha, beta):
+        """Negamax biçiminde alfa-beta; skor sırası gelen taraf açısından"""
+        self.clock.tick()
+        tt = self.transposition_table
+        key = tt.key(board)
+        tt_score, tt_move = tt.probe(key, depth, alpha, beta)
+        if tt_score is not None:
+            return tt_score
+
+        if board.is_game_over():
+            value = self._evaluate_position(board)
+            tt.store(key, depth, EXACT, value, None)
+            return value
+
+        # Az taşlı pozisyonlarda kesin sonuç tablodan alınır
+        if self.tablebase.tables is not None:
+            value = self.tablebase.score(board, self.evaluator.MATE_SCORE, key)
+            if value is not None:
+                tt.store(key, depth, EXACT, value, None)
+                return value
+
+        if depth == 0:
+            # Yaprakta alma zincirleri bitene kadar devam et
+            self.clock.leaf_qnodes = 0
+            value = self._quiescence(board, alpha, beta)
+            tt.store(key, 0, bound_flag(value, alpha, beta), value, None)
+            return value
+
+        stats = self.stats
+        in_check = board.is_check()
+        if (self.null_move and depth >= NULL_MOVE_MIN_DEPTH and not in_check and
+                self._null_move_allowed(board, beta)):
+            # Sıra rakibe verildiği halde beta aşılıyorsa gerçek hamleler de aşar
+            stats.null_moves += 1
+            self._push(board, chess.Move.null())
+            score = -self._minimax(board, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1)
+            self._pop(board)
+            if score >= beta:
+                stats.null_cutoffs += 1
+                tt.store(key, depth, LOWER_BOUND, beta, None)
+                return beta
+
+        alpha_orig = alpha
+        value = float('-inf')
+        best_move = None
+        reduce_late = self.lmr and depth >= LMR_MIN_DEPTH and not in_check
+        killers = self.move_orderer.killer_moves(board) if reduce_late else ()
+        for index, move in enumerate(self.move_orderer.order(board, tt_move=tt_move)):
+            # Geç sıralanan sakin hamleler önce sığ ve dar pencereyle aranır;
+            # tablo ve öldürücü hamleler sıraları ne olursa olsun azaltılmaz
+            reduced = (reduce_late and index >= LMR_FULL_MOVES and not move.promotion and
+                       move != tt_move and move not in killers and not board.is_capture(move))
+            self._push(board, move)
+            if reduced and not board.is_check():
+                stats.reductions += 1
+                score = -self._minimax(board, depth - 1 - LMR_REDUCTION, -alpha - 1, -alpha)
+                if score > alpha:
+                    # Beklenenden iyi çıktı: önce tam derinlikte dar pencereyle,
+                    # o da alfayı geçerse tam pencereyle yeniden ara
+                    stats.researches += 1
+                    score = -self._minimax(board, depth - 1, -alpha - 1, -alpha)
+                    if alpha < score < beta:
+                        score = -self._minimax(board, depth - 1, -beta, -alpha)
+            else:
+                score = -self._minimax(board, depth - 1, -beta, -alpha)
+            self._pop(board)
+            if score > value:
+                value = score
+                best_move = move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                self.move_orderer.record_cutoff(board, move, depth)
+                stats.cutoffs += 1
+                if index == 0:
+                    stats.first_move_cutoffs += 1
+                break  # Beta kesme
+
+        tt.store(key, depth, bound_flag(value, alpha_orig, beta), value, best_move)
+        return value
+
+    def _null_move_allowed(self, board, beta):
+        """Null hamle güvenli mi? (zugzwang ve mat skorlarına karşı önlemler)
+
+        Art arda null hamle yapılmaz; yalnızca şah ve piyonu kalan taraf için
+        (zugzwang riski yüksek) ve mat skorlarına yakın pencerelerde denenmez.
+        """
+        if board.move_stack and not board.move_stack[-1]:
+            return False
+        if not board.occupied_co[board.turn] & ~(board.pawns | board.kings):
+            return False
+        return abs(beta) < self.evaluator.MATE_SCORE // 2
+
+    def _quiescence(self, board, alpha, beta, qply=0):
+        """Sakin arama: yalnızca alma hamleleri, stand-pat ve delta budaması"""
+        within_budget = self.clock.qtick()
+        stand_pat = self._evaluate_position(board)
+        if stand_pat >= beta or not within_budget or qply >= QUIESCENCE_MAX_PLY:
+            return stand_pat
+        piece_values = self.evaluator.piece_values
+        # En değerli taşı almak bile yetmiyorsa aramaya gerek yok
+        if stand_pat + piece_values[chess.QUEEN] + DELTA_MARGIN < alpha:
+            return stand_pat
+
+        alpha = max(alpha, stand_pat)
+        value = stand_pat
+        for move in self.move_orderer.order_captures(board):
+            # Delta budaması: alınan taş alfayı geçiremiyorsa atla
+            captured_type = board.piece_type_at(move.to_square) or chess.PAWN
+            if stand_pat + piece_values[captured_type] + DELTA_MARGIN <= alpha:
+                continue
+            self._push(board, move)
+            score = -self._quiescence(board, -beta, -alpha, qply + 1)
+            self._pop(board)
+            if score > value:
+                value = score
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        return value
+
+    def _evaluate_position(self, board):
+        """Pozisyonu sırası gelen taraf açısından değerlendir"""
+        self.stats.evals += 1
+        if board.is_checkmate():
+            return -self.evaluator.MATE_SCORE  # Sırası gelen taraf mat
+        if board.is_stalemate() or board.is_insufficient_material():
+            return 0
+        return self.evaluator.evaluate(board, self.material)
@@ -0,0 +1,26 @@
+from advanced_ai import AdvancedChessAI
+from chess_ai import ChessAI
+from threat_ai import ThreatChessAI
+
+# Arayüzün hamle başına düşünme süresi (saniye)
+AI_TIME_LIMIT = 3.0
+
+# Zorluk seviyeleri ve diğer adlandırılmış motorlar
+ENGINES = {
+    "easy": lambda: ChessAI(difficulty="easy"),
+    "medium": lambda: ChessAI(difficulty="medium"),
+    "hard": AdvancedChessAI,
+    # Seçici aramanın karşılaştırılması için (selfplay.py hard hard-full ...)
+    "hard-full": lambda: AdvancedChessAI(null_move=False, lmr=False),
+    "hard-null": lambda: AdvancedChessAI(lmr=False),
+    "hard-lmr": lambda: AdvancedChessAI(null_move=False),
+    "threat": ThreatChessAI,
+}
+
+# Oyun menüsünde sunulan zorluk seviyeleri
+DIFFICULTIES = ("easy", "medium", "hard")
+
+
+def create_engine(name):
+    """Adı verilen motoru oluştur"""
+    return ENGINES[name]()
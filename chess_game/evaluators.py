@@ -0,0 +1,339 @@
+import chess
+from mobility import mobility
+from see import see, see_threat, least_valuable_attacker
+
+# Tüm değerlendiricilerin ortak taş değerleri
+PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 20000
+}
+
+
+class PSTEvaluator:
+    """Materyal, konum tabloları, merkez ve hareket özgürlüğü (ChessAI)"""
+    MATE_SCORE = 20000
+
+    # Konum bazlı değerlendirme tabloları
+    PAWN_TABLE = [
+        0,  0,  0,  0,  0,  0,  0,  0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5,  5, 10, 25, 25, 10,  5,  5,
+        0,  0,  0, 20, 20,  0,  0,  0,
+        5, -5,-10,  0,  0,-10, -5,  5,
+        5, 10, 10,-20,-20, 10, 10,  5,
+        0,  0,  0,  0,  0,  0,  0,  0
+    ]
+
+    KNIGHT_TABLE = [
+        -50,-40,-30,-30,-30,-30,-40,-50,
+        -40,-20,  0,  0,  0,  0,-20,-40,
+        -30,  0, 10, 15, 15, 10,  0,-30,
+        -30,  5, 15, 20, 20, 15,  5,-30,
+        -30,  0, 15, 20, 20, 15,  0,-30,
+        -30,  5, 10, 15, 15, 10,  5,-30,
+        -40,-20,  0,  5,  5,  0,-20,-40,
+        -50,-40,-30,-30,-30,-30,-40,-50
+    ]
+
+    BISHOP_TABLE = [
+        -20,-10,-10,-10,-10,-10,-10,-20,
+        -10,  0,  0,  0,  0,  0,  0,-10,
+        -10,  0,  5, 10, 10,  5,  0,-10,
+        -10,  5,  5, 10, 10,  5,  5,-10,
+        -10,  0, 10, 10, 10, 10,  0,-10,
+        -10, 10, 10, 10, 10, 10, 10,-10,
+        -10,  5,  0,  0,  0,  0,  5,-10,
+        -20,-10,-10,-10,-10,-10,-10,-20
+    ]
+
+    ROOK_TABLE = [
+        0,  0,  0,  0,  0,  0,  0,  0,
+        5, 10, 10, 10, 10, 10, 10,  5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        -5,  0,  0,  0,  0,  0,  0, -5,
+        0,  0,  0,  5,  5,  0,  0,  0
+    ]
+
+    QUEEN_TABLE = [
+        -20,-10,-10, -5, -5,-10,-10,-20,
+        -10,  0,  0,  0,  0,  0,  0,-10,
+        -10,  0,  5,  5,  5,  5,  0,-10,
+        -5,  0,  5,  5,  5,  5,  0, -5,
+        0,  0,  5,  5,  5,  5,  0, -5,
+        -10,  5,  5,  5,  5,  5,  0,-10,
+        -10,  0,  5,  0,  0,  0,  0,-10,
+        -20,-10,-10, -5, -5,-10,-10,-20
+    ]
+
+
+    def __init__(self):
+        self.piece_values = PIECE_VALUES
+        # Artımlı değerlendiricinin kullandığı konum tabloları
+        self.tables = {
+            chess.PAWN: self.PAWN_TABLE,
+            chess.KNIGHT: self.KNIGHT_TABLE,
+            chess.BISHOP: self.BISHOP_TABLE,
+            chess.ROOK: self.ROOK_TABLE,
+            chess.QUEEN: self.QUEEN_TABLE
+        }
+
+    def evaluate(self, board, material):
+        """Pozisyonu sırası gelen taraf açısından değerlendir"""
+        # Materyal ve konum değerlendirmesi (artımlı)
+        value = material.current(board)
+                    
+        # Merkez kontrolü
+        central_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
+        for square in central_squares:
+            if board.piece_at(square) is not None:
+                if board.piece_at(square).color:
+                    value += 10
+                else:
+                    value -= 10
+                    
+        # Hareket özgürlüğü (her iki taraf için saldırı bitboard'larından)
+        white_mobility, black_mobility = mobility(board)
+        value += (white_mobility - black_mobility) * 0.1
+        
+        return value if board.turn else -value
+
+
+class AdvancedEvaluator:
+    """Merkez, piyon yapısı, kale hatları ve şah güvenliği (AdvancedChessAI)"""
+    MATE_SCORE = 20000
+
+    # Bitboard maskeleri
+    CENTER_MASK = chess.BB_E4 | chess.BB_E5 | chess.BB_D4 | chess.BB_D5
+    ADJACENT_FILE_MASKS = [
+        (chess.BB_FILES[file - 1] if file > 0 else 0) |
+        (chess.BB_FILES[file + 1] if file < 7 else 0)
+        for file in range(8)
+    ]
+
+    def __init__(self):
+        self.piece_values = PIECE_VALUES
+        self.tables = None
+
+    def evaluate(self, board, material):
+        """Gelişmiş pozisyon değerlendirmesi (sırası gelen taraf açısından)"""
+        # Materyal değerlendirmesi (artımlı)
+        value = material.current(board)
+        
+        # Merkez kontrolü (daha yüksek ağırlık)
+        value += 30 * (chess.popcount(board.occupied_co[chess.WHITE] & self.CENTER_MASK) -
+                       chess.popcount(board.occupied_co[chess.BLACK] & self.CENTER_MASK))
+        
+        # Piyon yapısı değerlendirmesi
+        value += self._evaluate_pawn_structure(board)
+        
+        # Hareket özgürlüğü (her iki taraf için saldırı bitboard'larından)
+        white_mobility, black_mobility = mobility(board)
+        value += (white_mobility - black_mobility) * 0.1
+        
+        # Kale açık hatta mı?
+        value += self._evaluate_rook_position(board)
+        
+        # Şah güvenliği
+        value += self._evaluate_king_safety(board)
+        
+        return value if board.turn else -value
+
+    def _evaluate_pawn_structure(self, board):
+        """Piyon yapısını değerlendir"""
+        value = 0
+        white_pawns = board.pawns & board.occupied_co[chess.WHITE]
+        black_pawns = board.pawns & board.occupied_co[chess.BLACK]
+        
+        # İzole piyonları cezalandır (kenar hatlar hariç)
+        for file in range(1, 7):
+            file_mask = chess.BB_FILES[file]
+            adjacent_mask = self.ADJACENT_FILE_MASKS[file]
+            if white_pawns & file_mask and not white_pawns & adjacent_mask:
+                value -= 20  # İzole piyon cezası
+            if black_pawns & file_mask and not black_pawns & adjacent_mask:
+                value += 20  # İzole piyon cezası
+        
+        return value
+
+    def _evaluate_rook_position(self, board):
+        """Kalelerin pozisyonunu değerlendir"""
+        value = 0
+        
+        # Açık hatları kontrol et (hatta hiç piyon yok)
+        for color, sign in ((chess.WHITE, 30), (chess.BLACK, -30)):
+            for square in chess.scan_forward(board.rooks & board.occupied_co[color]):
+                if not board.pawns & chess.BB_FILES[square & 7]:
+                    value += sign
+                    
+        return value
+
+    def _evaluate_king_safety(self, board):
+        """Şah güvenliğini değerlendir"""
+        value = 0
+        
+        # Her iki taraf için şah konumunu bul
+        white_king_square = board.king(chess.WHITE)
+        black_king_square = board.king(chess.BLACK)
+        
+        if white_king_square is not None:
+            # Beyaz şah için güvenlik değerlendirmesi
+            if self._is_endgame(board):
+                value += self._king_endgame_position_value(white_king_square, True)
+            else:
+                value += self._king_safety_value(board, white_king_square, True)
+        
+        if black_king_square is not None:
+            # Siyah şah için güvenlik değerlendirmesi
+            if self._is_endgame(board):
+                value -= self._king_endgame_position_value(black_king_square, False)
+            else:
+                value -= self._king_safety_value(board, black_king_square, False)
+        
+        return value
+
+    def _is_endgame(self, board):
+        """Oyunun son aşamada olup olmadığını kontrol et"""
+        # Vezirler yoksa veya her iki tarafın toplam materyal değeri düşükse son aşama
+        white_material = sum(chess.popcount(board.pieces_mask(piece_type, chess.WHITE)) * value 
+                           for piece_type, value in self.piece_values.items() 
+                           if piece_type != chess.KING)
+        black_material = sum(chess.popcount(board.pieces_mask(piece_type, chess.BLACK)) * value 
+                           for piece_type, value in self.piece_values.items() 
+                           if piece_type != chess.KING)
+        
+        return white_material < 1500 and black_material < 1500
+
+    def _king_safety_value(self, board, king_square, is_white):
+        """Şah güvenlik değeri hesapla"""
+        value = 0
+        file = king_square % 8
+        rank = king_square // 8
+        
+        # Rok yapılmış mı kontrol et
+        if is_white and rank == 0 and (file == 6 or file == 2):
+            value += 100  # Rok bonusu
+        elif not is_white and rank == 7 and (file == 6 or file == 2):
+            value += 100  # Rok bonusu
+            
+        # Şahın etrafındaki kendi taşları
+        own_pieces = board.occupied_co[chess.WHITE if is_white else chess.BLACK]
+        value += 10 * chess.popcount(chess.BB_KING_ATTACKS[king_square] & own_pieces)  # Koruyucu taş bonusu
+                        
+        return value
+
+    def _king_endgame_position_value(self, king_square, is_white):
+        """Son aşamada şah pozisyon değeri"""
+        file = king_square % 8
+        rank = king_square // 8
+        
+        # Son aşamada şah merkeze yakın olmalı
+        file_distance_from_center = abs(3.5 - file)
+        rank_distance_from_center = abs(3.5 - rank)
+        
+        return -(file_distance_from_center + rank_distance_from_center) * 10
+
+
+class ThreatEvaluator:
+    """Tehdit, karşı atak ve değişim odaklı değerlendirme (arayüzün eski motoru)
+
+    Sırası gelen tarafın taşlarına bakar; materyal sayımı yapmaz.
+    """
+    MATE_SCORE = 10000
+
+    def __init__(self):
+        self.piece_values = PIECE_VALUES
+        self.tables = None
+
+    def evaluate(self, board, material):
+        """Pozisyonu sırası gelen taraf açısından değerlendir"""
+        piece_values = self.piece_values
+        score = 0
+        pieces = board.piece_map()
+        pawns = board.pawns
+        
+        # Yasal hamleleri bir kez üret ve kaynak kareye göre grupla
+        moves_by_square = {}
+        for move in board.legal_moves:
+            moves_by_square.setdefault(move.from_square, []).append(move)
+        
+        # Tehdit altındaki taşları ve karşı hamle fırsatlarını değerlendir
+        for square, piece in pieces.items():
+            if piece.color != board.turn:  # Rakip taşları değerlendir
+                continue
+                
+            value = piece_values[piece.piece_type]
+            piece_moves = moves_by_square.get(square, [])
+            
+            # Taşın alma hamleleri: (alınan taşın değeri, SEE kazancı)
+            captures = []
+            for move in piece_moves:
+                if board.is_capture(move):
+                    target_type = board.piece_type_at(move.to_square) or chess.PAWN
+                    captures.append((piece_values[target_type], see(board, move, piece_values)))
+            
+            # Taş tehdit altında mı kontrol et (şah hariç, şah çekme ayrı ele alınır)
+            attackers = board.attackers_mask(not piece.color, square)
+            if attackers and piece.piece_type != chess.KING:
+                attacker_type, _ = least_valuable_attacker(board, attackers)
+                min_attacker_value = piece_values[attacker_type]
+                # Rakibin bu taşı almasının statik kazancı (x-ray dahil)
+                threat = see_threat(board, square, piece_values)
+                
+                if captures:
+                    best_target_value = max(target for target, _ in captures)
+                    is_any_safe_attack = any(gain >= 0 for _, gain in captures)
+                
+                # Karşı atak stratejisi: değerli bir karşı atak yapılabiliyorsa
+                if captures and best_target_value >= min_attacker_value:
+                    if is_any_safe_attack:
+                        score += best_target_value * 2  # Güvenli karşı atağa yüksek bonus
+                    else:
+                        score += best_target_value  # Riskli ama değerli karşı atak
+                        
+                # Asılı taş: değişim rakibe materyal kazandırıyor
+                elif threat > 0:
+                    if threat < value:
+                        score -= value // 2  # Zayıf savunulan taş
+                    else:
+                        score -= value  # Savunmasız taş
+                        
+                # Değersiz taşla saldırı stratejisi
+                elif captures and best_target_value > value:
+                    score += best_target_value - value  # Karlı değişim
+                            
+            # Taş yeme hamleleri
+            for target_value, gain in captures:
+                if gain >= 0:  # Değişim sonunda kayıp yok
+                    if target_value > value:
+                        score += (target_value - value) * 2  # Karlı ve güvenli değişim
+                    else:
+                        score += target_value  # Normal taş yeme
+                else:
+                    if target_value > value:
+                        score += target_value - value  # Riskli ama karlı değişim
+                        
+            # Pozisyon iyileştirme
+            for move in piece_moves:
+                if board.is_capture(move):
+                    continue
+                # Merkez kontrolü
+                to_file = chess.square_file(move.to_square)
+                to_rank = chess.square_rank(move.to_square)
+                center_distance = abs(3.5 - to_file) + abs(3.5 - to_rank)
+                
+                if center_distance <= 2:  # Merkeze yakın hamle
+                    score += (4 - center_distance) * 5
+                    
+                # Açık hat kontrolü (kaleler için)
+                if piece.piece_type == chess.ROOK and not pawns & chess.BB_FILES[to_file]:
+                    score += 20
+        
+        return score
@@ -0,0 +1,285 @@
+import calendar
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+import chess
+import chess.pgn
+
+# Dosya başlığı: sihirli sayı ve biçim sürümü
+ARCHIVE_MAGIC = b"CGA1"
+
+# Oyun kaydı başlığı: hamle sayısı, sonuç, bayraklar, başlangıç zamanı (unix;
+# 0 bilinmiyor), süre (ms), hamle başına süre sınırı (ms); ardından beyaz, siyah
+# ve zorluk adları (1 bayt uzunluk + UTF-8), isteğe bağlı başlangıç FEN'i (2 bayt
+# uzunluk) ve hamle başına 16 bit
+RECORD_STRUCT = struct.Struct(">HBBIII")
+
+RESULTS = ("*", "1-0", "0-1", "1/2-1/2")
+FLAG_FEN = 1
+
+# Arayüzün bitmiş oyunları eklediği arşiv
+ARCHIVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games.cga")
+
+# Çözülen hamleler paylaşılır; her kod için bir kez chess.Move oluşturulur
+_MOVE_TABLE = [None] * 0x10000
+
+
+def pack_move(move):
+    """Hamleyi 16 bite sığdır: varış (6 bit), kalkış (6 bit), terfi taşı (3 bit)"""
+    return move.to_square | (move.from_square << 6) | ((move.promotion or 0) << 12)
+
+
+def unpack_move(code):
+    """16 bitlik kodu chess.Move'a çevir"""
+    move = _MOVE_TABLE[code]
+    if move is None:
+        promotion = (code >> 12) & 0x7
+        move = _MOVE_TABLE[code] = chess.Move((code >> 6) & 0x3f, code & 0x3f,
+                                              promotion or None)
+    return move
+
+
+def _pack_name(name):
+    data = (name or "").encode("utf-8")[:255]
+    return bytes((len(data),)) + data
+
+
+class ArchivedGame:
+    """Arşivden okunan oyun; hamleler istendiğinde çözülür"""
+
+    __slots__ = ("result", "white", "black", "difficulty", "start_time", "duration",
+                 "time_limit", "fen", "_moves")
+
+    def __init__(self, result, white, black, difficulty, start_time, duration, time_limit,
+                 fen, moves):
+        self.result = result
+        self.white = white
+        self.black = black
+        self.difficulty = difficulty
+        self.start_time = start_time
+        self.duration = duration
+        self.time_limit = time_limit
+        self.fen = fen
+        self._moves = moves
+
+    def __len__(self):
+        return len(self._moves) // 2
+
+    def move_codes(self):
+        """Hamlelerin 16 bitlik kodları"""
+        codes = array("H")
+        codes.frombytes(self._moves)
+        if sys.byteorder == "little":
+            codes.byteswap()
+        return codes
+
+    def moves(self):
+        """Hamleler chess.Move listesi olarak"""
+        table = _MOVE_TABLE
+        return [table[code] or unpack_move(code) for code in self.move_codes()]
+
+    def board(self):
+        """Oyunun son pozisyonu"""
+        board = chess.Board(self.fen) if self.fen else chess.Board()
+        for move in self.moves():
+            board.push(move)
+        return board
+
+    def to_pgn(self):
+        """Oyunu chess.pgn.Game olarak döndür"""
+        board = chess.Board(self.fen) if self.fen else chess.Board()
+        game = chess.pgn.Game.from_board(board)
+        node = game
+        for move in self.moves():
+            node = node.add_variation(move)
+        game.headers["White"] = self.white
+        game.headers["Black"] = self.black
+        game.headers["Result"] = self.result
+        if self.start_time is not None:
+            game.headers["Date"] = time.strftime("%Y.%m.%d", time.localtime(self.start_time))
+        if self.difficulty:
+            game.headers["Difficulty"] = self.difficulty
+        return game
+
+
+class GameArchiveWriter:
+    """Oyunları arşiv dosyasının sonuna ekleyen yazıcı
+
+    Dosya yalnızca eklenerek büyür; her oyun tek bir write çağrısıyla yazılır.
+    Yazma yarıda kalırsa okuyucu son eksik kaydı atlar.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = open(path, "ab")
+        if self.handle.tell() == 0:
+            self.handle.write(ARCHIVE_MAGIC)
+
+    def append(self, moves, result="*", white="", black="", difficulty="", start_time=None,
+               duration=0.0, time_limit=None, fen=None):
+        """Oyunu ekle; süreler saniye cinsinden verilir"""
+        codes = array("H", [pack_move(move) for move in moves])
+        if sys.byteorder == "little":
+            codes.byteswap()
+        flags = FLAG_FEN if fen else 0
+        record = [
+            RECORD_STRUCT.pack(len(codes), RESULTS.index(result) if result in RESULTS else 0,
+                               flags, int(start_time if start_time is not None else time.time()),
+                               int(duration * 1000), int((time_limit or 0) * 1000)),
+            _pack_name(white), _pack_name(black), _pack_name(difficulty)
+        ]
+        if fen:
+            data = fen.encode("ascii")
+            record.append(struct.pack(">H", len(data)) + data)
+        record.append(codes.tobytes())
+        self.handle.write(b"".join(record))
+
+    def flush(self):
+        self.handle.flush()
+
+    def close(self):
+        self.handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def append_game(path, moves, **fields):
+    """Tek bir oyunu arşive ekle (dosyayı açıp kapatır)"""
+    with GameArchiveWriter(path) as writer:
+        writer.append(moves, **fields)
+
+
+def read_games(path):
+    """Arşivdeki oyunları sırayla üret
+
+    Dosya bellek eşlemeli okunur; hamleler çözülmeden ham baytlarıyla tutulur.
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size <= len(ARCHIVE_MAGIC):
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+                raise ValueError(f"Arşiv dosyası değil: {path}")
+            yield from _parse(data)
+
+
+def _parse(data):
+    unpack_from = RECORD_STRUCT.unpack_from
+    size = len(data)
+    offset = len(ARCHIVE_MAGIC)
+    while offset + RECORD_STRUCT.size <= size:
+        count, result, flags, start_time, duration, time_limit = unpack_from(data, offset)
+        offset += RECORD_STRUCT.size
+        names = []
+        for _ in range(3):
+            if offset >= size:
+                return
+            length = data[offset]
+            names.append(data[offset + 1:offset + 1 + length].decode("utf-8", "replace"))
+            offset += 1 + length
+        fen = None
+        if flags & FLAG_FEN:
+            if offset + 2 > size:
+                return
+            length = (data[offset] << 8) | data[offset + 1]
+            fen = data[offset + 2:offset + 2 + length].decode("ascii")
+            offset += 2 + length
+        end = offset + 2 * count
+        if end > size:
+            return  # Yarıda kalmış son kayıt
+        yield ArchivedGame(RESULTS[result] if result < len(RESULTS) else "*",
+                           names[0], names[1], names[2], start_time or None, duration / 1000,
+                           time_limit / 1000, fen, data[offset:end])
+        offset = end
+
+
+def _pgn_start_time(headers):
+    """PGN başlıklarındaki tarih ve saatten unix zamanı; tarih eksikse 0 (bilinmiyor)
+
+    UTCDate/UTCTime varsa onlar, yoksa yerel saat olarak Date/Time kullanılır.
+    """
+    for date_key, time_key, convert in (("UTCDate", "UTCTime", calendar.timegm),
+                                        ("Date", "Time", time.mktime)):
+        try:
+            date = time.strptime(headers[date_key], "%Y.%m.%d")
+        except (KeyError, ValueError):
+            continue  # Yok veya "????.??.??" gibi eksik
+        clock = (0, 0, 0)
+        try:
+            clock = time.strptime(headers[time_key], "%H:%M:%S")[3:6]
+        except (KeyError, ValueError):
+            pass
+        try:
+            timestamp = int(convert(date[:3] + clock + (0, 0, -1)))
+        except (OverflowError, ValueError):
+            return 0
+        # Kayıt alanı işaretsiz 32 bittir; 1970 öncesi tarihler saklanamaz
+        return timestamp if 0 < timestamp < 1 << 32 else 0
+    return 0
+
+
+def import_pgn(pgn_paths, archive_path):
+    """PGN dosyalarındaki oyunların ana varyantlarını arşive ekle; oyun sayısını döndür"""
+    games = 0
+    with GameArchiveWriter(archive_path) as writer:
+        for pgn_path in pgn_paths:
+            with open(pgn_path, encoding="utf-8", errors="replace") as handle:
+                while True:
+                    game = chess.pgn.read_game(handle)
+                    if game is None:
+                        break
+                    headers = game.headers
+                    fen = headers.get("FEN") if headers.get("SetUp") == "1" else None
+                    writer.append(game.mainline_moves(), headers.get("Result", "*"),
+                                  headers.get("White", ""), headers.get("Black", ""),
+                                  headers.get("Difficulty", ""),
+                                  start_time=_pgn_start_time(headers), fen=fen)
+                    games += 1
+    return games
+
+
+def export_pgn(archive_path, pgn_path):
+    """Arşivi PGN dosyasına yaz; oyun sayısını döndür"""
+    games = 0
+    with open(pgn_path, "w", encoding="utf-8") as handle:
+        for game in read_games(archive_path):
+            handle.write(str(game.to_pgn()) + "\n\n")
+            games += 1
+    return games
+
+
+def summary(archive_path):
+    """Oyun, hamle ve sonuç sayıları"""
+    results = dict.fromkeys(RESULTS, 0)
+    games = plies = 0
+    for game in read_games(archive_path):
+        games += 1
+        plies += len(game)
+        results[game.result] += 1
+    return {"games": games, "plies": plies, "results": results}
+
+
+if __name__ == "__main__":
+    # Kullanım:
+    #   python game_archive.py stats [arşiv.cga]
+    #   python game_archive.py import oyunlar.pgn [...] arşiv.cga
+    #   python game_archive.py export arşiv.cga oyunlar.pgn
+    args = sys.argv[1:]
+    if len(args) >= 3 and args[0] == "import":
+        print(f"{import_pgn(args[1:-1], args[-1])} oyun eklendi: {args[-1]}")
+    elif len(args) == 3 and args[0] == "export":
+        print(f"{export_pgn(args[1], args[2])} oyun yazıldı: {args[2]}")
+    elif args and args[0] == "stats":
+        print(summary(args[1] if len(args) > 1 else ARCHIVE_PATH))
+    else:
+        print("Kullanım: python game_archive.py stats [arşiv.cga] | "
+              "import oyunlar.pgn [...] arşiv.cga | export arşiv.cga oyunlar.pgn")
+        sys.exit(1)
@@ -0,0 +1,107 @@
+import chess
+
+
+class IncrementalEvaluator:
+    """Materyal ve konum tablosu toplamını hamle farkıyla güncel tutar
+
+    Skor her zaman beyaz açısındandır. Arama her board.push öncesinde
+    push(board, move), her board.pop sonrasında pop() çağırır; yaprakta
+    score O(1) okunur.
+    """
+
+    def __init__(self, piece_values, tables=None, table_weight=0.1):
+        tables = tables or {}
+        # values[renk][taş türü][kare] = işaretli materyal + konum değeri
+        self.values = {}
+        for color in chess.COLORS:
+            sign = 1 if color else -1
+            self.values[color] = {}
+            for piece_type, piece_value in piece_values.items():
+                table = tables.get(piece_type)
+                row = []
+                for square in chess.SQUARES:
+                    position_value = 0
+                    if table is not None:
+                        position_value = table[square if color else 63 - square]
+                    row.append(sign * (piece_value + position_value * table_weight))
+                self.values[color][piece_type] = row
+        # Arama reset ile eşitleyene kadar skor tahtadan hesaplanır
+        self.release()
+
+    def compute(self, board):
+        """Skoru baştan hesapla"""
+        value = 0
+        for color in chess.COLORS:
+            for piece_type, row in self.values[color].items():
+                for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                    value += row[square]
+        return value
+
+    def reset(self, board):
+        """Değerlendiriciyi verilen tahtayla eşitle"""
+        self.stack = [self.compute(board)]
+        self.base_ply = len(board.move_stack)
+        self.board = board
+
+    def release(self):
+        """Arama bitti; sonraki çağrılar tahtadan yeniden hesaplar"""
+        self.stack = [0]
+        self.base_ply = -1
+        self.board = None
+
+    @property
+    def score(self):
+        return self.stack[-1]
+
+    def current(self, board):
+        """Tahtayla eşitse artımlı skoru, değilse yeniden hesaplananı döndür
+
+        Eşitlik, reset'e verilen tahta nesnesi ve hamle sayısıyla anlaşılır;
+        başka bir tahta veya eşitlenmemiş değerlendirici her zaman hesaplar.
+        """
+        if board is self.board and self.base_ply + len(self.stack) - 1 == len(board.move_stack):
+            return self.stack[-1]
+        return self.compute(board)
+
+    def delta(self, board, move):
+        """Hamlenin skora etkisi (hamle yapılmadan önce çağrılır)"""
+        if not move:
+            return 0  # Null hamle taşları yerinden oynatmaz
+        color = board.turn
+        piece_type = board.piece_type_at(move.from_square)
+        own = self.values[color]
+        delta = -own[piece_type][move.from_square]
+
+        if move.promotion:
+            delta += own[move.promotion][move.to_square]
+        else:
+            delta += own[piece_type][move.to_square]
+
+        if piece_type == chess.KING and board.is_castling(move):
+            # Şah ve kale rok karelerine taşınır
+            rank_start = move.from_square & ~7
+            kingside = board.is_kingside_castling(move)
+            king_to = rank_start + (6 if kingside else 2)
+            rook_to = rank_start + (5 if kingside else 3)
+            if board.rooks & board.occupied_co[color] & chess.BB_SQUARES[move.to_square]:
+                rook_from = move.to_square  # Chess960 gösterimi: şah kaleyi "alır"
+            else:
+                rook_from = rank_start + (7 if kingside else 0)
+            return (own[chess.KING][king_to] - own[chess.KING][move.from_square] +
+                    own[chess.ROOK][rook_to] - own[chess.ROOK][rook_from])
+
+        captured_type = board.piece_type_at(move.to_square)
+        if captured_type:
+            delta -= self.values[not color][captured_type][move.to_square]
+        elif piece_type == chess.PAWN and move.to_square == board.ep_square:
+            captured_square = move.to_square - 8 if color else move.to_square + 8
+            delta -= self.values[not color][chess.PAWN][captured_square]
+        return delta
+
+    def push(self, board, move):
+        """Hamle yapılmadan önce skoru güncelle"""
+        self.stack.append(self.stack[-1] + self.delta(board, move))
+
+    def pop(self):
+        """Geri alınan hamlenin skorunu at"""
+        self.stack.pop()
@@ -0,0 +1,39 @@
+import chess
+
+
+def mobility(board):
+    """Her iki tarafın hamle sayısını saldırı bitboard'larından yaklaşık hesapla
+
+    Yasal hamle listesi üretilmez; açmazlar ve şah tehdidi dikkate alınmaz.
+    (beyaz, siyah) döndürür.
+    """
+    occupied = board.occupied
+    empty = ~occupied & chess.BB_ALL
+    pawns = board.pawns
+    counts = []
+    for color in chess.COLORS:
+        own = board.occupied_co[color]
+        enemy = board.occupied_co[not color]
+        count = 0
+
+        # Taşlar: saldırdığı ve kendi taşının olmadığı kareler
+        for square in chess.scan_forward(own & ~pawns):
+            count += chess.popcount(board.attacks_mask(square) & ~own)
+
+        # Piyonlar: tek ve çift ilerleme, çapraz alma
+        own_pawns = own & pawns
+        if color == chess.WHITE:
+            single = (own_pawns << 8) & empty
+            double = ((single & chess.BB_RANK_3) << 8) & empty
+            captures = (((own_pawns & ~chess.BB_FILE_A) << 7) |
+                        ((own_pawns & ~chess.BB_FILE_H) << 9)) & enemy
+        else:
+            single = (own_pawns >> 8) & empty
+            double = ((single & chess.BB_RANK_6) >> 8) & empty
+            captures = (((own_pawns & ~chess.BB_FILE_A) >> 9) |
+                        ((own_pawns & ~chess.BB_FILE_H) >> 7)) & enemy
+        count += chess.popcount(single) + chess.popcount(double) + chess.popcount(captures)
+        counts.append(count)
+
+    # chess.COLORS = [WHITE, BLACK]
+    return counts[0], counts[1]
@@ -0,0 +1,84 @@
+import chess
+
+
+class LegalMoveIndex:
+    """Bir pozisyonun yasal hamleleri ve türetilen durumları
+
+    Yasal hamleler bir kez üretilir, kalkış karesine ve (kalkış, varış)
+    çiftine göre dizinlenir; terfi seçenekleri aynı çiftte tutulur. Şah,
+    oyun sonu ve sonuç bu listeden çıkarılır, SAN gösterimleri ilk
+    istendiklerinde hesaplanıp saklanır.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self.moves = list(board.generate_legal_moves())
+        self.by_from = {}
+        self.by_from_to = {}
+        for move in self.moves:
+            self.by_from.setdefault(move.from_square, []).append(move)
+            self.by_from_to.setdefault((move.from_square, move.to_square), []).append(move)
+        self.is_check = board.is_check()
+        if not self.moves:
+            self.is_checkmate = self.is_check
+            self.is_game_over = True
+        else:
+            self.is_checkmate = False
+            # board.is_game_over() ile aynı kurallar, hamle üretmeden
+            self.is_game_over = (board.is_insufficient_material() or
+                                 board.is_seventyfive_moves() or
+                                 board.is_fivefold_repetition())
+        self._san = {}
+
+    def from_square(self, square):
+        """Kareden çıkan yasal hamleler"""
+        return self.by_from.get(square, [])
+
+    def find(self, from_square, to_square):
+        """Kareler arasındaki yasal hamleler (terfide her taş için bir hamle)"""
+        return self.by_from_to.get((from_square, to_square), [])
+
+    def is_legal(self, move):
+        """Kalkış ve varış karesi yasal bir hamleyle eşleşiyor mu (terfi taşı önemsiz)"""
+        return (move.from_square, move.to_square) in self.by_from_to
+
+    def san(self, move):
+        """Hamlenin SAN gösterimi (pozisyon başına bir kez hesaplanır)"""
+        san = self._san.get(move)
+        if san is None:
+            san = self._san[move] = self.board.san(move)
+        return san
+
+    def result(self):
+        """Oyun bittiyse sonucu, bitmediyse "*" döndür"""
+        if not self.is_game_over:
+            return "*"
+        if self.is_checkmate:
+            return "0-1" if self.board.turn == chess.WHITE else "1-0"
+        return "1/2-1/2"
+
+
+class MoveIndexCache:
+    """Tahtanın güncel pozisyonu için LegalMoveIndex'i saklar
+
+    Tahta nesnesi, hamle sayısı ve son hamle değişince (push/pop veya yeni
+    tahta) dizin yeniden oluşturulur.
+    """
+
+    def __init__(self):
+        self.index = None
+        self.board = None
+        self.ply = None
+        self.last_move = None
+
+    def get(self, board):
+        """Tahtanın güncel pozisyonunun dizini"""
+        ply = len(board.move_stack)
+        last_move = board.move_stack[-1] if ply else None
+        if (self.index is None or board is not self.board or ply != self.ply or
+                last_move != self.last_move):
+            self.index = LegalMoveIndex(board)
+            self.board = board
+            self.ply = ply
+            self.last_move = last_move
+        return self.index
@@ -0,0 +1,147 @@
+import chess
+
+# Sıralama puanları: önce tablo hamlesi, sonra almalar, terfiler,
+# öldürücü hamleler, şah çeken hamleler ve geçmiş puanına göre sakin hamleler
+TT_MOVE_SCORE = 1000000
+CAPTURE_SCORE = 100000
+PROMOTION_SCORE = 90000
+KILLER_SCORE = 80000
+CHECK_SCORE = 70000
+HISTORY_LIMIT = 60000
+
+MAX_PLY = 128
+
+
+def gives_check(board, move):
+    """Hamle yapılmadan, hamlenin rakip şaha şah çekip çekmediğine bak
+
+    board.gives_check hamleyi yapıp geri alır. Burada taşın gittiği kareden
+    doğrudan şah ve kalkış karesinin açtığı hattan açık (discovered) şah
+    bitboard'larla sınanır; nadir görülen rok ve geçerken almada
+    board.gives_check kullanılır.
+    """
+    king = board.king(not board.turn)
+    if king is None:
+        return False
+    from_square = move.from_square
+    to_square = move.to_square
+    piece_type = move.promotion or board.piece_type_at(from_square)
+    if piece_type == chess.KING and board.is_castling(move):
+        return board.gives_check(move)
+    if piece_type == chess.PAWN and board.is_en_passant(move):
+        return board.gives_check(move)
+
+    king_mask = chess.BB_SQUARES[king]
+    occupied = (board.occupied & ~chess.BB_SQUARES[from_square]) | chess.BB_SQUARES[to_square]
+    if piece_type == chess.PAWN:
+        if chess.BB_PAWN_ATTACKS[board.turn][to_square] & king_mask:
+            return True
+    elif piece_type == chess.KNIGHT:
+        if chess.BB_KNIGHT_ATTACKS[to_square] & king_mask:
+            return True
+    elif piece_type != chess.KING and _slider_attacks(piece_type, to_square, occupied) & king_mask:
+        return True
+
+    # Açık şah: kalkış karesi şahla aynı hattaysa, boşalan kareden arkadaki
+    # kale, fil veya vezir şahı görebilir
+    if not chess.BB_RAYS[king][from_square]:
+        return False
+    ours = board.occupied_co[board.turn] & ~chess.BB_SQUARES[from_square]
+    queens = board.queens & ours
+    return bool(_slider_attacks(chess.ROOK, king, occupied) & (board.rooks & ours | queens) or
+                _slider_attacks(chess.BISHOP, king, occupied) & (board.bishops & ours | queens))
+
+
+def _slider_attacks(piece_type, square, occupied):
+    """Kale, fil veya vezirin verilen doluluktaki saldırı maskesi"""
+    attacks = 0
+    if piece_type in (chess.BISHOP, chess.QUEEN):
+        attacks |= chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+    if piece_type in (chess.ROOK, chess.QUEEN):
+        attacks |= (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] |
+                    chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied])
+    return attacks
+
+
+def mvv_lva(board, move):
+    """En değerli kurban / en değersiz saldıran puanı"""
+    victim = board.piece_type_at(move.to_square) or chess.PAWN  # Geçerken alma
+    attacker = board.piece_type_at(move.from_square)
+    return victim * 8 - attacker
+
+
+class MoveOrderer:
+    """Tüm arama düğümlerinde kullanılan hamle sıralayıcı
+
+    Almalar MVV-LVA ile, sakin hamleler ply başına öldürücü hamleler ve
+    renk/kaynak/hedef bazlı geçmiş tablosu ile sıralanır.
+    """
+
+    def __init__(self):
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [[[0] * 64 for _ in range(64)] for _ in chess.COLORS]
+        self.root_ply = 0
+
+    def new_search(self, board):
+        """Yeni aramaya başla: öldürücüleri temizle, geçmişi yaşlandır"""
+        self.root_ply = len(board.move_stack)
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self._age_history()
+
+    def _age_history(self):
+        """Geçmiş puanlarını yarıya indir"""
+        for color_table in self.history:
+            for row in color_table:
+                for to_square in range(64):
+                    row[to_square] >>= 1
+
+    def _ply(self, board):
+        return min(len(board.move_stack) - self.root_ply, MAX_PLY - 1)
+
+    def killer_moves(self, board):
+        """Pozisyonun ply'ındaki öldürücü hamleler"""
+        return self.killers[self._ply(board)]
+
+    def score(self, board, move, killers, tt_move=None):
+        """Tek bir hamlenin sıralama puanı"""
+        if move == tt_move:
+            return TT_MOVE_SCORE
+        if board.is_capture(move):
+            return CAPTURE_SCORE + mvv_lva(board, move)
+        if move.promotion:
+            return PROMOTION_SCORE + move.promotion
+        if move == killers[0]:
+            return KILLER_SCORE + 1
+        if move == killers[1]:
+            return KILLER_SCORE
+        if gives_check(board, move):
+            return CHECK_SCORE
+        return self.history[board.turn][move.from_square][move.to_square]
+
+    def order(self, board, moves=None, tt_move=None):
+        """Hamleleri iyiden kötüye sıralanmış liste olarak döndür"""
+        if moves is None:
+            moves = board.legal_moves
+        killers = self.killer_moves(board)
+        return sorted(moves, key=lambda move: self.score(board, move, killers, tt_move),
+                      reverse=True)
+
+    def order_captures(self, board, moves=None):
+        """Alma hamlelerini MVV-LVA ile sırala"""
+        if moves is None:
+            moves = board.generate_legal_captures()
+        return sorted(moves, key=lambda move: mvv_lva(board, move), reverse=True)
+
+    def record_cutoff(self, board, move, depth):
+        """Beta kesmesi yapan sakin hamleyi öldürücü ve geçmiş tablosuna yaz"""
+        if board.is_capture(move) or move.promotion:
+            return
+        killers = self.killers[self._ply(board)]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        row = self.history[board.turn][move.from_square]
+        row[move.to_square] += depth * depth
+        if row[move.to_square] > HISTORY_LIMIT:
+            # Şah çeken hamlelerin önüne geçmemesi için tabloyu küçült
+            self._age_history()
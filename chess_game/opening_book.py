@@ -0,0 +1,331 @@
+import heapq
+import io
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+
+import chess
+import chess.pgn
+import chess.polyglot
+
+# Polyglot kaydı: Zobrist anahtarı, hamle, ağırlık, öğrenme (büyük endian, 16 bayt)
+ENTRY_STRUCT = struct.Struct(">QHHI")
+ENTRY_SIZE = ENTRY_STRUCT.size
+MAX_WEIGHT = 0xFFFF
+
+# Kitap oluştururken diske yazılan ara kayıt: anahtar, hamle, ağırlık, oyun sayısı
+CHUNK_STRUCT = struct.Struct(">QHII")
+
+
+def encode_move(board, move):
+    """Hamleyi Polyglot biçiminde 16 bit tamsayıya çevir
+
+    Rok, şahın kendi kalesini alması olarak yazılır (e1h1).
+    """
+    to_square = move.to_square
+    if board.is_castling(move) and not board.chess960:
+        rook_file = 7 if chess.square_file(to_square) > chess.square_file(move.from_square) else 0
+        to_square = chess.square(rook_file, chess.square_rank(move.from_square))
+    promotion = move.promotion - 1 if move.promotion else 0
+    return to_square | (move.from_square << 6) | (promotion << 12)
+
+
+def decode_move(board, raw_move):
+    """Polyglot hamlesini verilen pozisyon için chess.Move'a çevir"""
+    to_square = raw_move & 0x3f
+    from_square = (raw_move >> 6) & 0x3f
+    promotion = (raw_move >> 12) & 0x7
+    if (not board.chess960 and board.piece_type_at(from_square) == chess.KING and
+            board.occupied_co[board.turn] & chess.BB_SQUARES[to_square]):
+        # Şah kendi kalesine gidiyorsa bu bir roktur
+        to_file = 6 if chess.square_file(to_square) > chess.square_file(from_square) else 2
+        to_square = chess.square(to_file, chess.square_rank(from_square))
+    return chess.Move(from_square, to_square, promotion + 1 if promotion else None)
+
+
+class OpeningBook:
+    """Zobrist anahtarına göre sıralı, sabit genişlikli kayıtlardan oluşan kitap
+
+    Dosya bellek eşlemeli (mmap) açılır; aramalar ikili arama ile O(log n)
+    yapılır ve anahtar pozisyona bağlı olduğu için sıra değişiklikleri
+    (transpozisyonlar) da bulunur.
+    """
+
+    def __init__(self, data, handle=None):
+        self.data = data
+        self.handle = handle
+        self.count = len(data) // ENTRY_SIZE
+
+    @classmethod
+    def open(cls, path):
+        """Kitap dosyasını bellek eşlemeli aç"""
+        handle = open(path, "rb")
+        if os.fstat(handle.fileno()).st_size == 0:
+            return cls(b"", handle)
+        return cls(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ), handle)
+
+    @classmethod
+    def from_lines(cls, lines):
+        """UCI hamle dizilerinden bellekte kitap oluştur"""
+        builder = BookBuilder()
+        for line in lines:
+            board = chess.Board()
+            keyed_moves = []
+            for uci in line:
+                move = chess.Move.from_uci(uci)
+                keyed_moves.append((chess.polyglot.zobrist_hash(board),
+                                    encode_move(board, move), board.turn))
+                board.push(move)
+            builder.add_game(keyed_moves, "*")
+        return cls(builder.to_bytes())
+
+    def close(self):
+        """Dosyayı ve eşlemeyi kapat"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        if self.handle is not None:
+            self.handle.close()
+        self.data = b""
+        self.handle = None
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _bisect(self, key):
+        """Anahtarın ilk kaydının indeksi"""
+        lo = 0
+        hi = self.count
+        unpack_from = ENTRY_STRUCT.unpack_from
+        data = self.data
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if unpack_from(data, mid * ENTRY_SIZE)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def entries(self, board):
+        """Pozisyonun (hamle, ağırlık) kayıtlarını üret"""
+        key = chess.polyglot.zobrist_hash(board)
+        index = self._bisect(key)
+        while index < self.count:
+            entry_key, raw_move, weight, _ = ENTRY_STRUCT.unpack_from(self.data, index * ENTRY_SIZE)
+            if entry_key != key:
+                break
+            yield decode_move(board, raw_move), weight
+            index += 1
+
+    def choose(self, board, rng=random):
+        """Ağırlıklara göre rastgele bir yasal kitap hamlesi seç (yoksa None)
+
+        Yasal olmayan kayıtlar (anahtar çakışması, bozuk rok kodu) seçimden
+        önce ayıklanır; seçim yalnızca yasal hamleler arasında yapılır.
+        """
+        candidates = [(move, weight) for move, weight in self.entries(board)
+                      if weight and board.is_legal(move)]
+        total = sum(weight for _, weight in candidates)
+        if not total:
+            return None
+
+        pick = rng.randrange(total)
+        for move, weight in candidates:
+            if pick < weight:
+                return move
+            pick -= weight
+        return None
+
+
+class BookBuilder:
+    """Oyunlardan kitap kayıtlarını toplayan akışlı oluşturucu
+
+    Pozisyon/hamle sayaçları bellekte tutulur; chunk_entries aşılınca sıralanıp
+    geçici dosyaya yazılır ve sonunda dosyalar birleştirilir. Böylece büyük
+    PGN arşivleri belleğe sığmasa da işlenebilir.
+    """
+
+    def __init__(self, chunk_entries=1000000, min_count=1):
+        self.chunk_entries = chunk_entries
+        self.min_count = min_count
+        self.counts = {}
+        self.chunks = []
+        self.games = 0
+
+    def add_game(self, keyed_moves, result):
+        """Oyunun (anahtar, hamle, sıra) dizisini sonucuyla birlikte ekle
+
+        Ağırlık: hamleyi yapan taraf kazandıysa 2, beraberlikte 1, yenildiyse 0.
+        Sonuç bilinmiyorsa ("*") her hamle 1 sayılır.
+        """
+        self.games += 1
+        for key, raw_move, turn in keyed_moves:
+            if result == "*" or result == "1/2-1/2":
+                score = 1
+            elif (result == "1-0") == turn:
+                score = 2
+            else:
+                score = 0
+            entry = self.counts.get((key, raw_move))
+            if entry is None:
+                self.counts[(key, raw_move)] = [score, 1]
+            else:
+                entry[0] += score
+                entry[1] += 1
+        if len(self.counts) >= self.chunk_entries:
+            self._spill()
+
+    def _spill(self):
+        """Bellekteki sayaçları sıralı geçici dosyaya yaz"""
+        handle = tempfile.TemporaryFile()
+        for (key, raw_move), (weight, count) in sorted(self.counts.items()):
+            handle.write(CHUNK_STRUCT.pack(key, raw_move, weight, count))
+        handle.seek(0)
+        self.chunks.append(handle)
+        self.counts = {}
+
+    @staticmethod
+    def _read_chunk(handle):
+        while True:
+            record = handle.read(CHUNK_STRUCT.size)
+            if len(record) < CHUNK_STRUCT.size:
+                return
+            yield CHUNK_STRUCT.unpack(record)
+
+    def _merged(self):
+        """Tüm kayıtları anahtar sırasıyla, aynı hamleleri toplayarak üret"""
+        memory = ((key, raw_move, weight, count)
+                  for (key, raw_move), (weight, count) in sorted(self.counts.items()))
+        streams = [self._read_chunk(handle) for handle in self.chunks] + [memory]
+        current = None
+        for key, raw_move, weight, count in heapq.merge(*streams):
+            if current is not None and current[0] == key and current[1] == raw_move:
+                current[2] += weight
+                current[3] += count
+                continue
+            if current is not None:
+                yield current
+            current = [key, raw_move, weight, count]
+        if current is not None:
+            yield current
+
+    def _positions(self):
+        """Pozisyon başına Polyglot kayıtlarını (anahtar, hamle, ağırlık) üret"""
+        group = []
+        for key, raw_move, weight, count in self._merged():
+            if group and group[0][0] != key:
+                yield from self._scaled(group)
+                group = []
+            if count >= self.min_count and weight > 0:
+                group.append((key, raw_move, weight))
+        if group:
+            yield from self._scaled(group)
+
+    @staticmethod
+    def _scaled(group):
+        """Ağırlıkları 16 bite sığdır, en ağır hamle önce gelecek şekilde sırala"""
+        top = max(weight for _, _, weight in group)
+        factor = MAX_WEIGHT / top if top > MAX_WEIGHT else 1
+        group.sort(key=lambda entry: entry[2], reverse=True)
+        for key, raw_move, weight in group:
+            yield key, raw_move, max(1, int(weight * factor))
+
+    def _write(self, handle):
+        entries = 0
+        for key, raw_move, weight in self._positions():
+            handle.write(ENTRY_STRUCT.pack(key, raw_move, weight, 0))
+            entries += 1
+        for chunk in self.chunks:
+            chunk.close()
+        self.chunks = []
+        self.counts = {}
+        return entries
+
+    def write(self, path):
+        """Kitabı dosyaya yaz (önce geçici dosyaya, sonra yerine taşı); kayıt sayısını döndür"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                entries = self._write(handle)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return entries
+
+    def to_bytes(self):
+        """Kitabı bayt dizisi olarak döndür"""
+        buffer = io.BytesIO()
+        self._write(buffer)
+        return buffer.getvalue()
+
+
+class _OpeningVisitor(chess.pgn.BaseVisitor):
+    """PGN oyununun ana varyantındaki ilk hamleleri (anahtar, hamle, sıra) olarak topla"""
+
+    def __init__(self, max_ply):
+        self.max_ply = max_ply
+
+    def begin_game(self):
+        self.keyed_moves = []
+        self.outcome = "*"
+        self.failed = False
+
+    def visit_header(self, tagname, tagvalue):
+        if tagname == "Result":
+            self.outcome = tagvalue
+
+    def begin_variation(self):
+        # Yan varyantlar kitaba girmez
+        return chess.pgn.SKIP
+
+    def visit_move(self, board, move):
+        if len(self.keyed_moves) < self.max_ply:
+            self.keyed_moves.append((chess.polyglot.zobrist_hash(board),
+                                     encode_move(board, move), board.turn))
+
+    def handle_error(self, error):
+        self.failed = True
+
+    def result(self):
+        return self.keyed_moves, self.outcome, self.failed
+
+
+def build_book(pgn_paths, book_path, max_ply=20, min_count=1, chunk_entries=1000000):
+    """PGN dosyalarını oyun oyun okuyup kitap dosyası oluştur
+
+    (oyun sayısı, kayıt sayısı) döndürür.
+    """
+    builder = BookBuilder(chunk_entries, min_count)
+    for pgn_path in pgn_paths:
+        with open(pgn_path, encoding="utf-8", errors="replace") as handle:
+            while True:
+                parsed = chess.pgn.read_game(handle, Visitor=lambda: _OpeningVisitor(max_ply))
+                if parsed is None:
+                    break
+                keyed_moves, outcome, failed = parsed
+                if not failed and keyed_moves:
+                    builder.add_game(keyed_moves, outcome)
+    games = builder.games
+    return games, builder.write(book_path)
+
+
+if __name__ == "__main__":
+    # Kullanım: python opening_book.py kitap.bin oyunlar.pgn [diğer.pgn ...] [--max-ply N] [--min-count K]
+    args = sys.argv[1:]
+    options = {"--max-ply": 20, "--min-count": 1}
+    for option in options:
+        if option in args:
+            index = args.index(option)
+            options[option] = int(args[index + 1])
+            del args[index:index + 2]
+    if len(args) < 2:
+        print("Kullanım: python opening_book.py kitap.bin oyunlar.pgn [...] "
+              "[--max-ply N] [--min-count K]")
+        sys.exit(1)
+    games, entries = build_book(args[1:], args[0], options["--max-ply"], options["--min-count"])
+    print(f"{games} oyun işlendi, {entries} kayıt yazıldı: {args[0]}")
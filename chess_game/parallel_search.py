@@ -0,0 +1,95 @@
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# Her işçi süreçte bir kez oluşturulan motor; TT görevler arasında korunur
+_worker_engine = None
+# Ana sürecin süren görevleri durdurmak için kurduğu ortak olay
+_stop_event = None
+
+# Ana süreç işçileri beklerken süreyi ve durdurma isteğini bu aralıkla denetler
+POLL_INTERVAL = 0.01
+
+
+def _init_worker(engine_class, engine_kwargs, stop_event):
+    """İşçi süreç başlarken kendi motorunu kur"""
+    global _worker_engine, _stop_event
+    _worker_engine = engine_class(**engine_kwargs)
+    _stop_event = stop_event
+
+
+def _search_root_move(board, move, depth, alpha, deadline, fresh):
+    """İşçide tek bir kök hamlesini ara: (skor veya None, düğüm, sakin düğüm)"""
+    return _worker_engine._search_root_move(board, move, depth, alpha, deadline, fresh,
+                                            _stop_event)
+
+
+class RootSplitSearch:
+    """Kök hamlelerini süreç havuzundaki işçilere dağıtan paralel arama
+
+    İlk hamle ana süreçte aranır ve bulunan skor diğer hamlelere alfa sınırı
+    olarak verilir. Her hamle (alfa, +sonsuz) penceresinde arandığı için
+    alfayı geçen skorlar kesindir ve sıralı aramayla aynı hamle seçilir.
+
+    İşçiler ana aramanın mutlak deadline'ını kullanır; kuyrukta bekleyen
+    görevler yeni süre almaz. Ana süreç beklerken saatini denetler, süre
+    dolunca veya arama durdurulunca ortak olayla süren görevleri de keser.
+    """
+
+    def __init__(self, engine_class, workers, engine_kwargs=None):
+        self.engine_class = engine_class
+        self.workers = workers
+        self.engine_kwargs = engine_kwargs or {}
+        self.pool = None
+        self.stop_event = None
+
+    def _get_pool(self):
+        """Havuzu ilk kullanımda oluştur, sonraki hamlelerde yeniden kullan"""
+        if self.pool is None:
+            self.stop_event = multiprocessing.Event()
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.engine_class, self.engine_kwargs, self.stop_event)
+            )
+        return self.pool
+
+    def search(self, board, depth, moves, alpha, clock, fresh=False):
+        """Hamleleri paralel ara; clock ana aramanın saatidir
+
+        (sonuçlar, tamamlandı mı) döndürür; sonuçlar hamle sırasıyla
+        (skor, düğüm, sakin düğüm) üçlüleridir. Süre dolarsa veya arama
+        durdurulursa liste eksik kalır.
+        """
+        pool = self._get_pool()
+        self.stop_event.clear()
+        futures = [pool.submit(_search_root_move, board, move, depth, alpha, clock.deadline, fresh)
+                   for move in moves]
+        pending = set(futures)
+        completed = True
+        while pending:
+            done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            timed_out = any(future.result()[0] is None for future in done)
+            if timed_out or clock.stopped or (clock.armed and clock.expired()):
+                completed = False
+                break
+
+        if not completed:
+            # Başlamamış görevleri iptal et, süren görevleri durdurup bitmelerini bekle
+            self.stop_event.set()
+            for future in pending:
+                future.cancel()
+            wait(pending)
+
+        results = []
+        for future in futures:
+            if future.cancelled() or future.result()[0] is None:
+                break
+            results.append(future.result())
+        return results, completed and len(results) == len(futures)
+
+    def close(self):
+        """İşçi süreçleri kapat"""
+        if self.pool is not None:
+            self.stop_event.set()
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
@@ -1,53 +1,138 @@
+import hashlib
 import os
+import tempfile
+import warnings
 from PIL import Image, ImageTk
 
+# Taş kodları ve dosya adları (örn. 'wn' -> white_knight.png)
+PIECE_NAMES = {'p': 'pawn', 'r': 'rook', 'n': 'knight', 'b': 'bishop', 'q': 'queen', 'k': 'king'}
+COLOR_NAMES = {'w': 'white', 'b': 'black'}
+PIECE_CODES = [color + piece for color in COLOR_NAMES for piece in PIECE_NAMES]
+
+# Arayüzün kullandığı taş boyutu (piksel)
+PIECE_SIZE = 50
+
+# Boyutlandırılmış taş görüntülerinin saklandığı dizin
+SPRITE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sprite_cache")
+
+
 class PieceLoader:
-    def __init__(self, size=64):
+    """Taş görüntülerini boyut başına tek bir atlas dosyasından yükleyen önbellek
+
+    Her boyut için 12 taş yan yana tek bir PNG'ye (atlas) yazılır; dosya adı
+    kaynak görüntülerin özetini ve boyutu içerir, kaynaklar değişince yeni
+    atlas üretilir. Görüntüler ilk istendiklerinde yüklenir; kaynaklar en
+    fazla bir kez açılır, böylece tahta yeniden boyutlandırıldığında yalnızca
+    yeni boyutun atlası üretilir.
+    """
+
+    def __init__(self, size=64, piece_path=None, cache_dir=None):
         self.piece_size = size
+        self.piece_path = piece_path or os.path.join(os.path.dirname(__file__), "pieces")
+        self.cache_dir = cache_dir or SPRITE_CACHE_DIR
         self.pieces = {}
-        self.piece_path = os.path.join(os.path.dirname(__file__), "pieces")
-        self.load_pieces()
-
-    def load_pieces(self):
-        # White pieces file names
-        white_pieces = {
-            'wp': 'white_pawn',
-            'wr': 'white_rook',
-            'wn': 'white_knight',
-            'wb': 'white_bishop',
-            'wq': 'white_queen',
-            'wk': 'white_king'
-        }
-
-        # Black pieces file names
-        black_pieces = {
-            'bp': 'black_pawn',
-            'br': 'black_rook',
-            'bn': 'black_knight',
-            'bb': 'black_bishop',
-            'bq': 'black_queen',
-            'bk': 'black_king'
-        }
-
-        # Load white pieces
-        for piece_code, piece_name in white_pieces.items():
-            image_path = os.path.join(self.piece_path, f"{piece_name}.png")
-            if os.path.exists(image_path):
-                img = Image.open(image_path)
-                img = img.resize((self.piece_size, self.piece_size), Image.Resampling.LANCZOS)
-                self.pieces[piece_code] = ImageTk.PhotoImage(img)
-            else:
-                print(f"File not found: {image_path}")
-
-        # Load black pieces
-        for piece_code, piece_name in black_pieces.items():
-            image_path = os.path.join(self.piece_path, f"{piece_name}.png")
-            if os.path.exists(image_path):
-                img = Image.open(image_path)
-                img = img.resize((self.piece_size, self.piece_size), Image.Resampling.LANCZOS)
-                self.pieces[piece_code] = ImageTk.PhotoImage(img)
+        self.atlases = {}
+        self.sources = None
+        self.paths = self._find_sources()
+        self.source_hash = self._hash_sources()
+
+    def _find_sources(self):
+        """Kaynak PNG dosyalarını bul (white_pawn.png veya wp.png)"""
+        paths = {}
+        for code in PIECE_CODES:
+            name = f"{COLOR_NAMES[code[0]]}_{PIECE_NAMES[code[1]]}"
+            for file_name in (f"{name}.png", f"{code}.png"):
+                image_path = os.path.join(self.piece_path, file_name)
+                if os.path.exists(image_path):
+                    paths[code] = image_path
+                    break
             else:
-                print(f"File not found: {image_path}")
+                # Eksik taş görüntüsü tahtada boş kalır; arayüzü durdurmaz
+                warnings.warn(f"File not found: {os.path.join(self.piece_path, name + '.png')}",
+                              stacklevel=3)
+        return paths
+
+    def _hash_sources(self):
+        """Kaynak dosyaların içeriğinden atlas anahtarı üret (görüntüler çözülmez)"""
+        digest = hashlib.sha1()
+        for code in PIECE_CODES:
+            digest.update(code.encode())
+            if code in self.paths:
+                with open(self.paths[code], "rb") as handle:
+                    digest.update(handle.read())
+        return digest.hexdigest()[:16]
 
-    def get_piece_image(self, piece_code):
-        return self.pieces.get(piece_code)
+    def atlas_path(self, size):
+        return os.path.join(self.cache_dir, f"pieces_{size}_{self.source_hash}.png")
+
+    def _atlas(self, size):
+        """Boyutun atlasını diskten yükle, yoksa kaynaklardan üretip kaydet"""
+        atlas = self.atlases.get(size)
+        if atlas is not None:
+            return atlas
+        path = self.atlas_path(size)
+        try:
+            with Image.open(path) as cached:
+                atlas = cached.convert("RGBA")
+        except (OSError, ValueError):
+            atlas = self._build_atlas(size)
+            self._save_atlas(atlas, path)
+        self.atlases[size] = atlas
+        return atlas
+
+    def _build_atlas(self, size):
+        """Kaynakları bir kez çöz, istenen boyuta getirip yan yana diz"""
+        if self.sources is None:
+            self.sources = {}
+            for code, image_path in self.paths.items():
+                with Image.open(image_path) as img:
+                    self.sources[code] = img.convert("RGBA")
+        atlas = Image.new("RGBA", (size * len(PIECE_CODES), size))
+        for index, code in enumerate(PIECE_CODES):
+            source = self.sources.get(code)
+            if source is not None:
+                atlas.paste(source.resize((size, size), Image.Resampling.LANCZOS),
+                            (index * size, 0))
+        return atlas
+
+    def _save_atlas(self, atlas, path):
+        """Atlası geçici dosyaya yazıp yerine taşı; yazılamazsa yalnızca bellekte kalır"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            # Düşük sıkıştırma: atlas küçük, yazma süresi ilk açılışa eklenir
+            with os.fdopen(fd, "wb") as handle:
+                atlas.save(handle, "PNG", compress_level=1)
+            os.replace(temp_path, path)
+        except OSError:
+            os.unlink(temp_path)
+
+    def get_sprite(self, piece_code, size=None):
+        """Taşın istenen boyuttaki PIL görüntüsü (kaynağı yoksa None)"""
+        if piece_code not in self.paths:
+            return None
+        size = size or self.piece_size
+        index = PIECE_CODES.index(piece_code)
+        return self._atlas(size).crop((index * size, 0, (index + 1) * size, size))
+
+    def get_piece_image(self, piece_code, size=None):
+        """Taşın Tk görüntüsü; ilk istendiğinde atlastan kesilir"""
+        size = size or self.piece_size
+        image = self.pieces.get((piece_code, size))
+        if image is None:
+            sprite = self.get_sprite(piece_code, size)
+            if sprite is None:
+                return None
+            image = self.pieces[(piece_code, size)] = ImageTk.PhotoImage(sprite)
+        return image
+
+    def prepare(self, size=None):
+        """Boyutun atlasını önceden üret (ilk açılışı hızlandırmak için)"""
+        self._atlas(size or self.piece_size)
+
+    def set_size(self, size):
+        """Varsayılan taş boyutunu değiştir (tahta yeniden boyutlandırıldığında)"""
+        self.piece_size = size
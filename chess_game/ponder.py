@@ -0,0 +1,114 @@
+import threading
+import time
+import chess.polyglot
+from search import SearchClock
+
+
+class Ponderer:
+    """Rakibin sırasında beklenen cevaba karşı arka planda düşünme
+
+    AI hamlesinden sonra motorun tablodaki ana varyantından rakibin cevabı
+    tahmin edilir ve ortaya çıkan pozisyon sınırsız süreyle aranır. Tahmin
+    tutarsa arama devralınıp süre sınırı konur; tutmazsa durdurulur ve
+    motorun transpozisyon tablosundaki kayıtlar sonraki aramada kullanılır.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.thread = None
+        self.clock = None
+        self.key = None
+        self.move = None
+        self.result = None
+        self.search_time = None
+        self.hit_time = None
+        self.time_limit = None
+        self.pondering = False
+        # İstatistikler: tahmin başına kazanılan süre (ıska için 0)
+        self.hits = 0
+        self.misses = 0
+        self.saved = []
+
+    def start(self, board):
+        """Tahmin edilen cevaptan sonraki pozisyonu aramaya başla, tahmini döndür"""
+        self.stop()
+        move = self.engine.ponder_move(board)
+        if move is None:
+            return None
+        ponder_board = board.copy()
+        ponder_board.push(move)
+        if ponder_board.is_game_over():
+            return None
+
+        self.move = move
+        self.key = chess.polyglot.zobrist_hash(ponder_board)
+        self.result = None
+        self.search_time = None
+        self.clock = SearchClock()
+        self.pondering = True
+        self.thread = threading.Thread(target=self._run, args=(ponder_board, self.clock),
+                                       daemon=True)
+        self.thread.start()
+        return move
+
+    def _run(self, board, clock):
+        """Arka plan iş parçacığında ponder araması"""
+        try:
+            self.result = self.engine.ponder(board, clock)
+        except Exception:
+            self.result = None
+        self.search_time = clock.elapsed()
+
+    def hit(self, board, time_limit):
+        """Rakip hamlesini tahminle karşılaştır
+
+        Tahmin tuttuysa süren aramaya ponder başlangıcından itibaren time_limit
+        kadar süre tanınır ve aramanın saati döner; sonuç finish() ile alınır.
+        Tutmadıysa arama durdurulur ve None döner.
+        """
+        if not self.pondering:
+            return None
+        if chess.polyglot.zobrist_hash(board) != self.key:
+            self.misses += 1
+            self.saved.append(0.0)
+            self.stop()
+            return None
+        # Arama artık rakip hamlesi için sürüyor; stop() onu kesmez
+        self.pondering = False
+        self.hits += 1
+        self.hit_time = time.perf_counter()
+        self.time_limit = time_limit
+        self.clock.set_limit(time_limit)
+        return self.clock
+
+    def finish(self):
+        """Devralınan aramanın bitmesini bekle ve hamlesini döndür"""
+        self.thread.join()
+        self.thread = None
+        # Normal arama en fazla süre sınırı kadar sürerdi; beklenen kısım çıkarılır
+        waited = time.perf_counter() - self.hit_time
+        self.saved.append(max(0.0, min(self.time_limit, self.search_time) - waited))
+        return self.result
+
+    def stop(self):
+        """Süren ponder aramasını durdur (istatistiklere yansımaz)"""
+        if self.pondering:
+            self.clock.stop()
+            self.thread.join()
+            self.thread = None
+            self.pondering = False
+
+    def hit_rate(self):
+        """Tahminlerin yüzde kaçı tuttu"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Sayaçları sözlük olarak döndür"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+            'saved_total': sum(self.saved),
+            'saved_per_move': sum(self.saved) / len(self.saved) if self.saved else 0.0
+        }
@@ -0,0 +1,172 @@
+import time
+
+# Zaman kontrolü bu kadar düğümde bir yapılır (2'nin kuvveti - 1)
+TIME_CHECK_MASK = 63
+
+# Sakin arama (quiescence) sınırları
+QUIESCENCE_MAX_PLY = 8         # Yapraktan itibaren en fazla alma zinciri
+QUIESCENCE_NODE_LIMIT = 2000   # Yaprak başına en fazla sakin arama düğümü
+DELTA_MARGIN = 200             # Delta budaması güvenlik payı
+
+# Null hamle budaması: sıra rakibe verilip derinlik bu kadar azaltılarak aranır
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_MIN_DEPTH = 3        # Daha sığ düğümlerde denenmez
+
+# Geç hamle azaltması (LMR): ilk hamlelerden sonraki sakin hamleler sığ aranır
+LMR_FULL_MOVES = 3             # Tam derinlikte aranan ilk hamle sayısı
+# 3 katlık düğümleri de azaltmak düğümleri yarıya indiriyor ama
+# tests/test_selective_search.py konum takımında hamle kaybettiriyor
+LMR_MIN_DEPTH = 4              # Daha sığ düğümler azaltılmaz
+LMR_REDUCTION = 1
+
+
+class SearchTimeout(Exception):
+    """Arama süresi dolduğunda fırlatılır"""
+
+
+class SearchClock:
+    """Bir aramanın düğüm sayacı, süre sınırı ve isteğe bağlı düğüm sınırı
+
+    Süre sınırı yerine mutlak bir deadline verilebilir. Zamanlar
+    time.monotonic ile ölçülür; bu saat sistem genelidir, böylece ana
+    süreçte hesaplanan deadline işçi süreçlerde de aynı anlama gelir
+    (perf_counter'ın başlangıç noktası süreçler arasında tanımsızdır).
+    stop_event verilirse (örn. multiprocessing.Event) başka bir süreçten de
+    durdurulabilir.
+    """
+
+    def __init__(self, time_limit=None, node_limit=None, deadline=None, stop_event=None):
+        self.start = time.monotonic()
+        if deadline is None and time_limit is not None:
+            deadline = self.start + time_limit
+        self.deadline = deadline
+        self.node_limit = node_limit
+        self.stop_event = stop_event
+        self.nodes = 0
+        self.qnodes = 0
+        self.leaf_qnodes = 0
+        self.stopped = False
+        # İlk iterasyon her zaman tamamlanır, böylece en az bir hamle olur
+        self.armed = False
+
+    def tick(self):
+        """Düğümü say, süre dolduysa SearchTimeout fırlat"""
+        self.nodes += 1
+        if not self.nodes & TIME_CHECK_MASK:
+            self.check()
+
+    def qtick(self):
+        """Sakin arama düğümünü say; yaprak bütçesi bitmediyse True döndür"""
+        self.qnodes += 1
+        self.leaf_qnodes += 1
+        if not self.qnodes & TIME_CHECK_MASK:
+            self.check()
+        return self.leaf_qnodes <= QUIESCENCE_NODE_LIMIT
+
+    def check(self):
+        """Arama durdurulduysa veya süre dolduysa SearchTimeout fırlat"""
+        if self.stopped or (self.stop_event is not None and self.stop_event.is_set()):
+            raise SearchTimeout()
+        if (self.armed and self.deadline is not None and
+                time.monotonic() > self.deadline):
+            raise SearchTimeout()
+        if (self.armed and self.node_limit is not None and
+                self.nodes + self.qnodes >= self.node_limit):
+            raise SearchTimeout()
+
+    def stop(self):
+        """Aramayı başka bir iş parçacığından durdur"""
+        self.stopped = True
+
+    def set_limit(self, time_limit):
+        """Süre sınırını aramanın başlangıcından itibaren sonradan koy"""
+        self.deadline = self.start + time_limit
+
+    def expired(self):
+        """Süre veya düğüm sınırı doldu ya da arama durduruldu mu?"""
+        if self.node_limit is not None and self.nodes + self.qnodes >= self.node_limit:
+            return True
+        if self.stop_event is not None and self.stop_event.is_set():
+            return True
+        return self.stopped or (self.deadline is not None and
+                                time.monotonic() > self.deadline)
+
+    def remaining(self):
+        """Kalan süre (saniye); süre sınırı yoksa None"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def elapsed(self):
+        """Aramanın başından beri geçen süre (saniye)"""
+        return time.monotonic() - self.start
+
+
+class SearchStats:
+    """Bir aramanın istatistikleri
+
+    Sayaçlar her zaman tutulur; değerlendirme ve hamle üretimi süreleri yalnızca
+    motorun profile seçeneği açıkken ölçülür.
+    """
+
+    def __init__(self):
+        # Tamamlanan her iterasyon: derinlik, skor, ana varyant, düğüm, süre
+        self.iterations = []
+        self.evals = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        # Null hamle denemeleri/kesmeleri, azaltılan hamleler ve yeniden aramalar
+        self.null_moves = 0
+        self.null_cutoffs = 0
+        self.reductions = 0
+        self.researches = 0
+        self.eval_time = 0.0
+        self.movegen_time = 0.0
+
+    def add_iteration(self, depth, score, pv, nodes, elapsed):
+        """Tamamlanan iterasyonu kaydet ve bilgisini döndür"""
+        info = {
+            'depth': depth,
+            'score': score,
+            'pv': pv,
+            'nodes': nodes,
+            'time': elapsed,
+        }
+        self.iterations.append(info)
+        return info
+
+    def nodes_per_depth(self):
+        """Her iterasyonda aranan düğüm sayısı (sakin arama dahil)"""
+        return [info['nodes'] for info in self.iterations]
+
+    def branching_factors(self):
+        """Ardışık iterasyonların düğüm oranı (etkin dallanma faktörü)"""
+        nodes = self.nodes_per_depth()
+        return [current / previous for previous, current in zip(nodes, nodes[1:]) if previous]
+
+    def first_move_cutoff_rate(self):
+        """Beta kesmelerinin yüzde kaçı ilk denenen hamleyle oldu"""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def as_dict(self):
+        """İstatistikleri sözlük olarak döndür"""
+        return {
+            'iterations': self.iterations,
+            'nodes_per_depth': self.nodes_per_depth(),
+            'branching_factors': self.branching_factors(),
+            'evals': self.evals,
+            'cutoffs': self.cutoffs,
+            'first_move_cutoff_rate': self.first_move_cutoff_rate(),
+            'null_moves': self.null_moves,
+            'null_cutoffs': self.null_cutoffs,
+            'reductions': self.reductions,
+            'researches': self.researches,
+            'eval_time': self.eval_time,
+            'movegen_time': self.movegen_time,
+        }
+
+
+def unwind(board, ply):
+    """Yarıda kesilen aramanın yaptığı hamleleri geri al"""
+    while len(board.move_stack) > ply:
+        board.pop()
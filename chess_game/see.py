@@ -0,0 +1,78 @@
+import chess
+
+
+def least_valuable_attacker(board, attackers):
+    """Saldıranlar arasından en değersiz taşın (tür, kare) bilgisini döndür"""
+    for piece_type in chess.PIECE_TYPES:
+        mask = attackers & (board.pieces_mask(piece_type, chess.WHITE) |
+                            board.pieces_mask(piece_type, chess.BLACK))
+        if mask:
+            return piece_type, chess.lsb(mask)
+    return None, None
+
+
+def _swap(board, square, from_square, attacker_type, captured_value, side, occupied, piece_values):
+    """Karedeki alma-karşı alma zincirinin ilk alan taraf için net kazancı"""
+    gains = [captured_value]
+    occupied &= ~chess.BB_SQUARES[from_square]
+    # Sıra rakipte; arkadaki kaleler/filler (x-ray) maskeyle yeniden görünür
+    side = not side
+    while True:
+        attackers = board.attackers_mask(side, square, occupied) & occupied
+        if not attackers:
+            break
+        next_type, next_square = least_valuable_attacker(board, attackers)
+        if next_type == chess.KING and \
+                board.attackers_mask(not side, square, occupied) & occupied:
+            # Şah korunan kareye giremez
+            break
+        # Bu taraf alırsa kazancı: alınan taşın değeri - önceki kazanç
+        gains.append(piece_values[attacker_type] - gains[-1])
+        attacker_type = next_type
+        occupied &= ~chess.BB_SQUARES[next_square]
+        side = not side
+
+    # Her taraf zinciri istediği yerde bırakabilir
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
+
+
+def see(board, move, piece_values):
+    """Alma hamlesinin statik değişim değerlendirmesi (hamleyi yapmadan)
+
+    Hamleyi yapan taraf açısından net materyal kazancı döndürür.
+    """
+    to_square = move.to_square
+    attacker_type = board.piece_type_at(move.from_square)
+    occupied = board.occupied
+    captured_type = board.piece_type_at(to_square)
+    if captured_type is None and attacker_type == chess.PAWN and to_square == board.ep_square:
+        # Geçerken alma: alınan piyon başka karede
+        captured_type = chess.PAWN
+        occupied &= ~chess.BB_SQUARES[to_square - 8 if board.turn else to_square + 8]
+    captured_value = piece_values[captured_type] if captured_type else 0
+    if move.promotion:
+        captured_value += piece_values[move.promotion] - piece_values[chess.PAWN]
+        attacker_type = move.promotion
+    return _swap(board, to_square, move.from_square, attacker_type, captured_value,
+                 board.turn, occupied, piece_values)
+
+
+def see_threat(board, square, piece_values):
+    """Karedeki taşı rakibin en değersiz taşıyla almasının statik kazancı
+
+    Taşın sahibi açısından beklenen kayıp olarak okunur; 0 veya altı güvenli.
+    """
+    piece = board.piece_at(square)
+    if piece is None:
+        return 0
+    side = not piece.color
+    attackers = board.attackers_mask(side, square)
+    if not attackers:
+        return 0
+    attacker_type, from_square = least_valuable_attacker(board, attackers)
+    if attacker_type == chess.KING and board.attackers_mask(piece.color, square):
+        return 0
+    return _swap(board, square, from_square, attacker_type, piece_values[piece.piece_type],
+                 side, board.occupied, piece_values)
@@ -0,0 +1,154 @@
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import chess
+import chess.pgn
+
+from engines import ENGINES, create_engine
+from search import SearchClock
+
+# Arayüz (tkinter/PIL) yüklenmez; ekransız sunucularda çalışır
+
+
+def play_game(index, white, black, time_limit=0.1, max_depth=None, max_plies=300,
+              random_plies=0, seed=None):
+    """İki motor arasında bir oyun oynat
+
+    Her hamlenin süresi, tamamlanan derinliği ve düğüm sayısı hamle yorumuna
+    yazılır. (indeks, PGN metni, sonuç, (beyazın, siyahın) arama toplamları)
+    döndürür; toplamlar [aranan hamle, düğüm, derinlik] listesidir.
+    """
+    rng = random.Random(seed)
+    # Kolay seviye ve açılış kitabı modül düzeyindeki random'u kullanır
+    random.seed(seed)
+    engines = {chess.WHITE: create_engine(white), chess.BLACK: create_engine(black)}
+    board = chess.Board()
+    game = chess.pgn.Game()
+    game.headers["Event"] = "Self-play"
+    game.headers["Site"] = "selfplay.py"
+    game.headers["Date"] = time.strftime("%Y.%m.%d")
+    game.headers["Round"] = str(index + 1)
+    game.headers["White"] = white
+    game.headers["Black"] = black
+    game.headers["TimePerMove"] = str(time_limit)
+    node = game
+    searched = {chess.WHITE: [0, 0, 0], chess.BLACK: [0, 0, 0]}
+
+    # Aynı oyunların tekrarlanmaması için rastgele açılış hamleleri
+    for _ in range(random_plies):
+        moves = list(board.legal_moves)
+        if not moves:
+            break
+        move = rng.choice(moves)
+        board.push(move)
+        node = node.add_variation(move, comment="random")
+
+    termination = None
+    while not board.is_game_over(claim_draw=True):
+        if len(board.move_stack) >= max_plies:
+            termination = "max plies"
+            break
+        engine = engines[board.turn]
+        clock = SearchClock(time_limit)
+        start = time.perf_counter()
+        move = engine.get_best_move(board, time_limit=time_limit, max_depth=max_depth,
+                                    clock=clock)
+        elapsed = time.perf_counter() - start
+        if move is None:
+            termination = "no move"
+            break
+        # Kitap, tablo ve rastgele hamlelerde arama yapılmaz
+        depth = engine.completed_depth if clock.nodes else 0
+        nodes = clock.nodes + clock.qnodes
+        if clock.nodes:
+            totals = searched[board.turn]
+            totals[0] += 1
+            totals[1] += nodes
+            totals[2] += depth
+        board.push(move)
+        node = node.add_variation(
+            move, comment=f"time={elapsed:.3f} depth={depth} nodes={nodes}")
+
+    for engine in engines.values():
+        engine.close()
+
+    outcome = board.outcome(claim_draw=True)
+    if outcome is not None:
+        result = outcome.result()
+        termination = outcome.termination.name.lower()
+    else:
+        # Hamle sınırına ulaşan oyunlar berabere sayılır
+        result = "1/2-1/2"
+    game.headers["Result"] = result
+    game.headers["Termination"] = termination
+    return index, str(game), result, (searched[chess.WHITE], searched[chess.BLACK])
+
+
+def run_selfplay(engine_a, engine_b, games, output, workers=None, time_limit=0.1,
+                 max_depth=None, max_plies=300, random_plies=0, seed=0):
+    """Oyunları süreç havuzunda oynat, biten oyunları PGN dosyasına akıt
+
+    Renkler her oyunda değişir. Motor başına (galibiyet, beraberlik, yenilgi) döndürür;
+    sonda motorların hamle başına ortalama derinliği ve düğüm sayısı da yazılır.
+    """
+    scores = {engine_a: [0, 0, 0], engine_b: [0, 0, 0]}
+    if engine_a == engine_b:
+        scores = {engine_a: [0, 0, 0]}
+    search_totals = {name: [0, 0, 0] for name in scores}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(output, "a", encoding="utf-8") as handle:
+        futures = []
+        for index in range(games):
+            white, black = (engine_a, engine_b) if index % 2 == 0 else (engine_b, engine_a)
+            futures.append(pool.submit(play_game, index, white, black, time_limit, max_depth,
+                                       max_plies, random_plies, seed + index))
+        for done, future in enumerate(as_completed(futures), 1):
+            index, pgn, result, searched = future.result()
+            handle.write(pgn + "\n\n")
+            handle.flush()
+
+            white, black = (engine_a, engine_b) if index % 2 == 0 else (engine_b, engine_a)
+            for name, totals in zip((white, black), searched):
+                search_totals[name] = [a + b for a, b in zip(search_totals[name], totals)]
+            if result == "1-0":
+                scores[white][0] += 1
+                scores[black][2] += 1
+            elif result == "0-1":
+                scores[black][0] += 1
+                scores[white][2] += 1
+            else:
+                scores[white][1] += 1
+                scores[black][1] += 1
+            elapsed = time.perf_counter() - start
+            print(f"[{done}/{games}] {white} - {black}: {result} "
+                  f"({done / elapsed * 3600:,.0f} oyun/saat)")
+
+    for name, (wins, draws, losses) in scores.items():
+        moves, nodes, depth = search_totals[name]
+        print(f"{name:<12} +{wins} ={draws} -{losses}  "
+              f"derinlik {depth / max(moves, 1):.2f}, {nodes / max(moves, 1):,.0f} düğüm/hamle")
+    return scores
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Motorlar arasında ekransız oyunlar")
+    parser.add_argument("engine_a", choices=sorted(ENGINES))
+    parser.add_argument("engine_b", choices=sorted(ENGINES))
+    parser.add_argument("-n", "--games", type=int, default=10)
+    parser.add_argument("-o", "--output", default="selfplay.pgn")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("-t", "--time", type=float, default=0.1,
+                        help="hamle başına süre (saniye, 0: sınırsız)")
+    parser.add_argument("-d", "--depth", type=int, default=None,
+                        help="en fazla arama derinliği")
+    parser.add_argument("--max-plies", type=int, default=300)
+    parser.add_argument("--random-plies", type=int, default=2,
+                        help="oyun başındaki rastgele hamle sayısı")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run_selfplay(args.engine_a, args.engine_b, args.games, args.output, args.workers,
+                 args.time or None, args.depth, args.max_plies, args.random_plies, args.seed)
@@ -0,0 +1,145 @@
+import os
+from collections import OrderedDict
+
+import chess
+import chess.polyglot
+import chess.syzygy
+
+# Tablo dizini: SYZYGY_PATH ortam değişkeni, yoksa modülün yanındaki syzygy klasörü
+SYZYGY_PATH = os.environ.get("SYZYGY_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "syzygy")
+
+# Tablodan bilinen galibiyet skoru mattan bu kadar küçük tutulur
+TB_WIN_MARGIN = 1000
+
+# Önbellekte bulunmayan değer işareti (None da geçerli bir sonuçtur)
+_MISSING = object()
+
+
+class Tablebase:
+    """Yerel Syzygy WDL/DTZ tablolarını yoklayan, sonuçları LRU ile saklayan sarmalayıcı
+
+    Dizin yoksa, tablo bulunamazsa veya pozisyonun tablosu eksikse yoklamalar
+    None döndürür ve arama normal şekilde devam eder.
+    """
+
+    def __init__(self, path=None, cache_size=1 << 16):
+        self.path = path or SYZYGY_PATH
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.tables = None
+        self.max_pieces = 0
+        self.probes = 0
+        self.hits = 0
+        self.cache_hits = 0
+        if os.path.isdir(self.path):
+            self._open()
+
+    def _open(self):
+        """Dizindeki tabloları kaydet; en büyük taş sayısını dosya adlarından bul"""
+        try:
+            tables = chess.syzygy.Tablebase()
+            if not tables.add_directory(self.path):
+                return
+        except OSError:
+            return
+        for filename in os.listdir(self.path):
+            name, extension = os.path.splitext(filename)
+            if extension == ".rtbw":
+                self.max_pieces = max(self.max_pieces, len(name) - 1)  # "v" harfi sayılmaz
+        self.tables = tables
+
+    def available(self, board):
+        """Pozisyon taş sayısı ve rok hakları bakımından yoklanabilir mi?"""
+        return (self.tables is not None and not board.castling_rights and
+                chess.popcount(board.occupied) <= self.max_pieces)
+
+    def probe_wdl(self, board, key=None):
+        """Sırası gelen taraf için kazanç/beraberlik/kayıp (-2..2) veya None"""
+        if not self.available(board):
+            return None
+        if key is None:
+            key = chess.polyglot.zobrist_hash(board)
+        self.probes += 1
+        cached = self.cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+
+        wdl = self.tables.get_wdl(board)
+        if wdl is not None:
+            self.hits += 1
+        self.cache[key] = wdl
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return wdl
+
+    def score(self, board, mate_score, key=None):
+        """WDL sonucunu arama skoruna çevir (sırası gelen taraf açısından) veya None
+
+        50 hamle kuralıyla berabere kalan galibiyet/yenilgiler (±1) beraberlik sayılır.
+        """
+        wdl = self.probe_wdl(board, key)
+        if wdl is None:
+            return None
+        if wdl == 2:
+            return mate_score - TB_WIN_MARGIN
+        if wdl == -2:
+            return -(mate_score - TB_WIN_MARGIN)
+        return 0
+
+    def root_move(self, board):
+        """Kökte tablodan en iyi hamleyi seç; tablolar eksikse None
+
+        Kazanılan pozisyonda sonucu koruyan ve sıfırlamaya (DTZ) en yakın
+        hamle, kaybedilen pozisyonda sonucu en çok geciktiren hamle seçilir.
+        """
+        if not self.available(board):
+            return None
+        best_move = None
+        best_rank = None
+        for move in board.legal_moves:
+            zeroing = board.is_zeroing(move)
+            board.push(move)
+            if board.is_checkmate():
+                board.pop()
+                return move
+            wdl = self.probe_wdl(board)
+            dtz = self.tables.get_dtz(board) if wdl is not None else None
+            board.pop()
+            if wdl is None:
+                return None
+
+            result = -wdl
+            distance = abs(dtz) if dtz is not None else 0
+            if result > 0:
+                rank = (result, zeroing, -distance)
+            elif result < 0:
+                rank = (result, not zeroing, distance)
+            else:
+                rank = (result, False, 0)
+            if best_rank is None or rank > best_rank:
+                best_rank = rank
+                best_move = move
+        return best_move
+
+    def stats(self):
+        """Sayaçları sözlük olarak döndür"""
+        return {
+            'probes': self.probes,
+            'hits': self.hits,
+            'cache_hits': self.cache_hits,
+            'cached': len(self.cache)
+        }
+
+    def clear(self):
+        """Önbelleği ve sayaçları sıfırla"""
+        self.cache.clear()
+        self.probes = self.hits = self.cache_hits = 0
+
+    def close(self):
+        """Açık tablo dosyalarını kapat"""
+        if self.tables is not None:
+            self.tables.close()
+            self.tables = None
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modüller birbirini düz adla içe aktarır (from engine import ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
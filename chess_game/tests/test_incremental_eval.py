@@ -0,0 +1,101 @@
+import random
+
+import chess
+import pytest
+
+from advanced_ai import AdvancedChessAI
+from chess_ai import ChessAI
+from evaluators import AdvancedEvaluator, PSTEvaluator, ThreatEvaluator
+from incremental_eval import IncrementalEvaluator
+from threat_ai import ThreatChessAI
+
+EVALUATORS = [PSTEvaluator, AdvancedEvaluator, ThreatEvaluator]
+
+
+class SquareIndexEvaluator:
+    """Her karesi farklı değerli tablolar; rok gibi gerçek tablolarda skoru
+    değiştirmeyen hamlelerin farkı da sınanır"""
+
+    def __init__(self):
+        self.piece_values = PSTEvaluator().piece_values
+        self.tables = {piece_type: [square * 7 % 64 for square in chess.SQUARES]
+                       for piece_type in chess.PIECE_TYPES}
+
+# Rok, geçerken alma ve terfinin erken görüldüğü başlangıç pozisyonları
+START_FENS = [
+    chess.STARTING_FEN,
+    "r3k2r/pPppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/P1PBBPPP/R3K2R w KQkq - 0 1",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+    "8/2P5/8/3pP3/8/8/5p2/K6k w - d6 0 1",
+]
+
+
+def random_moves(board, rng, plies):
+    """Tahtada en fazla plies rastgele yasal hamle üret (tahta değişmez)"""
+    board = board.copy()
+    moves = []
+    for _ in range(plies):
+        legal = list(board.legal_moves)
+        if not legal:
+            break
+        move = rng.choice(legal)
+        moves.append(move)
+        board.push(move)
+    return moves
+
+
+@pytest.mark.parametrize("evaluator_class", EVALUATORS + [SquareIndexEvaluator])
+@pytest.mark.parametrize("fen", START_FENS)
+def test_incremental_score_matches_recomputation(evaluator_class, fen):
+    evaluator = evaluator_class()
+    material = IncrementalEvaluator(evaluator.piece_values, evaluator.tables)
+    rng = random.Random(fen)
+    for _ in range(20):
+        board = chess.Board(fen)
+        material.reset(board)
+        scores = [material.score]
+        for move in random_moves(board, rng, 120):
+            material.push(board, move)
+            board.push(move)
+            assert material.score == pytest.approx(material.compute(board), abs=1e-6)
+            scores.append(material.score)
+        # Geri alırken her adımda yeniden hesaplanan skora dönülmeli
+        while board.move_stack:
+            board.pop()
+            material.pop()
+            assert material.score == pytest.approx(material.compute(board), abs=1e-6)
+            assert material.score == pytest.approx(scores[len(board.move_stack)], abs=1e-6)
+
+
+@pytest.mark.parametrize("evaluator_class", EVALUATORS)
+def test_null_move_leaves_score_unchanged(evaluator_class):
+    evaluator = evaluator_class()
+    material = IncrementalEvaluator(evaluator.piece_values, evaluator.tables)
+    board = chess.Board(START_FENS[1])
+    material.reset(board)
+    before = material.score
+    material.push(board, chess.Move.null())
+    board.push(chess.Move.null())
+    assert material.score == before
+    assert material.score == pytest.approx(material.compute(board), abs=1e-6)
+
+
+@pytest.mark.parametrize("engine_class", [ChessAI, AdvancedChessAI, ThreatChessAI])
+@pytest.mark.parametrize("fen", START_FENS + ["4k3/8/8/8/8/8/8/Q3K3 w - - 0 1"])
+def test_fresh_engine_evaluates_from_board(engine_class, fen):
+    # Hiç arama yapmamış motor da materyali tahtadan hesaplamalı
+    board = chess.Board(fen)
+    fresh = engine_class()
+    assert fresh.material.current(board) == pytest.approx(fresh.material.compute(board), abs=1e-6)
+    synced = engine_class()
+    synced.material.reset(board)
+    assert fresh._evaluate_position(board) == pytest.approx(synced._evaluate_position(board),
+                                                            abs=1e-6)
+
+
+def test_other_board_with_same_ply_is_recomputed():
+    evaluator = PSTEvaluator()
+    material = IncrementalEvaluator(evaluator.piece_values, evaluator.tables)
+    material.reset(chess.Board())
+    board = chess.Board("4k3/8/8/8/8/8/8/Q3K3 w - - 0 1")
+    assert material.current(board) == pytest.approx(material.compute(board), abs=1e-6)
@@ -0,0 +1,38 @@
+import random
+
+import chess
+import pytest
+
+from move_ordering import gives_check
+
+# Açık şah (fil b2, at d4'ten çekilince), rokla kale şahı, geçerken almayla açık şah
+SPECIAL = [
+    ("8/6k1/8/8/3N4/8/1B6/4K3 w - - 0 1", "d4c6"),
+    ("5k2/8/8/8/8/8/8/4K2R w K - 0 1", "e1g1"),
+    ("8/8/8/K2pP2k/8/8/8/8 w - d6 0 1", None),
+    ("8/8/8/8/K2pP2r/8/8/7k b - e3 0 1", "d4e3"),
+    ("8/8/8/8/8/8/R1K1k3/8 w - - 0 1", "c2b3"),
+]
+
+
+@pytest.mark.parametrize("fen, check_move", SPECIAL)
+def test_gives_check_special_moves(fen, check_move):
+    board = chess.Board(fen)
+    for move in board.legal_moves:
+        assert gives_check(board, move) == board.gives_check(move), move.uci()
+    if check_move is not None:
+        assert gives_check(board, chess.Move.from_uci(check_move))
+
+
+def test_gives_check_matches_board_in_random_games():
+    rng = random.Random(6)
+    for _ in range(40):
+        board = chess.Board()
+        for _ in range(150):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            for move in moves:
+                assert gives_check(board, move) == board.gives_check(move), \
+                    (board.fen(), move.uci())
+            board.push(rng.choice(moves))
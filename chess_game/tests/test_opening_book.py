@@ -0,0 +1,17 @@
+import random
+
+import chess
+import chess.polyglot
+
+from opening_book import ENTRY_STRUCT, OpeningBook, encode_move
+
+
+def test_choose_skips_illegal_entries():
+    # Ağır basan yasal olmayan kayıt (e2e5) kitaptan çıkmaya yol açmamalı
+    board = chess.Board()
+    key = chess.polyglot.zobrist_hash(board)
+    illegal = chess.E5 | (chess.E2 << 6)
+    book = OpeningBook(ENTRY_STRUCT.pack(key, encode_move(board, chess.Move.from_uci("d2d4")), 1, 0) +
+                       ENTRY_STRUCT.pack(key, illegal, 1000, 0))
+    rng = random.Random(13)
+    assert {book.choose(board, rng) for _ in range(20)} == {chess.Move.from_uci("d2d4")}
@@ -0,0 +1,57 @@
+import threading
+import time
+
+import chess
+import pytest
+
+from advanced_ai import AdvancedChessAI
+from bench import BENCH_POSITIONS
+from search import SearchClock
+
+MIDDLEGAME = BENCH_POSITIONS["middlegame"]
+
+# Süre sınırı ve durdurma sonrası dönüşte izin verilen gecikme (saniye)
+STOP_SLACK = 0.3
+
+
+@pytest.fixture
+def parallel_engine():
+    engines = []
+
+    def create(workers=2, **kwargs):
+        engine = AdvancedChessAI(workers=workers, **kwargs)
+        engines.append(engine)
+        return engine
+    yield create
+    for engine in engines:
+        engine.close()
+
+
+@pytest.mark.parametrize("selective", [False, True], ids=["full", "selective"])
+def test_parallel_search_matches_serial(parallel_engine, selective):
+    for fen in BENCH_POSITIONS.values():
+        serial = AdvancedChessAI(deterministic=True, null_move=selective, lmr=selective)
+        parallel = parallel_engine(deterministic=True, null_move=selective, lmr=selective)
+        expected = serial._get_calculated_move(chess.Board(fen), max_depth=4)
+        assert parallel._get_calculated_move(chess.Board(fen), max_depth=4) == expected
+
+
+def test_parallel_search_respects_time_limit(parallel_engine):
+    # Kuyrukta bekleyen görevler kendi başlangıçlarından itibaren süre almamalı
+    engine = parallel_engine()
+    start = time.perf_counter()
+    move = engine._get_calculated_move(chess.Board(MIDDLEGAME), time_limit=2.0, max_depth=64)
+    assert move is not None
+    assert time.perf_counter() - start < 2.0 + STOP_SLACK
+
+
+def test_parallel_search_stops_running_workers(parallel_engine):
+    engine = parallel_engine(workers=4)
+    clock = SearchClock()
+    timer = threading.Timer(2.0, clock.stop)
+    timer.start()
+    start = time.perf_counter()
+    move = engine._get_calculated_move(chess.Board(MIDDLEGAME), max_depth=64, clock=clock)
+    timer.join()
+    assert move is not None
+    assert time.perf_counter() - start < 2.0 + STOP_SLACK
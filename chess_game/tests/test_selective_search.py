@@ -0,0 +1,95 @@
+import chess
+import pytest
+
+from advanced_ai import AdvancedChessAI
+from engines import create_engine
+
+SEARCH_DEPTH = 5
+
+# Tam genişlikli aramanın (null hamle ve LMR kapalı) 5 katta her kök hamlesine
+# verdiği değere göre en iyiden en fazla 1 santipiyon geride kalan hamleler.
+# Yeniden üretmek için: python -m tests.test_selective_search
+REFERENCE = [
+    ("italian_b", "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3",
+     ["f8d6"]),
+    ("opening", chess.STARTING_FEN, ["e2e4", "d2d4"]),
+    ("italian", "r1bqk1nr/pppp1ppp/2n5/2b1p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+     ["e1g1"]),
+    ("middlegame", "r2q1rk1/pp2bppp/2n1pn2/2pp4/3P1B2/2PBPN2/PP1N1PPP/R2QK2R w KQ - 0 9",
+     ["e1g1"]),
+    ("tactical", "r1b1k2r/ppppnppp/2n2q2/2b5/3NP3/2P1B3/PP3PPP/RN1QKB1R w KQkq - 1 7",
+     ["b2b4"]),
+    ("endgame", "8/5pk1/6p1/3R4/5P2/1r4P1/6K1/8 w - - 0 40",
+     ["g2f2", "g3g4", "d5d6", "d5e5", "g2h3", "d5c5", "d5a5"]),
+    ("sicilian", "rnbqkbnr/pp1ppppp/8/2p5/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2",
+     ["d7d5", "g8f6"]),
+    ("qgd", "rnbqkb1r/ppp2ppp/4pn2/3p4/2PP4/2N5/PP2PPPP/R1BQKBNR w KQkq - 2 4", ["c4d5"]),
+    ("french", "rnbqkbnr/ppp2ppp/4p3/3pP3/3P4/8/PPP2PPP/RNBQKBNR b KQkq - 0 3", ["f7f6"]),
+    ("ruy", "r1bqkbnr/1ppp1ppp/p1n5/1B2p3/4P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 0 4", ["b5c6"]),
+    ("kid", "rnbq1rk1/ppp1ppbp/3p1np1/8/2PPP3/2N2N2/PP3PPP/R1BQKB1R w KQ - 0 6", ["f1d3"]),
+    ("rook_end", "8/8/3k4/3p4/3K4/4R3/8/6r1 w - - 0 1",
+     ["d4c3", "e3e8", "e3g3", "e3e2", "d4d3"]),
+]
+
+# Win at Chess konumlarından tam genişlikli aramanın 5 katta çözdükleri
+TACTICS = [
+    ("2rr3k/pp3pp1/1nnqbN1p/3pN3/2pP4/2P3Q1/PPB4P/R4RK1 w - - 0 1", "Qg6"),
+    ("5rk1/1ppb3p/p1pb4/6q1/3P1p1r/2P1R2P/PP1BQ1P1/5RKN w - - 0 1", "Rg3"),
+    ("r1bq2rk/pp3pbp/2p1p1pQ/7P/3P4/2PB1N2/PP3PPR/2KR4 w - - 0 1", "Qxh7+"),
+    ("5k2/6pp/p1qN4/1p1p4/3P4/2PKP2Q/PP3r2/3R4 b - - 0 1", "Qc4+"),
+    ("7k/p7/1R5K/6r1/6p1/6P1/8/8 w - - 0 1", "Rb7"),
+    ("rnbqkb1r/pppp1ppp/8/4P3/6n1/7P/PPPNPPP1/R1BQKBNR b KQkq - 0 1", "Ne3"),
+    ("3q1rk1/p4pp1/2pb3p/3p4/6Pr/1PNQ4/P1PB1PP1/4RRK1 b - - 0 1", "Bh2+"),
+    ("2br2k1/2q3rn/p2NppQ1/2p1P3/Pp5R/4P3/1P3PPP/3R2K1 w - - 0 1", "Rxh7"),
+]
+
+
+def selective_move(fen, null_move=True, lmr=True):
+    engine = AdvancedChessAI(null_move=null_move, lmr=lmr)
+    board = chess.Board(fen)
+    return board, engine._get_calculated_move(board, max_depth=SEARCH_DEPTH)
+
+
+@pytest.mark.parametrize("name, fen, moves", REFERENCE, ids=[row[0] for row in REFERENCE])
+def test_selective_search_keeps_full_width_choice(name, fen, moves):
+    _, move = selective_move(fen)
+    assert move.uci() in moves
+
+
+@pytest.mark.parametrize("fen, best", TACTICS)
+def test_selective_search_solves_tactics(fen, best):
+    board, move = selective_move(fen)
+    assert board.san(move) == best
+
+
+def test_hard_engine_is_selective():
+    engine = create_engine("hard")
+    assert engine.null_move and engine.lmr
+    full = create_engine("hard-full")
+    assert not (full.null_move or full.lmr)
+
+
+def full_width_scores(fen, depth=SEARCH_DEPTH):
+    """Her kök hamlesinin tam genişlikli aramadaki değeri (sırası gelen taraf açısından)"""
+    board = chess.Board(fen)
+    scores = {}
+    for move in list(board.legal_moves):
+        engine = AdvancedChessAI(null_move=False, lmr=False)
+        board.push(move)
+        if board.is_game_over():
+            scores[move.uci()] = -engine._evaluate_position(board)
+        else:
+            engine._get_calculated_move(board, max_depth=depth - 1)
+            scores[move.uci()] = -engine.stats.iterations[-1]["score"]
+        board.pop()
+    return scores
+
+
+if __name__ == "__main__":
+    # Referans hamleleri yeniden hesapla (birkaç dakika sürer)
+    for name, fen, _ in REFERENCE:
+        scores = full_width_scores(fen)
+        best = max(scores.values())
+        moves = sorted((move for move, score in scores.items() if score >= best - 1),
+                       key=lambda move: -scores[move])
+        print(f"{name}: {moves} ({best:.1f})")
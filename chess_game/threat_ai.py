@@ -0,0 +1,19 @@
+import chess
+from engine import SearchEngine
+from evaluators import ThreatEvaluator
+
+class ThreatChessAI(SearchEngine):
+    """Tehdit değerlendiricili motor (arayüzün eski yerleşik araması)"""
+
+    def __init__(self, workers=1, deterministic=False, tablebase_path=None):
+        super().__init__(ThreatEvaluator(), 5, workers, deterministic, tablebase_path)
+
+    def search_depth(self, board):
+        """Oyun fazına göre derinliği ayarla"""
+        total_pieces = chess.popcount(board.occupied)
+        if total_pieces <= 10:  # Son oyun
+            return 5
+        elif total_pieces <= 20:  # Orta oyun
+            return 4
+        else:  # Açılış
+            return 3
@@ -0,0 +1,101 @@
+import chess
+import chess.polyglot
+
+# Kayıt türleri (skorun arama penceresine göre anlamı)
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionTable:
+    """Zobrist anahtarlı, boyutu sınırlı transpozisyon tablosu"""
+
+    def __init__(self, size=1 << 18):
+        # Boyutu ikinin kuvvetine yuvarla, indeks maske ile alınır
+        bits = max(1, (size - 1).bit_length())
+        self.size = 1 << bits
+        self.mask = self.size - 1
+        self.entries = [None] * self.size
+        self.age = 0
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def key(self, board):
+        """Pozisyonun Zobrist anahtarı"""
+        return chess.polyglot.zobrist_hash(board)
+
+    def new_search(self):
+        """Yeni arama başladığında eski kayıtları yaşlandır"""
+        self.age += 1
+
+    def probe(self, key, depth, alpha, beta):
+        """Kaydı sorgula, (kullanılabilir skor veya None, en iyi hamle) döndür"""
+        self.probes += 1
+        entry = self.entries[key & self.mask]
+        if entry is None or entry[0] != key:
+            return None, None
+
+        self.hits += 1
+        _, entry_depth, flag, score, move, _ = entry
+        if entry_depth >= depth:
+            if (flag == EXACT or
+                    (flag == LOWER_BOUND and score >= beta) or
+                    (flag == UPPER_BOUND and score <= alpha)):
+                self.cutoffs += 1
+                return score, move
+        return None, move
+
+    def best_move(self, key):
+        """Pozisyonun kayıtlı en iyi hamlesi (sayaçları etkilemez)"""
+        entry = self.entries[key & self.mask]
+        if entry is None or entry[0] != key:
+            return None
+        return entry[4]
+
+    def store(self, key, depth, flag, score, move):
+        """Kaydı yaz; aynı yaştaki daha derin kayıtlar korunur"""
+        index = key & self.mask
+        old = self.entries[index]
+        if old is not None and old[0] != key:
+            if old[5] == self.age and old[1] > depth:
+                return
+            self.overwrites += 1
+        elif old is not None and move is None:
+            # Aynı pozisyonun bilinen en iyi hamlesini kaybetme
+            move = old[4]
+        self.entries[index] = (key, depth, flag, score, move, self.age)
+        self.stores += 1
+
+    def clear(self):
+        """Tabloyu ve sayaçları sıfırla"""
+        self.entries = [None] * self.size
+        self.age = 0
+        self.probes = self.hits = self.cutoffs = 0
+        self.stores = self.overwrites = 0
+
+    def hit_rate(self):
+        """Sorguların yüzde kaçında kayıt bulundu"""
+        return self.hits / self.probes if self.probes else 0.0
+
+    def stats(self):
+        """Sayaçları sözlük olarak döndür"""
+        return {
+            'probes': self.probes,
+            'hits': self.hits,
+            'cutoffs': self.cutoffs,
+            'stores': self.stores,
+            'overwrites': self.overwrites,
+            'hit_rate': self.hit_rate()
+        }
+
+
+def bound_flag(score, alpha_orig, beta):
+    """Arama sonucunun kayıt türünü belirle"""
+    if score <= alpha_orig:
+        return UPPER_BOUND
+    if score >= beta:
+        return LOWER_BOUND
+    return EXACT
@@ -0,0 +1,270 @@
+import argparse
+import sys
+import threading
+
+import chess
+
+from engines import ENGINES, create_engine
+from search import SearchClock
+
+# Süre sınırlı aramalarda motorun kendi derinlik sınırı yerine kullanılan sınır
+MAX_DEPTH = 64
+
+# Kalan hamle sayısı bilinmiyorsa süre bu kadar hamleye bölünür
+DEFAULT_MOVES_TO_GO = 30
+
+# İletişim ve iş parçacığı gecikmeleri için her hamleden ayrılan süre (saniye)
+MOVE_OVERHEAD = 0.05
+
+# Bir hamleye kalan sürenin en fazla bu oranı harcanır
+MAX_TIME_FRACTION = 0.5
+
+# Süre ne kadar az kalırsa kalsın hamle başına tanınan en kısa süre
+MIN_MOVE_TIME = 0.01
+
+# go komutunun sayı alan parametreleri
+GO_PARAMETERS = ("depth", "movetime", "wtime", "btime", "winc", "binc", "movestogo", "nodes")
+
+
+def parse_go(tokens):
+    """go komutunun parametrelerini sözlüğe çevir"""
+    limits = {"infinite": False, "ponder": False}
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token in ("infinite", "ponder"):
+            limits[token] = True
+        elif token in GO_PARAMETERS and index + 1 < len(tokens):
+            try:
+                limits[token] = int(tokens[index + 1])
+            except ValueError:
+                pass
+            index += 1
+        index += 1
+    return limits
+
+
+def allocate_time(limits, turn):
+    """Hamle için düşünme süresini (saniye) hesapla; süre sınırı yoksa None"""
+    if "movetime" in limits:
+        return max(MIN_MOVE_TIME, limits["movetime"] / 1000 - MOVE_OVERHEAD)
+    remaining = limits.get("wtime" if turn == chess.WHITE else "btime")
+    if remaining is None:
+        return None
+    remaining /= 1000
+    increment = limits.get("winc" if turn == chess.WHITE else "binc", 0) / 1000
+    moves_to_go = limits.get("movestogo") or DEFAULT_MOVES_TO_GO
+    budget = remaining / moves_to_go + increment * 0.75
+    budget = min(budget, remaining * MAX_TIME_FRACTION) - MOVE_OVERHEAD
+    return max(MIN_MOVE_TIME, budget)
+
+
+def format_score(score, pv, mate_score):
+    """Arama skorunu UCI biçimine çevir (mat skoru mate N olarak)"""
+    if abs(score) >= mate_score:
+        moves = (len(pv) + 1) // 2
+        return f"mate {moves if score > 0 else -moves}"
+    return f"cp {int(round(score))}"
+
+
+class UCIAdapter:
+    """Motorları UCI protokolüyle dışarıya açan ön yüz
+
+    Komutlar ana iş parçacığında okunur; go araması arka plan iş parçacığında
+    çalışır, böylece stop ve ponderhit arama sürerken hemen işlenir. Her
+    tamamlanan iterasyonda info satırı yazılır.
+    """
+
+    def __init__(self, engine_name="hard", output=None):
+        self.output = output or sys.stdout
+        self.output_lock = threading.Lock()
+        self.engine_name = engine_name
+        self.engine = None
+        self.board = chess.Board()
+        self.thread = None
+        self.clock = None
+        self.limits = None
+        self.last_pv = []
+        # infinite/ponder aramalarında bestmove, stop veya ponderhit gelene kadar bekler
+        self.release = threading.Event()
+        self._create_engine()
+
+    def _create_engine(self):
+        """Seçili motoru (yeniden) oluştur"""
+        if self.engine is not None:
+            self.engine.close()
+        self.engine = create_engine(self.engine_name)
+        self.engine.on_iteration = self._send_info
+
+    def send(self, line):
+        """Satırı GUI'ye yaz (iş parçacıkları arasında sıralı)"""
+        with self.output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def run(self, input_stream=None):
+        """Girdi bitene veya quit gelene kadar komutları işle"""
+        input_stream = input_stream or sys.stdin
+        for line in input_stream:
+            if not self.handle(line):
+                break
+        self.stop()
+        self.engine.close()
+
+    def handle(self, line):
+        """Tek bir komutu işle; quit gelirse False döndür"""
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, arguments = tokens[0], tokens[1:]
+        if command == "uci":
+            self.send(f"id name Chess ({self.engine_name})")
+            self.send("id author FaruKndll")
+            self.send(f"option name Engine type combo default {self.engine_name} " +
+                      " ".join(f"var {name}" for name in sorted(ENGINES)))
+            self.send("option name Ponder type check default false")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "setoption":
+            self._set_option(arguments)
+        elif command == "ucinewgame":
+            self.stop()
+            self._create_engine()
+            self.board = chess.Board()
+        elif command == "position":
+            self.stop()
+            self._set_position(arguments)
+        elif command == "go":
+            self.stop()
+            self.go(parse_go(arguments))
+        elif command == "stop":
+            self.stop()
+        elif command == "ponderhit":
+            self.ponderhit()
+        elif command == "quit":
+            return False
+        return True
+
+    def _set_option(self, arguments):
+        """setoption name <ad> value <değer>"""
+        if "name" not in arguments:
+            return
+        name_index = arguments.index("name") + 1
+        value_index = arguments.index("value") if "value" in arguments else len(arguments)
+        name = " ".join(arguments[name_index:value_index]).lower()
+        value = " ".join(arguments[value_index + 1:])
+        if name == "engine" and value in ENGINES and value != self.engine_name:
+            self.stop()
+            self.engine_name = value
+            self._create_engine()
+
+    def _set_position(self, arguments):
+        """position [startpos | fen <FEN>] [moves <hamle> ...]"""
+        moves_index = arguments.index("moves") if "moves" in arguments else len(arguments)
+        if arguments and arguments[0] == "fen":
+            try:
+                board = chess.Board(" ".join(arguments[1:moves_index]))
+            except ValueError:
+                self.send("info string geçersiz FEN")
+                return
+        else:
+            board = chess.Board()
+        for uci in arguments[moves_index + 1:]:
+            try:
+                board.push_uci(uci)
+            except ValueError:
+                self.send(f"info string geçersiz hamle: {uci}")
+                break
+        self.board = board
+
+    def go(self, limits):
+        """Aramayı arka plan iş parçacığında başlat"""
+        time_limit = allocate_time(limits, self.board.turn)
+        if "depth" in limits:
+            max_depth = limits["depth"]
+        elif time_limit is not None or "nodes" in limits or limits["infinite"]:
+            max_depth = MAX_DEPTH
+        else:
+            max_depth = None  # Motorun kendi derinliği
+        # Ponder aramasının süresi ponderhit ile başlar
+        self.clock = SearchClock(None if limits["ponder"] else time_limit, limits.get("nodes"))
+        self.limits = dict(limits, time_limit=time_limit)
+        self.last_pv = []
+        if limits["infinite"] or limits["ponder"]:
+            self.release.clear()
+        else:
+            self.release.set()
+        self.thread = threading.Thread(target=self._search,
+                                       args=(self.board.copy(), self.clock, max_depth),
+                                       daemon=True)
+        self.thread.start()
+
+    def _search(self, board, clock, max_depth):
+        """Arka plan araması; bitince bestmove yazar"""
+        try:
+            move = self.engine.get_best_move(board, max_depth=max_depth, clock=clock)
+        except Exception as error:
+            self.send(f"info string arama hatası: {error}")
+            move = None
+        if move is None:
+            # Kitap ya da tablo hamlesi yoksa bile yasal bir hamle verilmeli
+            move = next(iter(board.legal_moves), None)
+        self.release.wait()
+        if move is None:
+            self.send("bestmove 0000")
+            return
+        ponder_move = self._ponder_move(board, move)
+        if ponder_move is not None:
+            self.send(f"bestmove {move.uci()} ponder {ponder_move.uci()}")
+        else:
+            self.send(f"bestmove {move.uci()}")
+
+    def _ponder_move(self, board, move):
+        """Ana varyanttan, yoksa tablodan rakibin beklenen cevabı"""
+        if len(self.last_pv) > 1 and self.last_pv[0] == move:
+            return self.last_pv[1]
+        board.push(move)
+        try:
+            return self.engine.ponder_move(board)
+        finally:
+            board.pop()
+
+    def _send_info(self, info):
+        """Tamamlanan iterasyonu info satırı olarak yaz"""
+        clock = self.clock
+        elapsed = clock.elapsed()
+        nodes = clock.nodes + clock.qnodes
+        nps = int(nodes / elapsed) if elapsed > 0 else 0
+        self.last_pv = info["pv"]
+        score = format_score(info["score"], info["pv"], self.engine.evaluator.MATE_SCORE)
+        pv = " ".join(move.uci() for move in info["pv"])
+        self.send(f"info depth {info['depth']} score {score} nodes {nodes} nps {nps} "
+                  f"time {int(elapsed * 1000)} pv {pv}")
+
+    def ponderhit(self):
+        """Tahmin tuttu: ponder araması normal aramaya döner ve süresi başlar"""
+        if self.thread is None or not self.limits["ponder"]:
+            return
+        time_limit = self.limits["time_limit"]
+        if time_limit is not None:
+            self.clock.set_limit(self.clock.elapsed() + time_limit)
+        self.limits["ponder"] = False
+        if not self.limits["infinite"]:
+            self.release.set()
+
+    def stop(self):
+        """Süren aramayı durdur ve bestmove yazılana kadar bekle"""
+        if self.thread is None:
+            return
+        self.clock.stop()
+        self.release.set()
+        self.thread.join()
+        self.thread = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UCI protokolüyle motor")
+    parser.add_argument("engine", nargs="?", default="hard", choices=sorted(ENGINES))
+    args = parser.parse_args()
+    UCIAdapter(args.engine).run()